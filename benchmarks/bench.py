@@ -0,0 +1,312 @@
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from model.Methods import Methods
+
+
+DEFAULT_SIZES = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+RESULTS_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+# Parámetros fijos de cada generador: g=30 da un periodo mayor que 10^8 en los congruenciales.
+MS_PARAMETERS = (5735, 1, 10)
+LC_PARAMETERS = (17, 123, 45, 30, 1, 10)
+MC_PARAMETERS = (17, 5, 30, 1, 10)
+UD_PARAMETERS = (1, 10)
+ND_PARAMETERS = (10, 0.0, 1.0)
+
+
+def build_ri_values(size):
+    """
+    Genera los Ri de entrada de las distribuciones con el método multiplicativo congruencial, sin truncar
+    para que ningún Ri quede en 0 (la normal inversa daría -inf).
+
+    Parámetros:
+        size (int): Cantidad de valores.
+
+    Retorna:
+        numpy.ndarray: Valores Ri.
+    """
+    return Methods(cache=False).execute_multiplicative_congruential(*MC_PARAMETERS, size,
+                                                                      decimals=None).get_ri_values_array()
+
+
+def write_numbers(file_format):
+    """
+    Crea el caso que escribe los Ri en el formato indicado dentro de una carpeta temporal.
+
+    Parámetros:
+        file_format (str): Formato de write_pseudo_numbers.
+
+    Retorna:
+        callable: Función del caso.
+    """
+    def write(size, inputs):
+        Methods(cache=False).write_pseudo_numbers(inputs['ri'], 'benchmark.' + file_format)
+    return write
+
+
+def first_chunk(stream):
+    """
+    Crea la medición de latencia de un generador: el tiempo hasta obtener su primer fragmento.
+
+    Parámetros:
+        stream (callable): Recibe el tamaño y retorna el generador de fragmentos.
+
+    Retorna:
+        callable: Función que mide la latencia.
+    """
+    def latency(size, inputs):
+        next(iter(stream(size)), None)
+    return latency
+
+
+# Los casos en paralelo comparten un modelo para reutilizar su pool de procesos, como lo haría una aplicación;
+# el calentamiento de run_case lo crea, así que los tiempos no incluyen el arranque de los procesos.
+PARALLEL_MODEL = Methods(cache=False)
+
+CASES = {
+    'middle_square': (
+        lambda size, inputs: Methods(cache=False).execute_middle_square(*MS_PARAMETERS, size),
+        first_chunk(lambda size: Methods(cache=False).stream_middle_square(*MS_PARAMETERS, size))),
+    'linear_congruential': (
+        lambda size, inputs: Methods(cache=False).execute_linear_congruential(*LC_PARAMETERS, size),
+        first_chunk(lambda size: Methods(cache=False).stream_linear_congruential(*LC_PARAMETERS, size))),
+    'linear_congruential_parallel': (
+        lambda size, inputs: PARALLEL_MODEL.execute_linear_congruential_parallel(*LC_PARAMETERS, size),
+        None),
+    'multiplicative_congruential': (
+        lambda size, inputs: Methods(cache=False).execute_multiplicative_congruential(*MC_PARAMETERS, size),
+        first_chunk(lambda size: Methods(cache=False).stream_multiplicative_congruential(*MC_PARAMETERS, size))),
+    'uniform_distribution': (
+        lambda size, inputs: Methods(cache=False).execute_uniform_distribution_method(*UD_PARAMETERS, inputs['ri']),
+        None),
+    'normal_distribution_exact': (
+        lambda size, inputs: Methods(cache=False).execute_normal_inv_distribution_method(
+            *ND_PARAMETERS, inputs['ri'], precision='exact'),
+        None),
+    'normal_distribution_fast': (
+        lambda size, inputs: Methods(cache=False).execute_normal_inv_distribution_method(
+            *ND_PARAMETERS, inputs['ri'], precision='fast'),
+        None),
+    'write_json': (write_numbers('json'), None),
+    'write_ndjson': (write_numbers('ndjson'), None),
+    'write_npy': (write_numbers('npy'), None),
+    'write_f64': (write_numbers('f64'), None),
+}
+# Cada caso es (función medida, medición de latencia o None); ambas reciben (tamaño, entradas).
+
+INPUT_CASES = ('uniform_distribution', 'normal_distribution', 'write_')
+
+
+def measure(function, size, inputs, repeat):
+    """
+    Mide un caso: primero los tiempos de cada repetición y después, en una corrida aparte, el pico de
+    memoria con tracemalloc (que hace más lenta la ejecución y por eso no se mezcla con los tiempos).
+
+    Parámetros:
+        function (callable): Caso a medir.
+        size (int): Cantidad de valores.
+        inputs (dict): Datos de entrada preparados.
+        repeat (int): Cantidad de repeticiones cronometradas.
+
+    Retorna:
+        dict: Tiempos en segundos y pico de memoria en bytes.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(size, inputs)
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        function(size, inputs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'times': times, 'peak_memory_bytes': peak}
+
+
+def run_case(name, size, inputs, repeat):
+    """
+    Ejecuta un caso con un tamaño y resume sus mediciones.
+
+    Parámetros:
+        name (str): Nombre del caso en CASES.
+        size (int): Cantidad de valores.
+        inputs (dict): Datos de entrada preparados.
+        repeat (int): Cantidad de repeticiones cronometradas.
+
+    Retorna:
+        dict: Resultado del caso.
+    """
+    function, latency = CASES[name]
+    function(size, inputs)  # Calentamiento: importaciones perezosas y cachés del sistema.
+    result = measure(function, size, inputs, repeat)
+    median = statistics.median(result['times'])
+    result.update({
+        'case': name,
+        'size': size,
+        'median_seconds': median,
+        'min_seconds': min(result['times']),
+        'max_seconds': max(result['times']),
+        'values_per_second': size / median if median > 0 else None,
+        'first_chunk_seconds': None,
+    })
+    if latency is not None:
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            latency(size, inputs)
+            times.append(time.perf_counter() - start)
+        result['first_chunk_seconds'] = statistics.median(times)
+    return result
+
+
+def environment():
+    """
+    Retorna:
+        dict: Datos de la máquina y del código con los que se hizo la corrida, para comparar resultados.
+    """
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def run(cases, sizes, repeat, report=print):
+    """
+    Ejecuta los casos con todos los tamaños.
+
+    Parámetros:
+        cases (list): Nombres de los casos.
+        sizes (list): Cantidades de valores.
+        repeat (int): Repeticiones cronometradas por caso.
+        report (callable): Recibe una línea de texto por cada resultado.
+
+    Retorna:
+        dict: Entorno y resultados.
+    """
+    results = []
+    original_folder = os.getcwd()
+    with tempfile.TemporaryDirectory() as folder:
+        # write_pseudo_numbers escribe en NumbersGenerated relativo a la carpeta actual.
+        os.chdir(folder)
+        try:
+            for size in sizes:
+                inputs = {}
+                if any(name.startswith(INPUT_CASES) for name in cases):
+                    inputs['ri'] = build_ri_values(size)
+                for name in cases:
+                    result = run_case(name, size, inputs, repeat)
+                    results.append(result)
+                    report(f"{name:<28} {size:>11,} {result['median_seconds']:>10.4f} s "
+                           f"{(result['values_per_second'] or 0):>14,.0f} val/s "
+                           f"{result['peak_memory_bytes'] / 2 ** 20:>9.1f} MiB")
+        finally:
+            os.chdir(original_folder)
+    return {'environment': environment(), 'repeat': repeat, 'results': results}
+
+
+def compare(current, previous_path, report=print):
+    """
+    Muestra la variación de los tiempos respecto a una corrida anterior.
+
+    Parámetros:
+        current (dict): Resultado de run.
+        previous_path (str): Archivo JSON de la corrida anterior.
+        report (callable): Recibe una línea de texto por cada caso comparable.
+    """
+    with open(previous_path) as file:
+        previous = {(result['case'], result['size']): result for result in json.load(file)['results']}
+    for result in current['results']:
+        before = previous.get((result['case'], result['size']))
+        if before is None or not before['median_seconds']:
+            continue
+        ratio = result['median_seconds'] / before['median_seconds']
+        report(f"{result['case']:<28} {result['size']:>11,} {ratio:>7.2f}x del tiempo anterior")
+
+
+def parse_sizes(value):
+    """
+    Convierte una lista separada por comas (admite notación como 1e6) en tamaños enteros.
+
+    Parámetros:
+        value (str): Texto recibido en la línea de comandos.
+
+    Retorna:
+        list: Tamaños.
+    """
+    return [int(float(size)) for size in value.split(',') if size]
+
+
+def build_parser():
+    """
+    Construye el analizador de argumentos del banco de pruebas.
+
+    Retorna:
+        argparse.ArgumentParser: Analizador de la línea de comandos.
+    """
+    parser = argparse.ArgumentParser(description="Mide el rendimiento de los generadores, las distribuciones y "
+                                                 "la escritura de archivos.")
+    parser.add_argument('--cases', default=','.join(CASES),
+                        help='Casos separados por comas. Disponibles: ' + ', '.join(CASES) + '.')
+    parser.add_argument('--sizes', type=parse_sizes, default=list(DEFAULT_SIZES),
+                        help='Tamaños separados por comas, por ejemplo 1e3,1e6,1e8.')
+    parser.add_argument('--repeat', type=int, default=3, help='Repeticiones cronometradas por caso.')
+    parser.add_argument('--output', help='Archivo JSON de resultados; por defecto benchmarks/results/<fecha>.json.')
+    parser.add_argument('--compare', help='Archivo JSON de una corrida anterior para comparar los tiempos.')
+    return parser
+
+
+def main(argv=None):
+    """
+    Punto de entrada del banco de pruebas.
+
+    Parámetros:
+        argv (list): Argumentos a usar en lugar de sys.argv.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    cases = [name for name in args.cases.split(',') if name]
+    unknown = sorted(set(cases) - set(CASES))
+    if unknown:
+        parser.error('casos desconocidos: ' + ', '.join(unknown))
+    if args.repeat < 1:
+        parser.error('--repeat debe ser al menos 1')
+
+    results = run(cases, args.sizes, args.repeat)
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_FOLDER, exist_ok=True)
+        stamp = datetime.datetime.now().strftime('%Y%m%d-%H%M%S')
+        output = os.path.join(RESULTS_FOLDER, stamp + '.json')
+    with open(output, 'w') as file:
+        json.dump(results, file, indent=2)
+    print('Resultados en', output, file=sys.stderr)
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,260 @@
+import argparse
+import json
+import logging
+import sys
+
+from model.Methods import Methods
+from model.Utils.Instrumentation import Instrumentation, JsonLinesSink, LogSink
+
+
+VALUE_COLUMNS = {'xi': 0, 'ri': 1, 'ni': 2}
+
+
+def parse_decimals(value):
+    """
+    Convierte el argumento --decimals en un entero o en None ("none" conserva la precisión completa).
+
+    Parámetros:
+        value (str): Texto recibido en la línea de comandos.
+
+    Retorna:
+        int | None: Cantidad de decimales.
+    """
+    return None if value.lower() == 'none' else int(value)
+
+
+def read_ri_values(path):
+    """
+    Lee los valores Ri de un archivo JSON generado por write_pseudo_numbers o de un texto con un número por línea.
+
+    Parámetros:
+        path (str): Ruta del archivo, o "-" para leer de la entrada estándar.
+
+    Retorna:
+        list: Valores Ri leídos.
+    """
+    if path == '-':
+        content = sys.stdin.read()
+    else:
+        with open(path) as file:
+            content = file.read()
+    if content.lstrip().startswith(('{', '[')):
+        data = json.loads(content)
+        return data['numbers'] if isinstance(data, dict) else data
+    return [float(line) for line in content.split()]
+
+
+def write_values(chunks, output, model):
+    """
+    Escribe los valores generados en un archivo de NumbersGenerated o, si no se indica, en la salida estándar.
+
+    Parámetros:
+        chunks (iterable): Fragmentos de valores a escribir.
+        output (str | None): Nombre del archivo de salida.
+        model (Methods): Modelo usado para escribir el archivo.
+    """
+    if output:
+        model.write_pseudo_numbers_stream(chunks, output)
+        return
+    with model.instrumentation.stage('write_pseudo_numbers', file_name='-', file_format='text') as stage:
+        for chunk in chunks:
+            stage.count('values_written', len(chunk))
+            if len(chunk):
+                sys.stdout.write('\n'.join(map(repr, chunk.tolist())) + '\n')
+        sys.stdout.flush()
+
+
+def write_test_results(tests):
+    """
+    Escribe en la salida estándar el resultado de las pruebas estadísticas, en JSON, y termina con
+    código 1 si alguna se rechazó.
+
+    Parámetros:
+        tests (StatisticalTests): Pruebas con los Ri acumulados.
+    """
+    results = tests.results()
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+    if not all(result['passed'] for result in results.values()):
+        sys.exit(1)
+
+
+def build_instrumentation(trace):
+    """
+    Crea la instrumentación pedida con --trace.
+
+    Parámetros:
+        trace (str | None): Archivo de registros JSON, "-" para el log de la salida de errores o None.
+
+    Retorna:
+        Instrumentation: Instrumentación, sin destinos si no se pidió.
+    """
+    if trace is None:
+        return Instrumentation()
+    if trace == '-':
+        logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stderr)
+        return Instrumentation([LogSink()])
+    return Instrumentation([JsonLinesSink(trace)])
+
+
+def build_parser():
+    """
+    Construye el analizador de argumentos con un subcomando por método.
+
+    Retorna:
+        argparse.ArgumentParser: Analizador de la línea de comandos.
+    """
+    parser = argparse.ArgumentParser(description="Generador de números pseudoaleatorios sin interfaz gráfica.")
+    commands = parser.add_subparsers(dest='method', required=True)
+
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument('--decimals', type=parse_decimals, default='5',
+                        help='Decimales a los que se truncan los valores, o "none" para la precisión completa.')
+    output.add_argument('--output', help='Archivo a escribir en NumbersGenerated; la extensión '
+                                         '(.json, .ndjson, .npy, .f64, .u32) elige el formato.')
+    output.add_argument('--trace', help='Archivo al que se agrega una línea JSON con el tiempo y los contadores de '
+                                        'cada etapa, o "-" para escribirlas como log en la salida de errores.')
+
+    generator = argparse.ArgumentParser(add_help=False, parents=[output])
+    generator.add_argument('--min', dest='min_value', type=int, required=True, help='Valor mínimo de los Ni.')
+    generator.add_argument('--max', dest='max_value', type=int, required=True, help='Valor máximo de los Ni.')
+    generator.add_argument('-n', '--iterations', type=int, required=True, help='Cantidad de números a generar.')
+    generator.add_argument('--values', choices=sorted(VALUE_COLUMNS), default='ni', help='Valores a escribir.')
+    generator.add_argument('--chunk-size', type=int, default=Methods.DEFAULT_CHUNK_SIZE,
+                           help='Cantidad de valores generados por fragmento.')
+    generator.add_argument('--test', action='store_true',
+                           help='En lugar de escribir los valores, aplica las pruebas estadísticas a los Ri y '
+                                'termina con código 1 si alguna se rechaza.')
+    generator.add_argument('--alpha', type=float, default=0.05, help='Nivel de significancia de --test.')
+
+    ms = commands.add_parser('ms', parents=[generator], help='Cuadrado medio.')
+    ms.add_argument('--seed', type=int, required=True)
+
+    lc = commands.add_parser('lc', parents=[generator], help='Lineal congruencial.')
+    lc.add_argument('--xo', type=int, required=True)
+    lc.add_argument('--k', type=int, required=True)
+    lc.add_argument('--c', type=int, required=True)
+    lc.add_argument('--g', type=int, required=True)
+
+    mc = commands.add_parser('mc', parents=[generator], help='Multiplicativo congruencial.')
+    mc.add_argument('--xo', type=int, required=True)
+    mc.add_argument('--t', type=int, required=True)
+    mc.add_argument('--g', type=int, required=True)
+
+    distribution = argparse.ArgumentParser(add_help=False, parents=[output])
+    distribution.add_argument('--ri-file', default='-', help='Archivo con los Ri, o "-" para la entrada estándar.')
+
+    ud = commands.add_parser('ud', parents=[distribution], help='Distribución uniforme.')
+    ud.add_argument('--min', dest='min_value', type=int, required=True)
+    ud.add_argument('--max', dest='max_value', type=int, required=True)
+
+    nd = commands.add_parser('nd', parents=[distribution], help='Distribución normal inversa.')
+    nd.add_argument('--mean', type=float, required=True)
+    nd.add_argument('--sd', dest='standard_deviation', type=float, required=True)
+    nd.add_argument('--intervals', type=int, default=10)
+    nd.add_argument('--precision', choices=('exact', 'fast'), default='exact',
+                    help='"fast" no necesita scipy (error relativo < 1.15e-9).')
+    nd.add_argument('--frequencies', action='store_true', help='Escribe los intervalos y frecuencias en lugar de los Ni.')
+
+    search = commands.add_parser('search', help='Busca multiplicadores con periodo completo y buena prueba espectral.')
+    search.add_argument('generator', choices=('lc', 'mc'), help='Método cuyo k (lc) o t (mc) se busca.')
+    search.add_argument('--g', type=int, required=True)
+    search.add_argument('--c', type=int, default=1, help='Incremento impar del método lineal congruencial.')
+    search.add_argument('--top', type=int, default=10, help='Cantidad de parámetros a mostrar.')
+    search.add_argument('--start', type=int, default=0, help='Menor valor de k o t del rango.')
+    search.add_argument('--stop', type=int, help='Valor siguiente al mayor del rango; por defecto todos. El rango '
+                        'no se recorre en orden sino disperso, así una búsqueda cortada ya muestreó todo el rango.')
+    search.add_argument('--dimensions', type=int, default=8, help='Dimensión máxima de la prueba espectral.')
+    search.add_argument('--min-score', type=float, default=0.0, help='Puntaje espectral mínimo, de 0 a 1.')
+    search.add_argument('--workers', type=int, help='Cantidad de procesos; por defecto la cantidad de núcleos.')
+    search.add_argument('--batch-size', type=int, default=1024, help='Candidatos por lote.')
+    search.add_argument('--seed', type=int, default=0, help='Semilla del orden disperso de los candidatos.')
+    search.add_argument('--checkpoint', help='Archivo JSON en el que se guarda el avance; si existe, la búsqueda '
+                                             'se retoma desde él.')
+    search.add_argument('--trace', help='Igual que en los generadores.')
+
+    commands.add_parser('gui', help='Abre la interfaz gráfica.')
+    return parser
+
+
+def run(args):
+    """
+    Ejecuta el método seleccionado y escribe sus valores.
+
+    Parámetros:
+        args (argparse.Namespace): Argumentos de la línea de comandos.
+    """
+    if args.method == 'gui':
+        # PyQt solo se importa si se pide la interfaz gráfica.
+        from main import main as run_gui
+        run_gui()
+        return
+
+    model = Methods(instrumentation=build_instrumentation(args.trace))
+    if args.method == 'search':
+        options = dict(top=args.top, start=args.start, stop=args.stop, dimensions=args.dimensions,
+                       min_score=args.min_score, workers=args.workers, checkpoint=args.checkpoint,
+                       batch_size=args.batch_size, seed=args.seed)
+        if args.generator == 'lc':
+            result = model.search_linear_congruential_parameters(args.g, args.c, **options)
+        else:
+            result = model.search_multiplicative_congruential_parameters(args.g, **options)
+        json.dump(result, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+        return
+    if args.method in ('ms', 'lc', 'mc'):
+        if args.method == 'ms':
+            chunks = model.stream_middle_square(args.seed, args.min_value, args.max_value, args.iterations,
+                                                args.chunk_size, args.decimals)
+        elif args.method == 'lc':
+            chunks = model.stream_linear_congruential(args.xo, args.k, args.c, args.g, args.min_value,
+                                                      args.max_value, args.iterations, args.chunk_size,
+                                                      args.decimals)
+        else:
+            chunks = model.stream_multiplicative_congruential(args.xo, args.t, args.g, args.min_value,
+                                                              args.max_value, args.iterations, args.chunk_size,
+                                                              args.decimals)
+        if args.test:
+            tests = model.stream_statistical_tests((chunk[VALUE_COLUMNS['ri']] for chunk in chunks), args.alpha)
+            write_test_results(tests)
+            return
+        column = VALUE_COLUMNS[args.values]
+        write_values((chunk[column] for chunk in chunks), args.output, model)
+        return
+
+    ri_values = read_ri_values(args.ri_file)
+    if args.method == 'ud':
+        method = model.execute_uniform_distribution_method(args.min_value, args.max_value, ri_values, args.decimals)
+    else:
+        method = model.execute_normal_inv_distribution_method(args.intervals, args.mean, args.standard_deviation,
+                                                              ri_values, args.decimals, args.precision)
+        if args.frequencies:
+            for start, frequency in zip(method.get_intervals(), method.get_frequencies()):
+                sys.stdout.write(f'{start!r}\t{frequency}\n')
+            return
+    write_values([method.get_ni_values_array()], args.output, model)
+
+
+def main(argv=None):
+    """
+    Punto de entrada de la línea de comandos.
+
+    Parámetros:
+        argv (list): Argumentos a usar en lugar de sys.argv.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if getattr(args, 'output', None):
+        # Se valida antes de generar, para no descubrir una extensión desconocida al final.
+        try:
+            Methods.resolve_file_format(args.output)
+        except ValueError as error:
+            parser.error(str(error))
+    try:
+        run(args)
+    except ValueError as error:
+        parser.error(str(error))
+
+
+if __name__ == '__main__':
+    main()
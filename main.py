@@ -3,7 +3,7 @@ import sys
 from PyQt6.QtWidgets import QApplication
 
 from model.Methods import Methods
-from presenter.Presenter import Presenter
+from presenter.Presenter import Presenter, WriteErrorBridge
 from view.MainFrame import MainFrame
 
 
@@ -14,16 +14,21 @@ def main():
     # Crea la aplicación de PyQt.
     app = QApplication(sys.argv)
 
-    # Crea la vista principal, el modelo y el presentador.
+    # Crea la vista principal, el modelo y el presentador; los errores de las escrituras en segundo plano
+    # del modelo llegan a la vista por la señal del puente.
     view = MainFrame()
-    model = Methods()
-    presenter = Presenter(view, model)
+    write_errors = WriteErrorBridge()
+    model = Methods(write_error_handler=write_errors.report)
+    presenter = Presenter(view, model, write_errors)
 
     # Inicia la ejecución de la vista principal.
     presenter.run()
 
-    # Finaliza la aplicación cuando se cierra la ventana principal.
-    sys.exit(app.exec())
+    # Finaliza la aplicación cuando se cierra la ventana principal, después de terminar las escrituras pendientes.
+    exit_code = app.exec()
+    presenter.stop_generations()
+    model.close()
+    sys.exit(exit_code)
 
 
 if __name__ == '__main__':
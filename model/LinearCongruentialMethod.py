@@ -1,14 +1,21 @@
 import numpy as np
 
+from model.Utils.Instrumentation import Instrumentation
 from model.Utils.MathUtils import MathUtils
+from model.Utils.PeriodAnalyzer import PeriodAnalyzer
+from model.Utils.ProgressReporter import ProgressReporter
+from model.Utils.ValuesArray import ValuesArray
 
 
 class LinearCongruentialMethod:
     """
     Esta clase implementa el Método de Congruencia Lineal para la generación de números pseudoaleatorios.
     """
+    BLOCK_SIZE = 100  # Cantidad de números generados a partir de cada semilla.
+    MAX_G = 62  # m = 2^g se calcula como entero de 64 bits con signo.
+    BLOCK_BATCH = 8192  # Cantidad máxima de bloques calculados a la vez por el motor vectorizado.
 
-    def __init__(self, xo, k, c, g, min_value, max_value, total_iterations):
+    def __init__(self, xo, k, c, g, min_value, max_value, total_iterations, decimals=5):
         """
         Este es el método constructor de la clase LinearCongruentialMethod.
 
@@ -20,10 +27,13 @@ class LinearCongruentialMethod:
             min_value (int): Valor mínimo para el rango de los números generados.
             max_value (int): Valor máximo para el rango de los números generados.
             total_iterations (int): Número total de iteraciones o números a generar.
+            decimals (int | None): Decimales a los que se truncan Ri y Ni; None conserva la precisión completa.
         """
-        self.ni_values = []
-        self.ri_values = []
-        self.xi_values = []
+        if g > self.MAX_G:
+            raise ValueError(f"g must be at most {self.MAX_G}: m = 2^g is computed as a 64-bit integer")
+        self.ni_values = ValuesArray.real()
+        self.ri_values = ValuesArray.real()
+        self.xi_values = ValuesArray.xi()
         self.xo = xo
         self.a = 1 + (2 * k)
         self.c = c
@@ -32,55 +42,403 @@ class LinearCongruentialMethod:
         self.min = min_value
         self.max = max_value
         self.total_iterations = total_iterations
+        self.decimals = decimals
+        self.period = None  # Longitud del ciclo de la secuencia que parte de xo
+        self.tail_length = None  # Cantidad de estados antes de entrar al ciclo
+        self.last_block = None  # (semilla, g, Xi guardados, Ri conservados) del último bloque generado
 
     def generate_numbers_tested(self):
         """
         Genera números Ri filtrados y asegura no exceder el total de iteraciones.
         Actualiza la semilla y el módulo si es necesario.
         """
+        xi_result = []
         ri_result = []
         while len(ri_result) < self.total_iterations:
             ri = self.filter_ri_numbers(self.generate_numbers_by_linear_congruential(100))
+            xi_result.extend(self.xi_values.tolist())
             ri_result.extend(ri[:self.total_iterations - len(ri_result)])  # Asegurar no exceder total_iterations
             self.xo += 100
             if self.m <= self.xo:
                 while self.m <= self.xo:
                     self.g += 1
                     self.m = np.power(2, self.g)
-        self.ri_values = ri_result
+        self.xi_values = ValuesArray.xi(xi_result)
+        self.ri_values = ValuesArray.real(ri_result)
         self.create_ni_values()
 
+    def generate_numbers_vectorized(self, executor=None, workers=1, progress=None, instrumentation=None):
+        """
+        Genera los mismos valores Xi, Ri y Ni que generate_numbers_tested, pero calculando bloques
+        completos con NumPy en lugar de iterar número por número.
+
+        Cada bloque de 100 números parte de una semilla ``xo + 100 * b`` y se obtiene en forma cerrada
+        con ``X_j = A_j * semilla + C_j (mod m)``, donde los coeficientes se calculan una sola vez
+        duplicando la recurrencia.
+
+        Parámetros:
+            executor (concurrent.futures.Executor): Ejecutor opcional para repartir los bloques entre procesos
+                (ver iter_parallel_batches).
+            workers (int): Cantidad de partes en que se reparte cada lote cuando se usa executor.
+            progress (ProgressReporter): Recibe la cantidad de Ri generados después de cada lote y permite cancelar.
+            instrumentation (Instrumentation): Recibe el tiempo de cada lote (cálculo y filtro) y del cálculo de Ni.
+        """
+        xi_blocks = []
+        ri_blocks = []
+        generated = 0
+        # Todos los bloques de un lote comparten el módulo con el que empezó el lote.
+        block_g = self.g
+        ProgressReporter.notify(progress, 0, self.total_iterations)
+        if executor is None:
+            batches = ((xi, ri[kept], kept.sum(axis=1)) for xi, ri, kept in self.iter_blocks(instrumentation))
+        else:
+            batches = self.iter_parallel_batches(executor, workers, instrumentation)
+        for xi, ri_kept, kept_per_block in batches:
+            open_cycle = self.open_cycle_mask(xi)
+            xi_blocks.append(xi[open_cycle])
+            ri_blocks.append(ri_kept)
+            generated += len(ri_kept)
+            # Con el último bloque se puede continuar la secuencia (ver Methods.execute_linear_congruential).
+            self.last_block = (self.xo - self.BLOCK_SIZE, int(block_g), int(open_cycle[-1].sum()),
+                               int(kept_per_block[-1]))
+            block_g = self.g
+            ProgressReporter.notify(progress, generated, self.total_iterations)
+
+        self.xi_values = ValuesArray.xi(np.concatenate(xi_blocks))
+        self.ri_values = ValuesArray.real(np.concatenate(ri_blocks))
+        with Instrumentation.measure(instrumentation, 'ni_mapping'):
+            self.create_ni_values()
+
+    def iter_blocks(self, instrumentation=None):
+        """
+        Recorre por lotes los bloques que generate_numbers_tested alcanzaría a generar, avanzando la semilla.
+
+        Parámetros:
+            instrumentation (Instrumentation): Recibe el tiempo del cálculo y del filtro de cada lote.
+
+        Retorna:
+            generator: Tuplas (Xi, Ri, máscara) con una fila por bloque; la máscara marca los Ri conservados
+            y ya está recortada para no exceder total_iterations.
+        """
+        multipliers, increments = MathUtils.affine_coefficients(self.a, self.c, self.BLOCK_SIZE)
+        produced = 0
+        while produced < self.total_iterations:
+            remaining = self.total_iterations - produced
+            seeds = self.next_block_seeds(remaining)
+            with Instrumentation.measure(instrumentation, 'generation') as stage:
+                xi, ri = self.generate_blocks(seeds, multipliers, increments)
+                stage.count('values_produced', ri.size)
+            with Instrumentation.measure(instrumentation, 'filter_ri_numbers') as stage:
+                kept = self.filter_ri_blocks(ri, xi)
+                stage.count('values_filtered', kept.size - np.count_nonzero(kept))
+
+            # Solo se usan los bloques que el método escalar alcanzaría a generar.
+            kept_per_block = kept.sum(axis=1)
+            used, batch_produced = self.used_blocks(kept_per_block, remaining)
+            kept = kept[:used]
+            if kept_per_block[:used].sum() > batch_produced:
+                # Descarta los Ri sobrantes del último bloque.
+                extra = np.flatnonzero(kept[-1])[batch_produced - int(kept_per_block[:used].sum()):]
+                kept[-1, extra] = False
+            produced += batch_produced
+            self.advance_seed(used)
+            yield xi[:used], ri[:used], kept
+
+    def iter_parallel_batches(self, executor, workers, instrumentation=None):
+        """
+        Igual que iter_blocks, pero cada lote se divide en rangos consecutivos de bloques que se calculan
+        en paralelo, ya que las semillas de cada bloque solo dependen de su posición.
+
+        A los procesos solo se les envía la primera semilla y la cantidad de bloques de su rango, y solo
+        devuelven los Ri conservados y cuántos conservó cada bloque: las matrices de Xi y la máscara no
+        viajan entre procesos. Los Xi se recalculan aquí, que cuesta poco frente al truncado de los Ri.
+
+        Parámetros:
+            executor (concurrent.futures.Executor): Ejecutor con el que se calculan los rangos.
+            workers (int): Cantidad de rangos en que se divide cada lote.
+            instrumentation (Instrumentation): Recibe el tiempo de cada lote.
+
+        Retorna:
+            generator: Tuplas (Xi, Ri conservados, Ri conservados por bloque) de los bloques usados, con los
+            Ri ya recortados para no exceder total_iterations.
+        """
+        multipliers, increments = MathUtils.affine_coefficients(self.a, self.c, self.BLOCK_SIZE)
+        produced = 0
+        while produced < self.total_iterations:
+            remaining = self.total_iterations - produced
+            seeds = self.next_block_seeds(remaining, self.BLOCK_BATCH * workers)
+            parts = [part for part in np.array_split(seeds, workers) if len(part)]
+            # En paralelo el cálculo y el filtro ocurren juntos dentro de cada proceso.
+            with Instrumentation.measure(instrumentation, 'generation') as stage:
+                results = list(executor.map(LinearCongruentialMethod.compute_blocks, [self.a] * len(parts),
+                                            [self.c] * len(parts), [self.g] * len(parts),
+                                            [self.decimals] * len(parts), [int(part[0]) for part in parts],
+                                            [len(part) for part in parts]))
+                ri_kept = np.concatenate([ri for ri, _ in results])
+                kept_per_block = np.concatenate([counts for _, counts in results])
+                stage.count('values_produced', len(seeds) * self.BLOCK_SIZE)
+                stage.count('values_filtered', len(seeds) * self.BLOCK_SIZE - len(ri_kept))
+
+            used, batch_produced = self.used_blocks(kept_per_block, remaining)
+            kept_per_block = kept_per_block[:used]
+            # Los Ri sobrantes del último bloque son los últimos de los bloques usados.
+            kept_per_block[-1] -= int(kept_per_block.sum()) - batch_produced
+            xi = self.block_states(seeds[:used], multipliers, increments)
+            produced += batch_produced
+            self.advance_seed(used)
+            yield xi, ri_kept[:batch_produced], kept_per_block
+
+    @staticmethod
+    def used_blocks(kept_per_block, remaining):
+        """
+        Calcula cuántos bloques de un lote alcanzaría a generar el método escalar.
+
+        Parámetros:
+            kept_per_block (numpy.ndarray): Cantidad de Ri conservados en cada bloque del lote.
+            remaining (int): Cantidad de Ri que aún faltan por generar.
+
+        Retorna:
+            tuple: Bloques usados y Ri que aportan (a lo sumo remaining).
+        """
+        cumulative = np.cumsum(kept_per_block)
+        used = min(int(np.searchsorted(cumulative, remaining)) + 1, len(kept_per_block))
+        return used, min(int(cumulative[used - 1]), remaining)
+
+    def iter_chunks(self, chunk_size, instrumentation=None):
+        """
+        Genera la secuencia filtrada en fragmentos de tamaño fijo, con memoria constante.
+
+        A diferencia de get_xi_values_array, cada Xi entregado es el estado que produjo el Ri de la misma
+        posición. La instancia no guarda los valores; solo avanza su semilla igual que al generar.
+
+        Parámetros:
+            chunk_size (int): Cantidad de valores por fragmento (el último puede ser menor).
+            instrumentation (Instrumentation): Recibe el tiempo del cálculo, del filtro y del de Ni de cada lote.
+
+        Retorna:
+            generator: Tuplas de arreglos (Xi, Ri, Ni) de longitud chunk_size.
+        """
+        def batches():
+            for xi, ri, kept in self.iter_blocks(instrumentation):
+                ri_kept = ri[kept]
+                with Instrumentation.measure(instrumentation, 'ni_mapping'):
+                    ni = MathUtils.truncate_array(self.min + (self.max - self.min) * ri_kept, self.decimals)
+                yield xi[kept], ri_kept, ni
+
+        return MathUtils.rechunk(batches(), chunk_size)
+
+    def next_block_seeds(self, remaining, batch=BLOCK_BATCH):
+        """
+        Calcula las semillas de los siguientes bloques que comparten el módulo actual.
+
+        Parámetros:
+            remaining (int): Cantidad de números Ri que aún faltan por generar.
+            batch (int): Cantidad máxima de bloques a devolver.
+
+        Retorna:
+            numpy.ndarray: Semillas uint64 de los bloques a calcular.
+        """
+        # Cada bloque aporta como máximo BLOCK_SIZE - 1 números, así que se necesitan al menos estos bloques.
+        needed = min(-(-remaining // (self.BLOCK_SIZE - 1)), batch)
+        # El primer bloque siempre usa el módulo actual; los siguientes solo mientras la semilla sea menor que m.
+        same_modulus = max((int(self.m) - 1 - self.xo) // self.BLOCK_SIZE, 0) + 1
+        count = min(needed, same_modulus)
+        return self.xo + self.BLOCK_SIZE * np.arange(count, dtype=np.uint64)
+
+    @staticmethod
+    def compute_blocks(a, c, g, decimals, first_seed, blocks):
+        """
+        Calcula y filtra un rango de bloques sin depender de una instancia existente, para poder
+        ejecutarse en otro proceso.
+
+        Parámetros:
+            a (int): Multiplicador.
+            c (int): Incremento.
+            g (int): Exponente del módulo m = 2^g.
+            decimals (int | None): Decimales a los que se truncan los Ri.
+            first_seed (int): Semilla del primer bloque; las siguientes avanzan de a BLOCK_SIZE.
+            blocks (int): Cantidad de bloques.
+
+        Retorna:
+            tuple: Ri conservados, en orden, y arreglo con la cantidad conservada en cada bloque.
+        """
+        method = LinearCongruentialMethod(0, (a - 1) // 2, c, g, 0, 1, 0, decimals)
+        multipliers, increments = MathUtils.affine_coefficients(a, c, LinearCongruentialMethod.BLOCK_SIZE)
+        step = np.uint64(LinearCongruentialMethod.BLOCK_SIZE)
+        seeds = np.uint64(first_seed) + step * np.arange(blocks, dtype=np.uint64)
+        xi, ri = method.generate_blocks(seeds, multipliers, increments)
+        kept = method.filter_ri_blocks(ri, xi)
+        return ri[kept], kept.sum(axis=1)
+
+    def generate_blocks(self, seeds, multipliers, increments):
+        """
+        Calcula en forma cerrada un bloque de valores Xi y Ri por cada semilla.
+
+        Parámetros:
+            seeds (numpy.ndarray): Semillas de los bloques.
+            multipliers (numpy.ndarray): Coeficientes A_j del mapa afín.
+            increments (numpy.ndarray): Coeficientes C_j del mapa afín.
+
+        Retorna:
+            tuple: Matrices (bloques x BLOCK_SIZE) con los valores Xi (uint64) y Ri truncados.
+        """
+        xi = self.block_states(seeds, multipliers, increments)
+        ri = MathUtils.truncate_array(xi.astype(np.float64) / float(int(self.m) - 1), self.decimals)
+        return xi, ri
+
+    def block_states(self, seeds, multipliers, increments):
+        """
+        Calcula en forma cerrada los estados Xi de un bloque por cada semilla.
+
+        Parámetros:
+            seeds (numpy.ndarray): Semillas de los bloques.
+            multipliers (numpy.ndarray): Coeficientes A_j del mapa afín.
+            increments (numpy.ndarray): Coeficientes C_j del mapa afín.
+
+        Retorna:
+            numpy.ndarray: Matriz (bloques x BLOCK_SIZE) de estados Xi uint64.
+        """
+        mask = np.uint64(int(self.m) - 1)
+        return (multipliers[np.newaxis, :] * seeds[:, np.newaxis] + increments[np.newaxis, :]) & mask
+
+    def filter_ri_blocks(self, ri, xi):
+        """
+        Aplica a cada bloque el mismo criterio de filter_ri_numbers sobre una matriz completa.
+
+        Parámetros:
+            ri (numpy.ndarray): Matriz (bloques x BLOCK_SIZE) de números Ri truncados.
+            xi (numpy.ndarray): Matriz con los estados Xi que produjeron cada Ri.
+
+        Retorna:
+            numpy.ndarray: Máscara booleana con los números Ri que se conservan.
+        """
+        kept = self.open_cycle_mask(xi) & (ri > 0.0) & (ri < 1.0)
+        kept[:, 0] = False
+        return kept
+
+    @staticmethod
+    def open_cycle_mask(xi):
+        """
+        Marca, en cada bloque, los estados generados antes de que su ciclo se cierre.
+
+        Como ``a = 1 + 2k`` es impar, el mapa es una biyección módulo m y todos los estados generados
+        pertenecen a un ciclo puro: el primer estado repetido es siempre el primero del bloque.
+
+        Parámetros:
+            xi (numpy.ndarray): Matriz (bloques x BLOCK_SIZE) de estados Xi.
+
+        Retorna:
+            numpy.ndarray: Máscara booleana con los estados anteriores al cierre del ciclo.
+        """
+        open_cycle = np.ones(xi.shape, dtype=bool)
+        open_cycle[:, 1:] = ~np.logical_or.accumulate(xi[:, 1:] == xi[:, :1], axis=1)
+        return open_cycle
+
+    def advance_seed(self, blocks):
+        """
+        Avanza la semilla tantos bloques como se hayan generado, aumentando g cuando la semilla alcanza m.
+
+        Parámetros:
+            blocks (int): Cantidad de bloques generados.
+        """
+        self.xo += self.BLOCK_SIZE * blocks
+        if self.m <= self.xo:
+            while self.m <= self.xo:
+                self.g += 1
+                self.m = np.power(2, self.g)
 
     def generate_numbers_by_linear_congruential(self, iterations):
         """
         Genera números pseudoaleatorios Ri utilizando el método de congruencia lineal.
+        La generación se detiene en cuanto la secuencia vuelve a su primer estado, es decir,
+        cuando el ciclo se cierra y el resto de los números serían repetidos.
 
         Parámetros:
             iterations (int): Número de iteraciones para generar números Ri.
 
         Retorna:
-            list: Lista de números Ri generados.
+            ValuesArray: Arreglo de números Ri generados.
         """
         xi = self.xo
-        self.ri_values.clear()
+        xi_values = []
+        ri_values = []
         for _ in range(iterations):
             xi = (self.a * xi + self.c) % self.m
+            if xi_values and xi == xi_values[0]:
+                break
             ri = xi / (self.m - 1)
-            self.xi_values.append(MathUtils.truncate(xi))
-            self.ri_values.append(MathUtils.truncate(ri))
+            xi_values.append(int(xi))
+            ri_values.append(ri)
+        self.xi_values = ValuesArray.xi(xi_values)
+        self.ri_values = ValuesArray.real(MathUtils.truncate_array(ri_values, self.decimals))
         return self.ri_values
 
+    def detect_cycle(self, max_steps=None):
+        """
+        Calcula la longitud exacta del ciclo y de la cola de la secuencia que parte de xo.
+
+        Como el mapa es una biyección módulo m, a lo sumo el propio xo (si no es menor que m) queda
+        fuera del ciclo. El periodo lo calcula PeriodAnalyzer componiendo el mapa consigo mismo, en g
+        pasos en lugar de recorrer hasta m estados.
+
+        Parámetros:
+            max_steps (int): Periodo máximo que interesa; si el ciclo es más largo se informa None.
+
+        Retorna:
+            tuple: (tail_length, period). period es None si el ciclo es más largo que max_steps.
+        """
+        analysis = PeriodAnalyzer.analyze_linear_congruential(self.xo, (self.a - 1) // 2, self.c, self.g)
+        self.tail_length = analysis['tail_length']
+        self.period = analysis['period']
+        if max_steps is not None and self.period > max_steps:
+            self.period = None
+        return self.tail_length, self.period
+
+    def jump_ahead(self, steps):
+        """
+        Avanza la semilla ``steps`` pasos de la recurrencia ``X(n+1) = (a * X(n) + c) mod m`` en O(log steps).
+
+        Parámetros:
+            steps (int): Cantidad de pasos a avanzar.
+        """
+        jump_a, jump_c = MathUtils.affine_jump(self.a, self.c, self.m, steps)
+        self.xo = (jump_a * self.xo + jump_c) % int(self.m)
+
+    def split(self, substreams):
+        """
+        Divide la secuencia de la recurrencia en subsecuencias consecutivas que no se traslapan.
+
+        Cada instancia devuelta parte de la semilla que corresponde al inicio de su tramo, de modo que
+        ``generate_numbers_by_linear_congruential(total_iterations)`` sobre cada una reproduce, en orden,
+        el tramo correspondiente de la secuencia completa sin recalcular el prefijo.
+
+        Parámetros:
+            substreams (int): Cantidad de subsecuencias.
+
+        Retorna:
+            list: Lista de instancias de LinearCongruentialMethod, una por subsecuencia.
+        """
+        k = (self.a - 1) // 2
+        result = []
+        for start, length in MathUtils.split_lengths(self.total_iterations, substreams):
+            jump_a, jump_c = MathUtils.affine_jump(self.a, self.c, self.m, start)
+            xo = (jump_a * self.xo + jump_c) % int(self.m)
+            result.append(LinearCongruentialMethod(xo, k, self.c, self.g, self.min, self.max, length,
+                                                   self.decimals))
+        return result
+
     def create_ni_values(self):
         """
         Crea y almacena los valores Ni a partir de los valores Ri generados.
         """
-        for ri in self.ri_values:
-            ni = self.min + (self.max - self.min) * ri
-            self.ni_values.append(MathUtils.truncate(ni))
+        ni_values = self.min + (self.max - self.min) * self.ri_values
+        self.ni_values = ValuesArray.real(MathUtils.truncate_array(ni_values, self.decimals))
 
     def filter_ri_numbers(self, ri):
         """
-        Filtra los números Ri para eliminar valores repetidos, cero, uno o negativos.
+        Filtra los números Ri de un bloque: descarta el primero (que se usa como referencia del ciclo)
+        y los valores que no están en el intervalo abierto (0, 1). Los valores repetidos ya no llegan
+        aquí, porque el bloque se corta en cuanto su ciclo se cierra.
 
         Parámetros:
             ri (list): Lista de números Ri a filtrar.
@@ -88,14 +446,10 @@ class LinearCongruentialMethod:
         Retorna:
             list: Lista de números Ri filtrados.
         """
-        first = ri[0]
         result = []
         for number in ri[1:]:  # Comienza desde el segundo elemento
-            if number == first or number in {0.0, 1.0} or '-' in str(number):
-                # Detiene el bucle si encuentra una repetición del primer elemento
-                # o si el número es 0.0, 1.0 o negativo.
-                continue
-            result.append(MathUtils.truncate(number))
+            if 0.0 < number < 1.0:
+                result.append(number)
         return result
 
     def get_xi_values_array(self):
@@ -103,7 +457,7 @@ class LinearCongruentialMethod:
         Devuelve el arreglo de valores Xi generados.
 
         Retorna:
-            list: Lista de valores Xi.
+            ValuesArray: Arreglo uint64 de valores Xi.
         """
         return self.xi_values
 
@@ -112,7 +466,7 @@ class LinearCongruentialMethod:
         Devuelve el arreglo de valores Ri generados.
 
         Retorna:
-            list: Lista de valores Ri.
+            ValuesArray: Arreglo float64 de valores Ri.
         """
         return self.ri_values
 
@@ -121,6 +475,6 @@ class LinearCongruentialMethod:
         Devuelve el arreglo de valores Ni generados.
 
         Retorna:
-            list: Lista de valores Ni.
+            ValuesArray: Arreglo float64 de valores Ni.
         """
         return self.ni_values
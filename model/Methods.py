@@ -1,19 +1,73 @@
 import json
 import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 
 from model.LinearCongruentialMethod import LinearCongruentialMethod
 from model.MiddleSquareMethod import MiddleSquareMethod
 from model.MultiplicativeCongruentialMethod import MultiplicativeCongruentialMethod
 from model.NormalInvDistributionMethod import NormalInvDistributionMethod
 from model.UniformDistributionMethod import UniformDistributionMethod
+from model.Utils.BackgroundWriter import BackgroundWriter
+from model.Utils.FrequencyAccumulator import FrequencyAccumulator
+from model.Utils.Instrumentation import Instrumentation
+from model.Utils.MathUtils import MathUtils
+from model.Utils.ParameterSearch import ParameterSearch
+from model.Utils.PeriodAnalyzer import PeriodAnalyzer
+from model.Utils.ProgressReporter import ProgressReporter
+from model.Utils.ResultCache import ResultCache
+from model.Utils.SpectralTest import SpectralTest
+from model.Utils.StatisticalTests import StatisticalTests
+from model.Utils.ValuesArray import ValuesArray
+
+
+def _execute_part(method, method_name):
+    """
+    Ejecuta un método sobre una parte de la secuencia dentro de un proceso del pool.
+
+    Parámetros:
+        method: Instancia que representa un tramo de la secuencia.
+        method_name (str): Nombre del método que genera sus valores.
+
+    Retorna:
+        La misma instancia con sus valores generados.
+    """
+    getattr(method, method_name)()
+    return method
 
 
 class Methods:
     """
     Clase que encapsula la ejecución de diferentes métodos de generación de números pseudoaleatorios.
     """
+    DEFAULT_CHUNK_SIZE = 1 << 16  # Cantidad de valores por fragmento en los métodos stream_*.
+    FILE_FORMATS = ('json', 'ndjson', 'npy', 'f64', 'u32')  # Formatos de write_pseudo_numbers y read_pseudo_numbers.
+    NUMBERS_BUFFER_SIZE = 1 << 20  # Tamaño del búfer de escritura de write_pseudo_numbers_stream.
 
-    def execute_multiplicative_congruential(self, xo, t, g, min_value, max_value, iterations):
+    def __init__(self, write_error_handler=None, cache=True, instrumentation=None):
+        """
+        Inicializa el modelo.
+
+        Parámetros:
+            write_error_handler (callable): Función que recibe ``(nombre, excepción)`` cuando falla una
+                escritura en segundo plano.
+            cache (bool | ResultCache): True usa una caché en memoria con los valores por defecto, False la
+                desactiva; también se puede pasar una ResultCache, por ejemplo con nivel en disco.
+            instrumentation (Instrumentation): Recibe los tiempos y contadores de cada etapa; por defecto una
+                instrumentación sin destinos (desactivada) a la que se le pueden agregar con add_sink.
+        """
+        self.writer = BackgroundWriter(error_handler=write_error_handler)
+        if cache is True:
+            cache = ResultCache()
+        self.cache = cache or None
+        self.instrumentation = instrumentation or Instrumentation()
+        self.pools = {}  # Pools de procesos de los métodos *_parallel, por cantidad de procesos
+        self.pools_lock = threading.Lock()
+
+    def execute_multiplicative_congruential(self, xo, t, g, min_value, max_value, iterations, decimals=5,
+                                            progress=None):
         """
         Ejecuta el método multiplicativo congruencial.
 
@@ -24,15 +78,50 @@ class Methods:
             min_value (int): Valor mínimo para el rango de los números generados.
             max_value (int): Valor máximo para el rango de los números generados.
             iterations (int): Número de iteraciones o números a generar.
+            decimals (int | None): Decimales a los que se truncan los valores; None conserva la precisión completa.
+            progress (ProgressReporter): Recibe el avance de la generación y permite cancelarla.
 
         Retorna:
-            MultiplicativeCongruentialMethod: Instancia del método con los números generados.
+            MultiplicativeCongruentialMethod: Instancia del método con los números generados. Con la caché activa sus
+            arreglos son de solo lectura, porque la caché guarda los mismos sin copiarlos.
         """
-        mc = MultiplicativeCongruentialMethod(xo, t, g, min_value, max_value, iterations)
-        mc.execute()
-        return mc
+        with self.instrumentation.stage('execute_multiplicative_congruential') as stage:
+            mc = MultiplicativeCongruentialMethod(xo, t, g, min_value, max_value, iterations, decimals)
+            key = ('multiplicative_congruential', xo, t, g, min_value, max_value, decimals)
+            cached = self.cache.longest(key) if self.cache is not None else None
+            if cached is not None and cached[0] < iterations and cached[0] < 1:
+                # Una corrida sin iteraciones no tiene un Xi desde el cual continuar.
+                cached = None
+            if cached is None:
+                mc.execute(progress, self.instrumentation)
+            elif cached[0] >= iterations:
+                # Una corrida más larga con los mismos parámetros ya contiene la secuencia pedida.
+                _, arrays, _ = cached
+                mc.xi_values = ValuesArray.xi(arrays['xi'][:max(iterations, 1)])
+                mc.ri_values = ValuesArray.real(arrays['ri'][:iterations])
+                mc.ni_values = ValuesArray.real(arrays['ni'][:iterations])
+                ProgressReporter.notify(progress, 1, 1)
+                stage.count('cache_hits')
+                stage.count('values_produced', len(mc.ni_values))
+                return mc
+            else:
+                # Se continúa la secuencia guardada desde su último Xi en lugar de empezar de nuevo.
+                length, arrays, _ = cached
+                arrays = {name: values[:length] for name, values in arrays.items()}
+                rest = MultiplicativeCongruentialMethod(int(arrays['xi'][-1]), t, g, min_value, max_value,
+                                                        iterations - length, decimals)
+                rest.execute(progress, self.instrumentation)
+                mc.xi_values = ValuesArray.xi(np.concatenate((arrays['xi'], rest.xi_values)))
+                mc.ri_values = ValuesArray.real(np.concatenate((arrays['ri'], rest.ri_values)))
+                mc.ni_values = ValuesArray.real(np.concatenate((arrays['ni'], rest.ni_values)))
+            if self.cache is not None:
+                # La caché marca los arreglos de la instancia como de solo lectura, igual que los que entrega.
+                self.cache.put(key, iterations, {'xi': mc.xi_values, 'ri': mc.ri_values, 'ni': mc.ni_values})
+            stage.count('values_produced', len(mc.ni_values))
+            return mc
 
-    def execute_middle_square(self, seed, min_value, max_value, iterations):
+    def execute_middle_square(self, seed, min_value, max_value, iterations, decimals=5, on_cycle='continue',
+                              progress=None):
         """
         Ejecuta el método del cuadrado medio.
 
@@ -41,15 +130,61 @@ class Methods:
             min_value (int): Valor mínimo para el rango de los números generados.
             max_value (int): Valor máximo para el rango de los números generados.
             iterations (int): Número de iteraciones o números a generar.
+            decimals (int | None): Decimales a los que se truncan los valores; None conserva la precisión completa.
+            on_cycle (str): Qué hacer cuando la secuencia cae en un ciclo ('continue', 'stop' o 'reseed').
+            progress (ProgressReporter): Recibe el avance de la generación y permite cancelarla.
 
         Retorna:
-            MiddleSquareMethod: Instancia del método con los números generados.
+            MiddleSquareMethod: Instancia del método con los números generados. Con la caché activa sus
+            arreglos son de solo lectura, porque la caché guarda los mismos sin copiarlos.
         """
-        ms = MiddleSquareMethod(seed, min_value, max_value, iterations)
-        ms.generate_randoms()
-        return ms
+        with self.instrumentation.stage('execute_middle_square') as stage:
+            ms = MiddleSquareMethod(seed, min_value, max_value, iterations, decimals)
+            key = ('middle_square', seed, min_value, max_value, decimals, on_cycle)
+            cached = self.cache.get(key, iterations) if self.cache is not None else None
+            if cached is not None:
+                arrays, attributes = cached
+                ms.xi_values = ValuesArray.xi(arrays['xi'])
+                ms.centers = ValuesArray.xi(arrays['centers'])
+                ms.ri_values = ValuesArray.real(arrays['ri'])
+                ms.ni_values = ValuesArray.real(arrays['ni'])
+                ms.period, ms.tail_length = attributes['period'], attributes['tail_length']
+                ProgressReporter.notify(progress, 1, 1)
+                stage.count('cache_hits')
+                stage.count('values_produced', len(ms.ni_values))
+                return ms
+            longest = None
+            if self.cache is not None and on_cycle == 'continue' and iterations > 0:
+                # Solo con 'continue' una corrida es prefijo de las más largas: con 'stop' y 'reseed' el
+                # resultado depende de en qué paso se detecta el ciclo.
+                longest = self.cache.longest(key)
+            if longest is not None and longest[0] > 0:
+                length, arrays, _ = longest
+                count = min(length, iterations)
+                ms.xi_values = ValuesArray.xi(arrays['xi'][:count])
+                ms.centers = ValuesArray.xi(arrays['centers'][:count])
+                ms.ri_values = ValuesArray.real(arrays['ri'][:count])
+                ms.ni_values = ValuesArray.real(arrays['ni'][:count])
+                if length >= iterations:
+                    ms.period, ms.tail_length = MiddleSquareMethod.detected_cycle(
+                        np.append(ms.xi_values, ms.centers[-1:]), iterations)
+                    ProgressReporter.notify(progress, 1, 1)
+                    stage.count('cache_hits')
+                    stage.count('values_produced', len(ms.ni_values))
+                    return ms
+                ms.num_amount = count
+                ms.extend_randoms(iterations - count, progress, self.instrumentation)
+            else:
+                ms.generate_randoms(on_cycle, progress, self.instrumentation)
+            if self.cache is not None:
+                self.cache.put(key, iterations, {'xi': ms.xi_values, 'centers': ms.centers,
+                                                 'ri': ms.ri_values, 'ni': ms.ni_values},
+                               {'period': ms.period, 'tail_length': ms.tail_length})
+            stage.count('values_produced', len(ms.ni_values))
+            return ms
 
-    def execute_linear_congruential(self, xo, k, c, g, min_value, max_value, iterations):
+    def execute_linear_congruential(self, xo, k, c, g, min_value, max_value, iterations, decimals=5,
+                                    progress=None):
         """
         Ejecuta el método lineal congruencial.
 
@@ -61,15 +196,229 @@ class Methods:
             min_value (int): Valor mínimo para el rango de los números generados.
             max_value (int): Valor máximo para el rango de los números generados.
             iterations (int): Número de iteraciones o números a generar.
+            decimals (int | None): Decimales a los que se truncan los valores; None conserva la precisión completa.
+            progress (ProgressReporter): Recibe el avance de la generación y permite cancelarla.
 
         Retorna:
-            LinearCongruentialMethod: Instancia del método con los números generados.
+            LinearCongruentialMethod: Instancia del método con los números generados. Con la caché activa sus
+            arreglos son de solo lectura, porque la caché guarda los mismos sin copiarlos.
+        """
+        with self.instrumentation.stage('execute_linear_congruential') as stage:
+            lc = LinearCongruentialMethod(xo, k, c, g, min_value, max_value, iterations, decimals)
+            key = ('linear_congruential', xo, k, c, g, min_value, max_value, decimals)
+            cached = self.cache.get(key, iterations) if self.cache is not None else None
+            if cached is not None:
+                arrays, attributes = cached
+                lc.xi_values = ValuesArray.xi(arrays['xi'])
+                lc.ri_values = ValuesArray.real(arrays['ri'])
+                lc.ni_values = ValuesArray.real(arrays['ni'])
+                # La semilla y el módulo quedan como después de generar, para que jump_ahead y split sigan igual.
+                lc.xo, lc.g = attributes['xo'], attributes['g']
+                lc.m = np.power(2, lc.g)
+                lc.period, lc.tail_length = attributes['period'], attributes['tail_length']
+                lc.last_block = tuple(attributes['last_block']) if attributes.get('last_block') else None
+                ProgressReporter.notify(progress, 1, 1)
+                stage.count('cache_hits')
+                stage.count('values_produced', len(lc.ni_values))
+                return lc
+            longest = self.cache.longest(key) if self.cache is not None else None
+            if longest is not None and 0 < longest[0] < iterations and longest[2].get('last_block'):
+                # Se continúa desde el último bloque guardado: se vuelve a generar completo (pudo quedar
+                # recortado) y el resto de los bloques se reutiliza tal cual.
+                length, arrays, attributes = longest
+                seed, block_g, xi_count, ri_count = attributes['last_block']
+                rest = LinearCongruentialMethod(seed, k, c, block_g, min_value, max_value,
+                                                iterations - length + ri_count, decimals)
+                rest.generate_numbers_vectorized(progress=progress, instrumentation=self.instrumentation)
+                lc.xi_values = ValuesArray.xi(np.concatenate((arrays['xi'][:len(arrays['xi']) - xi_count],
+                                                              rest.xi_values)))
+                lc.ri_values = ValuesArray.real(np.concatenate((arrays['ri'][:length - ri_count], rest.ri_values)))
+                lc.ni_values = ValuesArray.real(np.concatenate((arrays['ni'][:length - ri_count], rest.ni_values)))
+                lc.xo, lc.g, lc.m, lc.last_block = rest.xo, rest.g, rest.m, rest.last_block
+                lc.period, lc.tail_length = attributes['period'], attributes['tail_length']
+            else:
+                lc.generate_numbers_vectorized(progress=progress, instrumentation=self.instrumentation)
+            if self.cache is not None:
+                self.cache.put(key, iterations, {'xi': lc.xi_values, 'ri': lc.ri_values, 'ni': lc.ni_values},
+                               {'xo': int(lc.xo), 'g': int(lc.g), 'period': lc.period,
+                                'tail_length': lc.tail_length,
+                                'last_block': list(lc.last_block) if lc.last_block else None})
+            stage.count('values_produced', len(lc.ni_values))
+            return lc
+
+    def analyze_linear_congruential_period(self, xo, k, c, g):
+        """
+        Calcula el periodo exacto del método lineal congruencial sin generar la secuencia.
+
+        Parámetros:
+            xo (int): Valor inicial de la semilla.
+            k (int): Variable utilizada para calcular el multiplicador.
+            c (int): Incremento.
+            g (int): Variable utilizada para calcular la m.
+
+        Retorna:
+            dict: Periodo, periodo máximo, si se alcanza y las condiciones de Hull–Dobell.
+        """
+        return PeriodAnalyzer.analyze_linear_congruential(xo, k, c, g)
+
+    def analyze_multiplicative_congruential_period(self, xo, t, g):
+        """
+        Calcula el periodo exacto del método multiplicativo congruencial sin generar la secuencia.
+
+        Parámetros:
+            xo (int): Valor inicial de la semilla.
+            t (int): Variable utilizada para calcular el multiplicador.
+            g (int): Variable utilizada para calcular la m.
+
+        Retorna:
+            dict: Periodo, periodo máximo y si se alcanza.
+        """
+        return PeriodAnalyzer.analyze_multiplicative_congruential(xo, t, g)
+
+    def spectral_test_linear_congruential(self, k, g, dimensions=SpectralTest.MAX_DIMENSIONS):
+        """
+        Aplica la prueba espectral al multiplicador del método lineal congruencial.
+
+        Parámetros:
+            k (int): Variable utilizada para calcular el multiplicador.
+            g (int): Variable utilizada para calcular la m.
+            dimensions (int): Dimensión máxima, entre 2 y 8.
+
+        Retorna:
+            dict: ν_t, figura de mérito y puntaje de 0 a 1 por dimensión, y el peor puntaje.
+        """
+        return SpectralTest.analyze_linear_congruential(k, g, dimensions)
+
+    def spectral_test_multiplicative_congruential(self, t, g, dimensions=SpectralTest.MAX_DIMENSIONS):
+        """
+        Aplica la prueba espectral al multiplicador del método multiplicativo congruencial.
+
+        Parámetros:
+            t (int): Variable utilizada para calcular el multiplicador.
+            g (int): Variable utilizada para calcular la m.
+            dimensions (int): Dimensión máxima, entre 2 y 8.
+
+        Retorna:
+            dict: ν_t, figura de mérito y puntaje de 0 a 1 por dimensión, y el peor puntaje.
+        """
+        return SpectralTest.analyze_multiplicative_congruential(t, g, dimensions)
+
+    def search_linear_congruential_parameters(self, g, c=1, top=10, start=0, stop=None,
+                                              dimensions=SpectralTest.MAX_DIMENSIONS, min_score=0.0, workers=None,
+                                              checkpoint=None, progress=None, batch_size=1024, seed=0):
+        """
+        Busca los valores de k con periodo completo y mejor puntaje en la prueba espectral.
+
+        Parámetros:
+            g (int): Variable utilizada para calcular la m.
+            c (int): Incremento, impar.
+            top (int): Cantidad de parámetros a retornar.
+            start (int): Primer k a evaluar.
+            stop (int): k siguiente al último; por defecto todos los multiplicadores menores que m.
+            dimensions (int): Dimensión máxima de la prueba espectral, entre 2 y 8.
+            min_score (float): Puntaje mínimo, de 0 a 1.
+            workers (int): Cantidad de procesos; por defecto la cantidad de núcleos.
+            checkpoint (str): Archivo JSON desde el que se retoma la búsqueda y en el que se guarda su avance.
+            progress (ProgressReporter): Recibe la cantidad de candidatos evaluados y permite cancelar.
+            batch_size (int): Candidatos por lote.
+            seed (int): Semilla del orden disperso en que se recorren los candidatos.
+
+        Retorna:
+            dict: Parámetros de la búsqueda, avance y los mejores candidatos.
+        """
+        search = ParameterSearch('lc', g, c, top, start, stop, dimensions, min_score, batch_size, seed)
+        return search.run(workers, checkpoint, progress, self.instrumentation)
+
+    def search_multiplicative_congruential_parameters(self, g, top=10, start=0, stop=None,
+                                                      dimensions=SpectralTest.MAX_DIMENSIONS, min_score=0.0,
+                                                      workers=None, checkpoint=None, progress=None, batch_size=1024,
+                                                      seed=0):
+        """
+        Busca los valores de t con mejor puntaje en la prueba espectral.
+
+        Parámetros:
+            g (int): Variable utilizada para calcular la m.
+            top (int): Cantidad de parámetros a retornar.
+            start (int): Primer t a evaluar.
+            stop (int): t siguiente al último; por defecto todos los multiplicadores menores que m.
+            dimensions (int): Dimensión máxima de la prueba espectral, entre 2 y 8.
+            min_score (float): Puntaje mínimo, de 0 a 1.
+            workers (int): Cantidad de procesos; por defecto la cantidad de núcleos.
+            checkpoint (str): Archivo JSON desde el que se retoma la búsqueda y en el que se guarda su avance.
+            progress (ProgressReporter): Recibe la cantidad de candidatos evaluados y permite cancelar.
+            batch_size (int): Candidatos por lote.
+            seed (int): Semilla del orden disperso en que se recorren los candidatos.
+
+        Retorna:
+            dict: Parámetros de la búsqueda, avance y los mejores candidatos.
+        """
+        search = ParameterSearch('mc', g, 0, top, start, stop, dimensions, min_score, batch_size, seed)
+        return search.run(workers, checkpoint, progress, self.instrumentation)
+
+    def stream_middle_square(self, seed, min_value, max_value, iterations, chunk_size=DEFAULT_CHUNK_SIZE,
+                             decimals=5):
+        """
+        Genera los números del método del cuadrado medio en fragmentos, sin guardarlos en memoria.
+
+        Parámetros:
+            seed (int): Semilla inicial para la generación de números.
+            min_value (int): Valor mínimo para el rango de los números generados.
+            max_value (int): Valor máximo para el rango de los números generados.
+            iterations (int): Número de iteraciones o números a generar.
+            chunk_size (int): Cantidad de valores por fragmento.
+            decimals (int | None): Decimales a los que se truncan los valores; None conserva la precisión completa.
+
+        Retorna:
+            generator: Tuplas de arreglos (Xi, Ri, Ni).
+        """
+        return MiddleSquareMethod(seed, min_value, max_value, iterations, decimals).iter_chunks(chunk_size,
+                                                                                            self.instrumentation)
+
+    def stream_linear_congruential(self, xo, k, c, g, min_value, max_value, iterations,
+                                   chunk_size=DEFAULT_CHUNK_SIZE, decimals=5):
+        """
+        Genera los números del método lineal congruencial en fragmentos, sin guardarlos en memoria.
+
+        Parámetros:
+            xo (int): Valor inicial de la semilla.
+            k (int): Variable utilizada para calcular el multiplicador.
+            c (int): Incremento.
+            g (int): Variable utilizada para calcular la m.
+            min_value (int): Valor mínimo para el rango de los números generados.
+            max_value (int): Valor máximo para el rango de los números generados.
+            iterations (int): Número de iteraciones o números a generar.
+            chunk_size (int): Cantidad de valores por fragmento.
+            decimals (int | None): Decimales a los que se truncan los valores; None conserva la precisión completa.
+
+        Retorna:
+            generator: Tuplas de arreglos (Xi, Ri, Ni).
         """
-        lc = LinearCongruentialMethod(xo, k, c, g, min_value, max_value, iterations)
-        lc.generate_numbers_tested()
-        return lc
+        return LinearCongruentialMethod(xo, k, c, g, min_value, max_value, iterations,
+                                        decimals).iter_chunks(chunk_size, self.instrumentation)
 
-    def execute_normal_inv_distribution_method(self, intervals_amount, mean, standard_deviation, ri_values):
+    def stream_multiplicative_congruential(self, xo, t, g, min_value, max_value, iterations,
+                                           chunk_size=DEFAULT_CHUNK_SIZE, decimals=5):
+        """
+        Genera los números del método multiplicativo congruencial en fragmentos, sin guardarlos en memoria.
+
+        Parámetros:
+            xo (int): Valor inicial de la semilla.
+            t (int): Variable utilizada para calcular el multiplicador.
+            g (int): Variable utilizada para calcular la m.
+            min_value (int): Valor mínimo para el rango de los números generados.
+            max_value (int): Valor máximo para el rango de los números generados.
+            iterations (int): Número de iteraciones o números a generar.
+            chunk_size (int): Cantidad de valores por fragmento.
+            decimals (int | None): Decimales a los que se truncan los valores; None conserva la precisión completa.
+
+        Retorna:
+            generator: Tuplas de arreglos (Xi, Ri, Ni).
+        """
+        return MultiplicativeCongruentialMethod(xo, t, g, min_value, max_value, iterations,
+                                                decimals).iter_chunks(chunk_size, self.instrumentation)
+
+    def execute_normal_inv_distribution_method(self, intervals_amount, mean, standard_deviation, ri_values,
+                                               decimals=5, precision='exact', progress=None):
         """
         Ejecuta el método de distribución normal inversa.
 
@@ -77,38 +426,296 @@ class Methods:
             intervals_amount (int): Cantidad de intervalos para la distribución.
             mean (float): Media de la distribución.
             standard_deviation (float): Desviación estándar de la distribución.
-            ri_values (list): Valores Ri a utilizar para la generación de la distribución.
+            ri_values (array_like): Valores Ri a utilizar para la generación de la distribución.
+            decimals (int | None): Decimales a los que se truncan los valores; None conserva la precisión completa.
+            precision (str): 'exact' (scipy) o 'fast' (aproximación racional, error relativo < 1.15e-9).
+            progress (ProgressReporter): Recibe el avance de la generación y permite cancelarla.
 
         Retorna:
             NormalInvDistributionMethod: Instancia del método con los números generados.
         """
-        nd = NormalInvDistributionMethod(intervals_amount, mean, standard_deviation, ri_values)
-        nd.execute_method()
-        return nd
+        with self.instrumentation.stage('execute_normal_inv_distribution_method') as stage:
+            nd = NormalInvDistributionMethod(intervals_amount, mean, standard_deviation, ri_values, decimals, precision)
+            nd.execute_method(progress, self.instrumentation)
+            stage.count('values_produced', len(nd.ni_values))
+            return nd
 
-    def execute_uniform_distribution_method(self, min_value, max_value, ri_values):
+    def stream_normal_inv_frequencies(self, intervals_amount, mean, standard_deviation, ri_chunks, decimals=5,
+                                      precision='exact'):
+        """
+        Calcula los intervalos y frecuencias de la distribución normal inversa sobre Ri que llegan por fragmentos,
+        sin guardar todos los Ni en memoria.
+
+        Parámetros:
+            intervals_amount (int): Cantidad de intervalos para la distribución.
+            mean (float): Media de la distribución.
+            standard_deviation (float): Desviación estándar de la distribución.
+            ri_chunks (iterable): Fragmentos de valores Ri, por ejemplo los Ri de un stream_*.
+            decimals (int | None): Decimales a los que se truncan los valores; None conserva la precisión completa.
+            precision (str): 'exact' (scipy) o 'fast' (aproximación racional, error relativo < 1.15e-9).
+
+        Retorna:
+            tuple: Lista de intervalos y arreglo de frecuencias, iguales a los de execute_normal_inv_distribution_method.
+        """
+        accumulator = FrequencyAccumulator(intervals_amount)
+        for ri_values in ri_chunks:
+            nd = NormalInvDistributionMethod(intervals_amount, mean, standard_deviation, ri_values, decimals, precision)
+            nd.fill_ni_values()
+            accumulator.update(nd.ni_values)
+        return accumulator.result()
+
+    def execute_uniform_distribution_method(self, min_value, max_value, ri_values, decimals=5, progress=None):
         """
         Ejecuta el método de distribución uniforme.
 
         Parámetros:
             min_value (int): Valor mínimo para el rango de los números generados.
             max_value (int): Valor máximo para el rango de los números generados.
-            ri_values (list): Valores Ri a utilizar para la generación de la distribución.
+            ri_values (array_like): Valores Ri a utilizar para la generación de la distribución.
+            decimals (int | None): Decimales a los que se truncan los valores; None conserva la precisión completa.
+            progress (ProgressReporter): Recibe el avance de la generación y permite cancelarla.
+
+        Retorna:
+            UniformDistributionMethod: Instancia del método con los números generados.
+        """
+        with self.instrumentation.stage('execute_uniform_distribution_method') as stage:
+            ud = UniformDistributionMethod(min_value, max_value, ri_values, decimals)
+            ProgressReporter.notify(progress, 0, 1)
+            with self.instrumentation.stage('ni_mapping'):
+                ud.fill_ni_values()
+            ProgressReporter.notify(progress, 1, 1)
+            stage.count('values_produced', len(ud.ni_values))
+            return ud
+
+    def execute_statistical_tests(self, ri_values, alpha=0.05, intervals=10, progress=None):
+        """
+        Aplica a los Ri las pruebas de medias, varianza, chi-cuadrado, Kolmogórov–Smirnov, corridas y póker.
+
+        Parámetros:
+            ri_values (array_like): Valores Ri, o la instancia de un método (get_ri_values_array o ri_values_array).
+            alpha (float): Nivel de significancia.
+            intervals (int): Intervalos de la prueba chi-cuadrado.
+            progress (ProgressReporter): Recibe la cantidad de Ri procesados y permite cancelar.
+
+        Retorna:
+            StatisticalTests: Pruebas con los Ri acumulados; results() entrega el resultado de cada una.
+        """
+        with self.instrumentation.stage('execute_statistical_tests') as stage:
+            tests = StatisticalTests(alpha, intervals)
+            values = StatisticalTests.ri_values_of(ri_values)
+            ProgressReporter.notify(progress, 0, values.size)
+            for start in range(0, values.size, StatisticalTests.BLOCK_SIZE):
+                tests.update(values[start:start + StatisticalTests.BLOCK_SIZE])
+                ProgressReporter.notify(progress, min(start + StatisticalTests.BLOCK_SIZE, values.size), values.size)
+            stage.count('values_tested', tests.count)
+            return tests
+
+    def stream_statistical_tests(self, ri_chunks, alpha=0.05, intervals=10):
+        """
+        Aplica las pruebas de execute_statistical_tests a Ri que llegan por fragmentos, sin guardarlos en memoria.
+
+        Parámetros:
+            ri_chunks (iterable): Fragmentos de valores Ri, por ejemplo los Ri de un stream_*.
+            alpha (float): Nivel de significancia.
+            intervals (int): Intervalos de la prueba chi-cuadrado.
+
+        Retorna:
+            StatisticalTests: Pruebas con los Ri acumulados, con el mismo resultado que sobre el arreglo completo.
+        """
+        tests = StatisticalTests(alpha, intervals)
+        for ri_values in ri_chunks:
+            tests.update(ri_values)
+        return tests
+
+    def execute_linear_congruential_parallel(self, xo, k, c, g, min_value, max_value, iterations, decimals=5,
+                                             workers=None):
+        """
+        Ejecuta el método lineal congruencial repartiendo los bloques entre varios procesos.
+
+        El resultado es idéntico al de execute_linear_congruential: cada proceso calcula un rango
+        consecutivo de bloques y los rangos se unen en orden.
+
+        Parámetros:
+            xo (int): Valor inicial de la semilla.
+            k (int): Variable utilizada para calcular el multiplicador.
+            c (int): Incremento.
+            g (int): Variable utilizada para calcular la m.
+            min_value (int): Valor mínimo para el rango de los números generados.
+            max_value (int): Valor máximo para el rango de los números generados.
+            iterations (int): Número de iteraciones o números a generar.
+            decimals (int | None): Decimales a los que se truncan los valores; None conserva la precisión completa.
+            workers (int): Cantidad de procesos; por defecto la cantidad de núcleos.
+
+        Retorna:
+            LinearCongruentialMethod: Instancia del método con los números generados.
+        """
+        with self.instrumentation.stage('execute_linear_congruential_parallel') as stage:
+            workers = workers or os.cpu_count() or 1
+            lc = LinearCongruentialMethod(xo, k, c, g, min_value, max_value, iterations, decimals)
+            lc.generate_numbers_vectorized(self.process_pool(workers), workers, instrumentation=self.instrumentation)
+            stage.count('values_produced', len(lc.ni_values))
+            return lc
+
+    def execute_multiplicative_congruential_parallel(self, xo, t, g, min_value, max_value, iterations, decimals=5,
+                                                     workers=None):
+        """
+        Ejecuta el método multiplicativo congruencial repartiendo la secuencia entre varios procesos.
+
+        La secuencia se divide con saltos O(log n) en tramos consecutivos que no se traslapan; cada
+        proceso genera un tramo y los resultados se unen en orden.
+
+        Parámetros:
+            xo (int): Valor inicial de la semilla.
+            t (int): Variable utilizada para calcular el multiplicador.
+            g (int): Variable utilizada para calcular la m.
+            min_value (int): Valor mínimo para el rango de los números generados.
+            max_value (int): Valor máximo para el rango de los números generados.
+            iterations (int): Número de iteraciones o números a generar.
+            decimals (int | None): Decimales a los que se truncan los valores; None conserva la precisión completa.
+            workers (int): Cantidad de procesos; por defecto la cantidad de núcleos.
+
+        Retorna:
+            MultiplicativeCongruentialMethod: Instancia del método con los números generados.
+        """
+        with self.instrumentation.stage('execute_multiplicative_congruential_parallel') as stage:
+            workers = workers or os.cpu_count() or 1
+            mc = MultiplicativeCongruentialMethod(xo, t, g, min_value, max_value, iterations, decimals)
+            parts = [part for part in mc.split(min(workers, max(iterations, 1))) if part.iterations]
+            parts = list(self.process_pool(workers).map(_execute_part, parts, ['execute'] * len(parts)))
+            if not parts:
+                mc.execute()
+                stage.count('values_produced', len(mc.ni_values))
+                return mc
+            mc.xi_values = ValuesArray.xi(np.concatenate([part.xi_values for part in parts]))
+            mc.ri_values = ValuesArray.real(np.concatenate([part.ri_values for part in parts]))
+            mc.ni_values = ValuesArray.real(np.concatenate([part.ni_values for part in parts]))
+            stage.count('values_produced', len(mc.ni_values))
+            return mc
+
+    def execute_normal_inv_distribution_method_parallel(self, intervals_amount, mean, standard_deviation, ri_values,
+                                                        decimals=5, workers=None, precision='exact'):
+        """
+        Ejecuta el método de distribución normal inversa calculando los Ni en varios procesos.
+
+        Cada proceso transforma un rango consecutivo de los Ri; los intervalos y frecuencias se calculan
+        después sobre todos los Ni unidos en orden.
+
+        Parámetros:
+            intervals_amount (int): Cantidad de intervalos para la distribución.
+            mean (float): Media de la distribución.
+            standard_deviation (float): Desviación estándar de la distribución.
+            ri_values (array_like): Valores Ri a utilizar para la generación de la distribución.
+            decimals (int | None): Decimales a los que se truncan los valores; None conserva la precisión completa.
+            workers (int): Cantidad de procesos; por defecto la cantidad de núcleos.
+            precision (str): 'exact' (scipy) o 'fast' (aproximación racional, error relativo < 1.15e-9).
+
+        Retorna:
+            NormalInvDistributionMethod: Instancia del método con los números generados.
+        """
+        with self.instrumentation.stage('execute_normal_inv_distribution_method_parallel') as stage:
+            nd = NormalInvDistributionMethod(intervals_amount, mean, standard_deviation, ri_values, decimals, precision)
+            parts = [NormalInvDistributionMethod(intervals_amount, mean, standard_deviation,
+                                                 nd.ri_values[start:start + length], decimals, precision)
+                     for start, length in MathUtils.split_lengths(len(nd.ri_values), workers or os.cpu_count() or 1)
+                     if length]
+            nd.ni_values = ValuesArray.real(self.fill_parts_in_parallel(parts, workers))
+            nd.calculate_intervals()
+            nd.fill_frequencies()
+            stage.count('values_produced', len(nd.ni_values))
+            return nd
+
+    def execute_uniform_distribution_method_parallel(self, min_value, max_value, ri_values, decimals=5, workers=None):
+        """
+        Ejecuta el método de distribución uniforme calculando los Ni en varios procesos.
+
+        Parámetros:
+            min_value (int): Valor mínimo para el rango de los números generados.
+            max_value (int): Valor máximo para el rango de los números generados.
+            ri_values (array_like): Valores Ri a utilizar para la generación de la distribución.
+            decimals (int | None): Decimales a los que se truncan los valores; None conserva la precisión completa.
+            workers (int): Cantidad de procesos; por defecto la cantidad de núcleos.
 
         Retorna:
             UniformDistributionMethod: Instancia del método con los números generados.
         """
-        ud = UniformDistributionMethod(min_value, max_value, ri_values)
-        ud.fill_ni_values()
-        return ud
+        with self.instrumentation.stage('execute_uniform_distribution_method_parallel') as stage:
+            ud = UniformDistributionMethod(min_value, max_value, ri_values, decimals)
+            parts = [UniformDistributionMethod(min_value, max_value, ud.ri_values[start:start + length], decimals)
+                     for start, length in MathUtils.split_lengths(len(ud.ri_values), workers or os.cpu_count() or 1)
+                     if length]
+            ud.ni_values = ValuesArray.real(self.fill_parts_in_parallel(parts, workers))
+            stage.count('values_produced', len(ud.ni_values))
+            return ud
 
-    def write_pseudo_numbers(self, data, file_name):
+    def fill_parts_in_parallel(self, parts, workers=None):
+        """
+        Calcula los Ni de cada parte de una distribución en un pool de procesos y los une en orden.
+
+        Parámetros:
+            parts (list): Instancias de la distribución, una por rango de Ri.
+            workers (int): Cantidad de procesos; por defecto la cantidad de núcleos.
+
+        Retorna:
+            numpy.ndarray: Valores Ni de todas las partes, en orden.
+        """
+        if not parts:
+            return np.empty(0)
+        parts = list(self.process_pool(workers or os.cpu_count() or 1).map(_execute_part, parts,
+                                                                           ['fill_ni_values'] * len(parts)))
+        return np.concatenate([part.ni_values for part in parts])
+
+    def process_pool(self, workers):
+        """
+        Retorna el pool de procesos de los métodos *_parallel, creándolo la primera vez: iniciar los
+        procesos cuesta más que generar millones de números, así que se reutiliza entre llamadas hasta close.
+
+        Parámetros:
+            workers (int): Cantidad de procesos.
+
+        Retorna:
+            concurrent.futures.ProcessPoolExecutor: Pool con esa cantidad de procesos.
+        """
+        with self.pools_lock:
+            if workers not in self.pools:
+                self.pools[workers] = ProcessPoolExecutor(max_workers=workers)
+            return self.pools[workers]
+
+    def write_pseudo_numbers(self, data, file_name, file_format=None):
         """
         Este método escribe los números pseudoaleatorios en un archivo.
 
+        El formato se elige con file_format o, si no se indica, por la extensión del archivo:
+        ``.json`` (por defecto), ``.ndjson`` (un número por línea), ``.npy`` (NumPy, se puede abrir
+        como memmap; los enteros, como los Xi, conservan su tipo entero), ``.f64`` (float64 little-endian
+        sin encabezado; rechaza enteros que float64 no representa exactamente) o ``.u32`` (uint32
+        little-endian sin encabezado, para Xi).
+
+        Parámetros:
+            data (list | ValuesArray): Numeros que se quieren escribir en el archivo.
+            file_name (str): Nombre que el archivo tendrá.
+            file_format (str): 'json', 'ndjson', 'npy', 'f64' o 'u32'.
+
+        Retorna:
+            str: Ruta del archivo escrito.
+        """
+        return self.write_pseudo_numbers_stream([data], file_name, file_format)
+
+    def write_pseudo_numbers_stream(self, chunks, file_name, file_format=None, buffer_size=NUMBERS_BUFFER_SIZE):
+        """
+        Escribe los números a medida que llegan los fragmentos, sin reunirlos en memoria.
+
+        El JSON resultante es idéntico al que produce ``json.dump({"numbers": datos})`` con todos los
+        números juntos; en los archivos .npy el encabezado se reserva al inicio y se completa al final
+        con la cantidad de números escritos.
+
         Parámetros:
-            data (list): Lista de numeros que se quieren escribir en el archivo.
+            chunks (iterable): Fragmentos de números, por ejemplo los de un stream_*.
             file_name (str): Nombre que el archivo tendrá.
+            file_format (str): 'json', 'ndjson', 'npy', 'f64' o 'u32'.
+            buffer_size (int): Tamaño en bytes del búfer del archivo.
+
+        Retorna:
+            str: Ruta del archivo escrito.
         """
         folder_name = "NumbersGenerated"
 
@@ -116,9 +723,207 @@ class Methods:
         if not os.path.exists(folder_name):
             os.makedirs(folder_name)
 
-        # Ruta del archivo JSON dentro de la carpeta
+        # Ruta del archivo dentro de la carpeta
         file_path = os.path.join(folder_name, file_name)
+        file_format = self.resolve_file_format(file_name, file_format)
+
+        with self.instrumentation.stage('write_pseudo_numbers', file_name=file_name, file_format=file_format) as stage:
+            if file_format in ('json', 'ndjson'):
+                with open(file_path, 'w', buffering=buffer_size) as file:
+                    if file_format == 'json':
+                        file.write('{"numbers": [')
+                    separator = ''
+                    for chunk in chunks:
+                        # Se reutiliza json.dumps para que cada número quede escrito igual que con json.dump.
+                        values = chunk.tolist() if hasattr(chunk, 'tolist') else list(chunk)
+                        stage.count('values_written', len(values))
+                        text = json.dumps(values)[1:-1]
+                        if not text:
+                            continue
+                        if file_format == 'json':
+                            file.write(separator + text)
+                            separator = ', '
+                        else:
+                            file.write(text.replace(', ', '\n') + '\n')
+                    if file_format == 'json':
+                        file.write(']}')
+                stage.count('bytes_written', os.path.getsize(file_path))
+                return file_path
+
+            with open(file_path, 'wb', buffering=buffer_size) as file:
+                if file_format == 'npy':
+                    file.write(self.npy_header(0))
+                count = 0
+                dtype = None  # En .npy lo fija el primer fragmento y los siguientes deben respetarlo
+                for chunk in chunks:
+                    values = self.binary_values(chunk, file_format, dtype)
+                    values.tofile(file)
+                    count += values.size
+                    dtype = values.dtype.str
+                stage.count('values_written', count)
+                if file_format == 'npy':
+                    file.seek(0)
+                    file.write(self.npy_header(count, dtype or '<f8'))
+            stage.count('bytes_written', os.path.getsize(file_path))
+            return file_path
+
+    @staticmethod
+    def binary_values(data, file_format, dtype=None):
+        """
+        Convierte un fragmento de números al tipo little-endian de un formato binario.
+
+        Los Xi llegan a 2^64 y float64 solo representa enteros exactos hasta 2^53, así que en .npy los
+        enteros se guardan como '<u8' (o '<i8' si el arreglo es con signo) y en .f64 se rechazan los que
+        perderían precisión.
+
+        Parámetros:
+            data (array_like): Números a convertir.
+            file_format (str): 'npy', 'f64' o 'u32'.
+            dtype (str): Tipo de los fragmentos anteriores del mismo archivo .npy, o None en el primero.
+
+        Retorna:
+            numpy.ndarray: Arreglo '<u4' para u32, '<f8' para f64 y '<u8', '<i8' o '<f8' para npy.
+        """
+        values = np.asarray(data)
+        integers = np.issubdtype(values.dtype, np.integer)
+        if file_format == 'npy':
+            if dtype is None:
+                dtype = ('<u8' if np.issubdtype(values.dtype, np.unsignedinteger) else '<i8') if integers else '<f8'
+            if values.size and (integers != (dtype != '<f8')
+                                or dtype == '<u8' and values.min() < 0
+                                or dtype == '<i8' and values.max() > np.iinfo(np.int64).max):
+                raise ValueError(f"all chunks of an npy file must fit the type of the first one ({dtype})")
+            return values.astype(dtype).ravel()
+        if file_format == 'f64':
+            if integers and values.size and (values.max() > 2 ** 53 or values.min() < -2 ** 53):
+                raise ValueError("f64 files cannot store integers above 2^53 exactly; use npy or u32")
+            return values.astype('<f8').ravel()
+        if values.size and (not np.issubdtype(values.dtype, np.integer) or values.min() < 0
+                            or values.max() > np.iinfo(np.uint32).max):
+            raise ValueError("u32 files can only store integers between 0 and 2^32 - 1")
+        return values.astype('<u4').ravel()
+
+    @staticmethod
+    def npy_header(length, dtype='<f8'):
+        """
+        Construye el encabezado .npy (versión 1.0) de un arreglo de una dimensión.
+
+        El encabezado siempre ocupa 128 bytes para poder reescribirlo con la longitud final sin mover los datos.
 
-        json_data = {"numbers": data}
-        with open(file_path, 'w') as file:
-            json.dump(json_data, file)
+        Parámetros:
+            length (int): Cantidad de números del arreglo.
+            dtype (str): Tipo little-endian de los números ('<f8', '<u8' o '<i8').
+
+        Retorna:
+            bytes: Encabezado completo, incluido el número mágico.
+        """
+        header = "{'descr': '%s', 'fortran_order': False, 'shape': (%d,), }" % (dtype, length)
+        header = header.ljust(128 - 10 - 1) + '\n'
+        return b'\x93NUMPY\x01\x00' + len(header).to_bytes(2, 'little') + header.encode('latin1')
+
+    def write_pseudo_numbers_async(self, data, file_name, file_format=None):
+        """
+        Encola la escritura de los números en un hilo de escritura y retorna de inmediato.
+
+        Parámetros:
+            data (list | ValuesArray | iterable): Números, o fragmentos de un stream_*, a escribir.
+            file_name (str): Nombre que el archivo tendrá.
+            file_format (str): 'json', 'ndjson', 'npy', 'f64' o 'u32'.
+
+        Retorna:
+            concurrent.futures.Future: Resultado de la escritura, con la ruta del archivo.
+        """
+        if isinstance(data, (list, tuple)) or hasattr(data, 'tolist'):
+            return self.writer.submit(file_name, self.write_pseudo_numbers, data, file_name, file_format)
+        return self.writer.submit(file_name, self.write_pseudo_numbers_stream, data, file_name, file_format)
+
+    def flush_writes(self, timeout=None):
+        """
+        Espera a que terminen las escrituras en segundo plano.
+
+        Parámetros:
+            timeout (float): Segundos máximos de espera; None espera indefinidamente.
+
+        Retorna:
+            bool: True si todas terminaron dentro del tiempo indicado.
+        """
+        return self.writer.flush(timeout)
+
+    def close(self):
+        """
+        Espera las escrituras pendientes y libera el hilo de escritura y los pools de procesos.
+        """
+        self.writer.close()
+        with self.pools_lock:
+            pools, self.pools = self.pools, {}
+        for pool in pools.values():
+            pool.shutdown()
+
+    def read_pseudo_numbers(self, file_name, file_format=None, mmap=False):
+        """
+        Lee los números escritos por write_pseudo_numbers.
+
+        Parámetros:
+            file_name (str): Nombre del archivo dentro de NumbersGenerated.
+            file_format (str): 'json', 'ndjson', 'npy', 'f64' o 'u32'; por defecto se deduce de la extensión.
+            mmap (bool): Si es True, los formatos binarios se abren como memmap de solo lectura sin cargarlos en memoria.
+
+        Retorna:
+            numpy.ndarray: Números leídos (uint64 o float64 para JSON, según sus valores).
+        """
+        file_path = os.path.join("NumbersGenerated", file_name)
+        file_format = self.resolve_file_format(file_name, file_format)
+
+        if file_format == 'json':
+            with open(file_path) as file:
+                return self.json_array(json.load(file)["numbers"])
+        if file_format == 'ndjson':
+            with open(file_path) as file:
+                return self.json_array([json.loads(line) for line in file if line.strip()])
+        if file_format == 'npy':
+            return np.load(file_path, mmap_mode='r' if mmap else None)
+        dtype = '<u4' if file_format == 'u32' else '<f8'
+        # Un archivo vacío no se puede abrir como memmap.
+        if mmap and os.path.getsize(file_path):
+            return np.memmap(file_path, dtype=dtype, mode='r')
+        return np.fromfile(file_path, dtype=dtype)
+
+    @staticmethod
+    def json_array(numbers):
+        """
+        Convierte los números leídos de un JSON en un arreglo.
+
+        numpy deduce float64 para una lista con enteros a ambos lados de 2^63, lo que cambiaría los Xi
+        mayores que 2^53; por eso, si todos son enteros, el tipo se elige aquí.
+
+        Parámetros:
+            numbers (list): Números leídos.
+
+        Retorna:
+            numpy.ndarray: uint64 si todos son enteros no negativos, int64 si hay negativos y float64 en otro caso.
+        """
+        if numbers and all(isinstance(number, int) for number in numbers):
+            return np.asarray(numbers, dtype=np.uint64 if min(numbers) >= 0 else np.int64)
+        return np.asarray(numbers, dtype=np.float64)
+
+    @staticmethod
+    def resolve_file_format(file_name, file_format=None):
+        """
+        Determina el formato de un archivo de números a partir del argumento o de su extensión.
+
+        Parámetros:
+            file_name (str): Nombre del archivo.
+            file_format (str): Formato indicado explícitamente.
+
+        Retorna:
+            str: 'json', 'ndjson', 'npy', 'f64' o 'u32'. Un archivo sin extensión es JSON; una extensión
+            desconocida es un error, para no escribir JSON en un archivo que parece de otro formato.
+        """
+        if file_format is None:
+            file_format = os.path.splitext(file_name)[1].lstrip('.').lower() or 'json'
+            if file_format not in Methods.FILE_FORMATS:
+                raise ValueError(f"unknown extension in {file_name}; use one of {Methods.FILE_FORMATS} "
+                                 f"or pass file_format")
+        if file_format not in Methods.FILE_FORMATS:
+            raise ValueError(f"file_format must be one of {Methods.FILE_FORMATS}")
+        return file_format
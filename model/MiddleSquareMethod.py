@@ -1,10 +1,18 @@
+import numpy as np
+
+from model.Utils.Instrumentation import Instrumentation
+from model.Utils.MathUtils import MathUtils
+from model.Utils.ProgressReporter import ProgressReporter
+from model.Utils.ValuesArray import ValuesArray
+
 
 class MiddleSquareMethod:
     """
     Implementa el método del cuadrado medio para generar números pseudoaleatorios.
     """
-# TODO round ni values to 5 decimals
-    def __init__(self, seed, min_val, max_val, num_amount):
+    MAX_DIGITS = 19  # Los Xi se guardan como enteros de 64 bits sin signo (hasta 1.8e19).
+
+    def __init__(self, seed, min_val, max_val, num_amount, decimals=5):
         """
         Inicializa una instancia de la clase MiddleSquareMethod.
 
@@ -13,48 +21,339 @@ class MiddleSquareMethod:
             min_val (float): Valor mínimo para el rango de los números generados.
             max_val (float): Valor máximo para el rango de los números generados.
             num_amount (int): Número de valores a generar.
+            decimals (int | None): Decimales a los que se truncan Ri y Ni (5 por defecto); con None no se truncan.
         """
+        if len(str(seed)) > self.MAX_DIGITS:
+            raise ValueError(f"seed must have at most {self.MAX_DIGITS} digits: "
+                             "Xi are stored as 64-bit unsigned integers")
         self.seed = seed
-        self.ni_values = []
-        self.ri_values = []
-        self.xi_values = []
-        self.centers = []
+        self.ni_values = ValuesArray.real()
+        self.ri_values = ValuesArray.real()
+        self.xi_values = ValuesArray.xi()
+        self.centers = ValuesArray.xi()
+        self.period = None  # Longitud del ciclo en el que cae la secuencia
+        self.tail_length = None  # Cantidad de valores antes de entrar al ciclo
         self.min_val = min_val
         self.max_val = max_val
         self.num_amount = num_amount
+        self.decimals = decimals
 
-    def generate_randoms(self):
+    def generate_randoms(self, on_cycle='continue', progress=None, instrumentation=None):
         """
         Genera números pseudoaleatorios utilizando el método del cuadrado medio.
+
+        Los centros se calculan solo con aritmética entera y la secuencia se revisa con el algoritmo
+        de Brent. En cuanto cae en cero o en un ciclo corto se deja de calcular: el resto se obtiene
+        repitiendo el ciclo, se corta la secuencia o se continúa con una nueva semilla.
+
+        Parámetros:
+            on_cycle (str): Qué hacer al detectar un ciclo: 'continue' repite el ciclo hasta completar
+                num_amount (el resultado de siempre), 'stop' corta la secuencia antes del primer valor
+                repetido y 'reseed' continúa con la siguiente semilla que todavía no ha aparecido.
+            progress (ProgressReporter): Recibe la cantidad de Xi calculados después de cada tramo y permite cancelar.
+            instrumentation (Instrumentation): Recibe el tiempo del cálculo de los centros y del de Ri y Ni.
+        """
+        if on_cycle not in ('continue', 'stop', 'reseed'):
+            raise ValueError("on_cycle must be 'continue', 'stop' or 'reseed'")
+        len_seed = len(str(self.seed))
+        self.period = None
+        self.tail_length = None
+        xi_parts = []
+        center_parts = []
+        visited = set()
+        seed = self.seed
+        produced = 0
+        ProgressReporter.notify(progress, 0, self.num_amount)
+        with Instrumentation.measure(instrumentation, 'generation') as stage:
+            while produced < self.num_amount:
+                states, period, _ = self.generate_sequence(seed, self.num_amount - produced + 1, len_seed)
+                length = len(states) - 1
+                if period:
+                    tail = self.cycle_start(states, period)
+                    if self.period is None:
+                        self.period, self.tail_length = period, tail
+                    if on_cycle != 'continue':
+                        length = min(length, tail + period)
+                xi_parts.append(states[:length])
+                center_parts.append(states[1:length + 1])
+                produced += length
+                ProgressReporter.notify(progress, produced, self.num_amount)
+                if on_cycle != 'reseed' or not period:
+                    break
+                visited.update(states[:length].tolist())
+                seed = self.next_seed(seed, len_seed, visited)
+                if seed is None:
+                    break
+            stage.count('values_produced', produced)
+
+        self.xi_values = ValuesArray.xi(np.concatenate(xi_parts) if xi_parts else ())
+        self.centers = ValuesArray.xi(np.concatenate(center_parts) if center_parts else ())
+        with Instrumentation.measure(instrumentation, 'ni_mapping'):
+            ri_values = self.centers / (10 ** len_seed)
+            ni_values = self.min_val + ((self.max_val - self.min_val) * ri_values)
+            self.ri_values = ValuesArray.real(MathUtils.truncate_array(ri_values, self.decimals))
+            self.ni_values = ValuesArray.real(MathUtils.truncate_array(ni_values, self.decimals))
+
+    def extend_randoms(self, amount, progress=None, instrumentation=None):
+        """
+        Continúa una secuencia generada con on_cycle='continue' desde su último centro, como si se
+        hubiera generado desde el principio con ``amount`` valores más.
+
+        Parámetros:
+            amount (int): Cantidad de valores a agregar.
+            progress (ProgressReporter): Recibe la cantidad de Xi calculados y permite cancelar.
+            instrumentation (Instrumentation): Recibe el tiempo del cálculo de los centros y del de Ri y Ni.
+        """
+        if not len(self.centers):
+            raise ValueError("there is no generated sequence to extend")
+        len_seed = len(str(self.seed))
+        ProgressReporter.notify(progress, 0, amount)
+        with Instrumentation.measure(instrumentation, 'generation') as stage:
+            states, _, _ = self.generate_sequence(int(self.centers[-1]), amount + 1, len_seed)
+            stage.count('values_produced', amount)
+        ProgressReporter.notify(progress, amount, amount)
+        xi_values = states[:-1]
+        centers = states[1:]
+        with Instrumentation.measure(instrumentation, 'ni_mapping'):
+            ri_values = centers / (10 ** len_seed)
+            ni_values = self.min_val + ((self.max_val - self.min_val) * ri_values)
+            ri_values = MathUtils.truncate_array(ri_values, self.decimals)
+            ni_values = MathUtils.truncate_array(ni_values, self.decimals)
+        self.xi_values = ValuesArray.xi(np.concatenate((self.xi_values, xi_values)))
+        self.centers = ValuesArray.xi(np.concatenate((self.centers, centers)))
+        self.ri_values = ValuesArray.real(np.concatenate((self.ri_values, ri_values)))
+        self.ni_values = ValuesArray.real(np.concatenate((self.ni_values, ni_values)))
+        self.num_amount += amount
+        self.period, self.tail_length = self.detected_cycle(
+            np.append(self.xi_values, self.centers[-1:]), self.num_amount)
+
+    @staticmethod
+    def detected_cycle(states, steps):
+        """
+        Calcula el ciclo que generate_randoms informaría para una secuencia con on_cycle='continue',
+        sin repetir el algoritmo de Brent paso a paso.
+
+        Brent compara la liebre contra la tortuga que está en las posiciones ``2^j - 1``, con ``2^j``
+        pasos por ronda, así que el ciclo se detecta en el paso ``2^j - 1 + periodo`` para el menor j
+        con ``2^j - 1 >= cola`` y ``2^j >= periodo``; si ese paso supera steps, no se informa.
+
+        Parámetros:
+            states (numpy.ndarray): Estados de la secuencia, desde la semilla (steps + 1 valores).
+            steps (int): Cantidad de pasos revisados.
+
+        Retorna:
+            tuple: (periodo, cola), o (None, None) si el ciclo no se detectaría.
+        """
+        _, first, inverse = np.unique(states, return_index=True, return_inverse=True)
+        repeated = np.flatnonzero(first[inverse.ravel()] < np.arange(len(states)))
+        if not repeated.size:
+            return None, None
+        tail = int(first[inverse.ravel()[repeated[0]]])
+        period = int(repeated[0]) - tail
+        power = 1
+        while power - 1 < tail or power < period:
+            power *= 2
+        if power - 1 + period > steps:
+            return None, None
+        return period, tail
+
+    @staticmethod
+    def center_digits(values, digits):
+        """
+        Obtiene el centro del cuadrado de uno o varios números usando solo divisiones enteras.
+
+        Equivale a rellenar el cuadrado con ceros hasta ``2 * digits`` cifras y tomar ``digits`` cifras
+        a partir de la posición ``digits // 2``.
+
+        Parámetros:
+            values (int | numpy.ndarray): Número o arreglo de números.
+            digits (int): Cantidad de cifras de la semilla.
+
+        Retorna:
+            int | numpy.ndarray: Centro del cuadrado de cada número.
+        """
+        return (values * values // 10 ** (digits - digits // 2)) % 10 ** digits
+
+    @staticmethod
+    def generate_sequence(seed, steps, digits):
+        """
+        Calcula la secuencia del cuadrado medio de una sola semilla con enteros de Python.
+
+        Es el mismo recorrido que generate_many() para una fila, sin el costo por paso de las
+        operaciones de numpy sobre arreglos de un elemento: al detectar el ciclo con el algoritmo de
+        Brent, el resto de la secuencia se completa repitiéndolo.
+
+        Parámetros:
+            seed (int): Semilla inicial.
+            steps (int): Cantidad de estados, incluida la semilla.
+            digits (int): Cantidad de cifras de la semilla.
+
+        Retorna:
+            tuple: Arreglo uint64 de estados, longitud del ciclo (0 si no se cerró) y posición en la
+            que se detectó.
+        """
+        if steps == 0:
+            return np.zeros(0, dtype=np.uint64), 0, 0
+        divisor = 10 ** (digits - digits // 2)
+        modulus = 10 ** digits
+        hare = tortoise = int(seed)
+        states = [hare]
+        power, lam = 1, 0
+        period = stop = 0
+        for k in range(1, steps):
+            hare = hare * hare // divisor % modulus
+            states.append(hare)
+            lam += 1
+            if hare == tortoise:
+                period, stop = lam, k
+                break
+            if power == lam:
+                tortoise = hare
+                power *= 2
+                lam = 0
+        states = np.array(states, dtype=np.uint64)
+        if period and len(states) < steps:
+            # x(t) = x(t - period) para t >= stop - period: se rellena sin calcular.
+            base = stop - period
+            t = np.arange(len(states), steps)
+            states = np.concatenate((states, states[base + (t - base) % period]))
+        return states, period, stop
+
+    @staticmethod
+    def generate_many(seeds, steps, digits=None):
+        """
+        Calcula en paralelo las secuencias del cuadrado medio de varias semillas.
+
+        Cada fila se revisa con el algoritmo de Brent; cuando todas las filas ya cayeron en un ciclo,
+        las columnas restantes se completan repitiendo el ciclo de cada fila en lugar de calcularlas.
+
+        Parámetros:
+            seeds (list): Semillas iniciales, todas con la misma cantidad de cifras.
+            steps (int): Cantidad de estados por secuencia, incluida la semilla.
+            digits (int): Cantidad de cifras; por defecto la de la semilla más grande.
+
+        Retorna:
+            tuple: Matriz (semillas x steps) de estados, longitud del ciclo de cada fila (0 si no se
+            cerró) y posición en la que se detectó.
+        """
+        if digits is None:
+            digits = len(str(max(int(seed) for seed in seeds)))
+        # Con hasta 9 cifras el cuadrado cabe en int64; con más se usan enteros de Python.
+        dtype = np.int64 if digits <= 9 else object
+        rows = len(seeds)
+        states = np.zeros((rows, steps), dtype=dtype)
+        periods = np.zeros(rows, dtype=np.int64)
+        stops = np.zeros(rows, dtype=np.int64)
+        if steps == 0:
+            return states, periods, stops
+        hare = np.array([int(seed) for seed in seeds], dtype=dtype)
+        states[:, 0] = hare
+        tortoise = hare.copy()
+        power = np.ones(rows, dtype=np.int64)
+        lam = np.zeros(rows, dtype=np.int64)
+        pending = np.ones(rows, dtype=bool)
+        for k in range(1, steps):
+            hare = MiddleSquareMethod.center_digits(hare, digits)
+            states[:, k] = hare
+            lam += 1
+            closed = pending & (hare == tortoise)
+            if closed.any():
+                periods[closed] = lam[closed]
+                stops[closed] = k
+                pending &= ~closed
+                if not pending.any():
+                    # x(t) = x(t - period) para t >= stop - period: se rellena sin calcular.
+                    t = np.arange(steps)
+                    base = (stops - periods)[:, np.newaxis]
+                    index = np.where(t > stops[:, np.newaxis], base + (t - base) % periods[:, np.newaxis], t)
+                    states = np.take_along_axis(states, index, axis=1)
+                    break
+            reset = pending & (power == lam)
+            tortoise = np.where(reset, hare, tortoise)
+            power[reset] *= 2
+            lam[reset] = 0
+        return states, periods, stops
+
+    @staticmethod
+    def cycle_start(states, period):
+        """
+        Calcula la longitud de la cola: la posición del primer estado que ya pertenece al ciclo.
+
+        Parámetros:
+            states (numpy.ndarray): Secuencia de estados que contiene al menos un ciclo completo.
+            period (int): Longitud del ciclo.
+
+        Retorna:
+            int: Cantidad de estados antes del ciclo.
+        """
+        return int(np.flatnonzero(states[:-period] == states[period:])[0])
+
+    @staticmethod
+    def next_seed(seed, digits, visited):
+        """
+        Busca la siguiente semilla con la misma cantidad de cifras que todavía no ha aparecido.
+
+        Parámetros:
+            seed (int): Última semilla usada.
+            digits (int): Cantidad de cifras de la semilla.
+            visited (set): Estados ya generados.
+
+        Retorna:
+            int | None: Nueva semilla, o None si ya se usaron todas.
+        """
+        low = 10 ** (digits - 1)
+        count = 10 ** digits - low
+        for offset in range(1, count + 1):
+            candidate = low + (seed - low + offset) % count
+            if candidate not in visited:
+                return candidate
+        return None
+
+    def iter_chunks(self, chunk_size, instrumentation=None):
+        """
+        Genera la secuencia en fragmentos de tamaño fijo, con memoria constante.
+
+        Los valores coinciden con los de generate_randoms(), pero no se guardan en la instancia.
+
+        Parámetros:
+            chunk_size (int): Cantidad de valores por fragmento (el último puede ser menor).
+            instrumentation (Instrumentation): Recibe el tiempo del cálculo de los centros y del de Ri y Ni
+                de cada fragmento.
+
+        Retorna:
+            generator: Tuplas de arreglos (Xi, Ri, Ni) de longitud chunk_size.
         """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
         seed = self.seed
         len_seed = len(str(self.seed))
-        for _ in range(self.num_amount):
-            self.xi_values.append(seed)
-            xi2 = seed * seed
-            center = self.get_center(str(xi2))
-            self.centers.append(center)
-            ri = center / (10 ** len_seed)
-            self.ri_values.append(ri)
-            ni = self.min_val + ((self.max_val - self.min_val) * ri)
-            self.ni_values.append(ni)
-            seed = center
+        for start in range(0, self.num_amount, chunk_size):
+            size = min(chunk_size, self.num_amount - start)
+            with Instrumentation.measure(instrumentation, 'generation') as stage:
+                states, _, _ = self.generate_sequence(seed, size + 1, len_seed)
+                stage.count('values_produced', size)
+            xi_values = states[:-1]
+            centers = states[1:]
+            seed = int(states[-1])
+            with Instrumentation.measure(instrumentation, 'ni_mapping'):
+                ri_values = centers / (10 ** len_seed)
+                ni_values = self.min_val + ((self.max_val - self.min_val) * ri_values)
+                ri_values = MathUtils.truncate_array(ri_values, self.decimals)
+                ni_values = MathUtils.truncate_array(ni_values, self.decimals)
+            yield xi_values, ri_values, ni_values
 
     def get_center(self, num):
         """
         Obtiene el centro de un número, utilizado en el método del cuadrado medio.
 
         Parámetros:
-            num (str): Número del cual se extraerá el centro.
+            num (str | int): Número (el cuadrado de la semilla) del cual se extraerá el centro.
 
         Retorna:
             int: Centro del número.
         """
         len_seed = len(str(self.seed))
-        padded = num.zfill(len_seed * 2)
-        start_index = int(len_seed / 2)
-        end_index = start_index + len_seed
-        return int(padded[start_index:end_index])
+        return (int(num) // 10 ** (len_seed - len_seed // 2)) % 10 ** len_seed
 
     @property
     def xi_values_array(self):
@@ -62,7 +361,7 @@ class MiddleSquareMethod:
         Devuelve el arreglo de valores Xi generados.
 
         Retorna:
-            list: Lista de valores Xi.
+            ValuesArray: Arreglo uint64 de valores Xi.
         """
         return self.xi_values
 
@@ -72,7 +371,7 @@ class MiddleSquareMethod:
         Devuelve el arreglo de valores Ri generados.
 
         Retorna:
-            list: Lista de valores Ri.
+            ValuesArray: Arreglo float64 de valores Ri.
         """
         return self.ri_values
 
@@ -82,6 +381,6 @@ class MiddleSquareMethod:
         Devuelve el arreglo de valores Ni generados.
 
         Retorna:
-            list: Lista de valores Ni.
+            ValuesArray: Arreglo float64 de valores Ni.
         """
         return self.ni_values
@@ -1,9 +1,18 @@
+import numpy as np
+
+from model.Utils.Instrumentation import Instrumentation
+from model.Utils.MathUtils import MathUtils
+from model.Utils.ProgressReporter import ProgressReporter
+from model.Utils.ValuesArray import ValuesArray
+
+
 class MultiplicativeCongruentialMethod:
     """
         Esta clase implementa el método multiplicativo congruencial para generar números pseudoaleatorios.
     """
+    MAX_G = 64  # Los Xi se guardan y se calculan como enteros sin signo de 64 bits.
 
-    def __init__(self, xo, t, g, min_value, max_value, iterations):
+    def __init__(self, xo, t, g, min_value, max_value, iterations, decimals=5):
         """
         Inicializa una instancia de la clase MultiplicativeCongruentialMethod.
 
@@ -14,24 +23,38 @@ class MultiplicativeCongruentialMethod:
             min_value (float): Valor mínimo para el rango de los números generados.
             max_value (float): Valor máximo para el rango de los números generados.
             iterations (int): Número de iteraciones o números a generar.
+            decimals (int | None): Decimales a los que se redondean Ri y Ni; None conserva la precisión completa.
         """
-        self.xi_values = []  # Lista para almacenar los valores de Xi
-        self.ri_values = []  # Lista para almacenar los valores de Ri
-        self.ni_values = []  # Lista para almacenar los valores de Ni
+        if g > self.MAX_G:
+            raise ValueError(f"g must be at most {self.MAX_G}: Xi are stored as 64-bit unsigned integers")
+        self.xi_values = ValuesArray.xi()  # Arreglo para almacenar los valores de Xi
+        self.ri_values = ValuesArray.real()  # Arreglo para almacenar los valores de Ri
+        self.ni_values = ValuesArray.real()  # Arreglo para almacenar los valores de Ni
         self.xo = xo  # Valor inicial semilla
         self.t = t  # Parametro multiplicador
         self.g = g  # Parametro del modulo
         self.min = min_value  # Valor minimo para el rango
         self.max = max_value # Valor maximo para el rango
         self.iterations = iterations  # Numero de iteraciones
+        self.decimals = decimals  # Decimales de Ri y Ni
 
-    def execute(self):
+    def execute(self, progress=None, instrumentation=None):
         """
             Este método ejecuta el método multiplicativo congruencial.
-        """
-        self.fill_first_xi_value()
-        self.fill_xi_values()
-        self.fill_ri_and_ni_values()
+
+        Parámetros:
+            progress (ProgressReporter): Recibe el avance por etapas (de 3) y permite cancelar entre ellas.
+            instrumentation (Instrumentation): Recibe el tiempo de la generación de Xi y del cálculo de Ri y Ni.
+        """
+        ProgressReporter.notify(progress, 0, 3)
+        with Instrumentation.measure(instrumentation, 'generation') as stage:
+            self.fill_first_xi_value()
+            self.fill_xi_values()
+            stage.count('values_produced', len(self.xi_values))
+        ProgressReporter.notify(progress, 2, 3)
+        with Instrumentation.measure(instrumentation, 'ni_mapping'):
+            self.fill_ri_and_ni_values()
+        ProgressReporter.notify(progress, 3, 3)
 
     def fill_first_xi_value(self):
         """
@@ -40,36 +63,103 @@ class MultiplicativeCongruentialMethod:
         a = (8 * self.t) + 3
         amount = 2 ** self.g
         value = (a * self.xo) % amount
-        self.xi_values.append(round(value, 5))
+        self.xi_values = ValuesArray.xi([value])
 
     def fill_xi_values(self):
         """
             Este método calcula y almacena todos los valores Xi posteriores.
         """
+        if self.iterations <= 1:
+            return
         a = (8 * self.t) + 3
         amount = 2 ** self.g
-        for i in range(self.iterations - 1):
-            value = (a * self.xi_values[i]) % amount
-            self.xi_values.append(round(value, 5))
+        # X(i+1) = a^i * X(1) mod m, con potencias obtenidas duplicando la recurrencia.
+        multipliers, _ = MathUtils.affine_coefficients(a, 0, self.iterations - 1)
+        following = (multipliers * self.xi_values[0]) & np.uint64(amount - 1)
+        self.xi_values = ValuesArray.xi(np.concatenate((self.xi_values, following)))
 
     def fill_ri_and_ni_values(self):
         """
             Este método calcula y almacena todos los valores de Ri y Ni.
         """
         num_amount = 2 ** self.g
-        for i in range(self.iterations):
-            ri_value = float(self.xi_values[i]) / (num_amount - 1)
-            self.ri_values.append(round(ri_value, 5))
+        ri_values = self.xi_values[:self.iterations].astype(np.float64) / (num_amount - 1)
+        self.ri_values = ValuesArray.real(MathUtils.truncate_array(ri_values, self.decimals))
+
+        ni_values = self.min + (self.max - self.min) * ri_values
+        self.ni_values = ValuesArray.real(MathUtils.truncate_array(ni_values, self.decimals))
+
+    def iter_chunks(self, chunk_size, instrumentation=None):
+        """
+            Este método genera la secuencia en fragmentos de tamaño fijo, con memoria constante.
+
+        Los valores coinciden con los de execute(), pero no se guardan en la instancia.
+
+        Parámetros:
+            chunk_size (int): Cantidad de valores por fragmento (el último puede ser menor).
+            instrumentation (Instrumentation): Recibe el tiempo del cálculo de Xi y del de Ri y Ni de cada fragmento.
+
+        Retorna:
+            generator: Tuplas de arreglos (Xi, Ri, Ni) de longitud chunk_size.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        a = (8 * self.t) + 3
+        amount = 2 ** self.g
+        multipliers, _ = MathUtils.affine_coefficients(a, 0, min(chunk_size, max(self.iterations, 1)))
+        mask = np.uint64(amount - 1)
+        xi = self.xo % amount
+        for start in range(0, self.iterations, chunk_size):
+            size = min(chunk_size, self.iterations - start)
+            with Instrumentation.measure(instrumentation, 'generation') as stage:
+                xi_values = (multipliers[:size] * np.uint64(xi)) & mask
+                stage.count('values_produced', size)
+            with Instrumentation.measure(instrumentation, 'ni_mapping'):
+                ri_values = xi_values.astype(np.float64) / (amount - 1)
+                ni_values = MathUtils.truncate_array(self.min + (self.max - self.min) * ri_values, self.decimals)
+                ri_values = MathUtils.truncate_array(ri_values, self.decimals)
+            yield xi_values, ri_values, ni_values
+            xi = int(xi_values[-1])
 
-            ni_value = self.min + (self.max - self.min) * ri_value
-            self.ni_values.append(round(ni_value, 5))
+    def jump_ahead(self, steps):
+        """
+            Este método avanza la semilla ``steps`` pasos de la recurrencia ``X(n+1) = a * X(n) mod m`` en O(log steps).
+
+        Parámetros:
+            steps (int): Cantidad de pasos a avanzar.
+        """
+        a = (8 * self.t) + 3
+        amount = 2 ** self.g
+        self.xo = (pow(a, steps, amount) * self.xo) % amount
+
+    def split(self, substreams):
+        """
+            Este método divide la secuencia en subsecuencias consecutivas que no se traslapan.
+
+        Cada instancia devuelta parte de la semilla que corresponde al inicio de su tramo, así que
+        ejecutar ``execute()`` sobre cada una y concatenar los resultados reproduce la secuencia completa.
+
+        Parámetros:
+            substreams (int): Cantidad de subsecuencias.
+
+        Retorna:
+            list: Lista de instancias de MultiplicativeCongruentialMethod, una por subsecuencia.
+        """
+        a = (8 * self.t) + 3
+        amount = 2 ** self.g
+        result = []
+        for start, length in MathUtils.split_lengths(self.iterations, substreams):
+            xo = (pow(a, start, amount) * self.xo) % amount
+            result.append(MultiplicativeCongruentialMethod(xo, self.t, self.g, self.min, self.max, length,
+                                                           self.decimals))
+        return result
 
     def get_xi_values_array(self):
         """
         Devuelve el arreglo de valores Xi generados.
 
         Retorna:
-            list: Lista de valores Xi.
+            ValuesArray: Arreglo uint64 de valores Xi.
         """
         return self.xi_values
 
@@ -78,7 +168,7 @@ class MultiplicativeCongruentialMethod:
         Devuelve el arreglo de valores Ri generados.
 
         Retorna:
-            list: Lista de valores Ri.
+            ValuesArray: Arreglo float64 de valores Ri.
         """
         return self.ri_values
 
@@ -87,6 +177,6 @@ class MultiplicativeCongruentialMethod:
         Devuelve el arreglo de valores Ni generados.
 
         Retorna:
-            list: Lista de valores Ni.
+            ValuesArray: Arreglo float64 de valores Ni.
         """
         return self.ni_values
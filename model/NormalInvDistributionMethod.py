@@ -1,8 +1,12 @@
-import math
 from random import random
 
 import numpy as np
-from scipy.stats import norm
+
+from model.Utils.FrequencyAccumulator import FrequencyAccumulator
+from model.Utils.Instrumentation import Instrumentation
+from model.Utils.MathUtils import MathUtils
+from model.Utils.ProgressReporter import ProgressReporter
+from model.Utils.ValuesArray import ValuesArray
 
 
 class NormalInvDistributionMethod:
@@ -10,7 +14,9 @@ class NormalInvDistributionMethod:
         Esta clase implementa el método de distribución inversa normal para generar números pseudoaleatorios.
     """
 
-    def __init__(self, intervals_amount, mean, standard_deviation, ri_values):
+    PRECISIONS = ('exact', 'fast')
+
+    def __init__(self, intervals_amount, mean, standard_deviation, ri_values, decimals=5, precision='exact'):
         """
         Inicializa una instancia de la clase NormalInvDistributionMethod.
 
@@ -18,53 +24,69 @@ class NormalInvDistributionMethod:
             intervals_amount (int): Número de intervalos para la distribución.
             mean (float): Media de la distribución normal.
             standard_deviation (float): Desviación estándar de la distribución normal.
-            ri_values (list): Lista de valores Ri utilizados para generar los números pseudoaleatorios.
-        """
+            ri_values (array_like): Valores Ri utilizados para generar los números pseudoaleatorios. Si ya es
+                un arreglo float64 se usa directamente, sin copiarlo.
+            decimals (int | None): Decimales a los que se redondean los Ni; None conserva la precisión completa.
+            precision (str): 'exact' usa scipy.special.ndtri, el mismo cuantil que scipy.stats.norm.ppf sin su
+                validación de argumentos; 'fast' usa la aproximación racional de MathUtils.inverse_normal_cdf
+                (error relativo menor que 1.15e-9), que no necesita scipy.
+        """
+        if precision not in self.PRECISIONS:
+            raise ValueError(f"precision must be one of {self.PRECISIONS}")
         self.mean = mean
         self.standard_deviation = standard_deviation
         self.intervals_amount = intervals_amount  # Numero de iteraciones
-        self.ri_values = ri_values  # Lista para almacenar los valores de Ri
-        self.ni_values = []  # Lista para almacenar los valores de Ni
+        self.ri_values = ValuesArray.real(ri_values)  # Arreglo con los valores de Ri
+        self.ni_values = ValuesArray.real()  # Arreglo para almacenar los valores de Ni
+        self.decimals = decimals
+        self.precision = precision
         self.frequencies = [0] * intervals_amount
         self.intervals = [0] * intervals_amount
 
-    def execute_method(self):
+    def execute_method(self, progress=None, instrumentation=None):
         """
         Ejecuta el método de distribución inversa normal para generar los valores Ni y calcular los intervalos y frecuencias.
-        """
-        self.fill_ni_values()
-        self.calculate_intervals()
-        self.fill_frequencies()
+
+        Parámetros:
+            progress (ProgressReporter): Recibe el avance por etapas (de 3) y permite cancelar entre ellas.
+            instrumentation (Instrumentation): Recibe el tiempo del cálculo de Ni y de las frecuencias.
+        """
+        ProgressReporter.notify(progress, 0, 3)
+        with Instrumentation.measure(instrumentation, 'ni_mapping'):
+            self.fill_ni_values()
+        ProgressReporter.notify(progress, 1, 3)
+        with Instrumentation.measure(instrumentation, 'frequencies'):
+            self.calculate_intervals()
+            ProgressReporter.notify(progress, 2, 3)
+            self.fill_frequencies()
+        ProgressReporter.notify(progress, 3, 3)
 
     def fill_ni_values(self):
         """
             Este método calcula y almacena los valores de Ni basándose en los valores de Ri utilizando la distribución inversa de la normal.
+
+            Todos los Ri se transforman en una sola llamada sobre el arreglo completo.
         """
-        for i in range(len(self.ri_values)):
-            # TODO cambiar round
-            self.ni_values.append(round(norm.ppf(self.ri_values[i], loc=self.mean, scale=self.standard_deviation), 5))
+        if self.precision == 'fast':
+            ni_values = self.mean + self.standard_deviation * MathUtils.inverse_normal_cdf(self.ri_values)
+        else:
+            # scipy se importa solo aquí para que cargar el modelo no pague su tiempo de inicio; scipy.special
+            # carga mucho más rápido que scipy.stats. El orden de las operaciones es el de norm.ppf.
+            from scipy.special import ndtri
+            ni_values = ndtri(self.ri_values) * self.standard_deviation + self.mean
+        self.ni_values = ValuesArray.real(MathUtils.truncate_array(ni_values, self.decimals))
 
     def fill_frequencies(self):
         """
         Calcula las frecuencias de los valores Ni en los intervalos definidos.
+
+        Los NaN se ignoran y el índice de cada valor se calcula por bloques con NumPy.
         """
         if not self.ni_values:
             raise ValueError("ni_values is empty")
 
-        # Filtrar los valores NaN
-        filtered_ni_values = [value for value in self.ni_values if not math.isnan(value)]
-
-        if not filtered_ni_values:
-            raise ValueError("All ni_values are NaN")
-
-        min_value = min(filtered_ni_values)
-        interval_size = self.intervals[1] - self.intervals[0] if len(self.intervals) > 1 else 1
-
-        for number in filtered_ni_values:
-            interval_index = int((number - min_value) // interval_size)
-            if interval_index >= self.intervals_amount:
-                interval_index = self.intervals_amount - 1  # Asegurarse de no exceder el índice máximo
-            self.frequencies[interval_index] += 1
+        _, frequencies = FrequencyAccumulator.bin_values(self.ni_values, self.intervals_amount)
+        self.frequencies = (np.asarray(self.frequencies) + frequencies).tolist()
 
     def calculate_intervals(self):
         """
@@ -76,18 +98,15 @@ class NormalInvDistributionMethod:
         if self.intervals_amount <= 1:
             raise ValueError("intervals_amount must be greater than 1")
 
-        _range = max(self.ni_values) - min(self.ni_values)
-        interval_length = _range / self.intervals_amount
-        self.intervals[0] = min(self.ni_values)
-        for i in range(1, self.intervals_amount):
-            self.intervals[i] = self.intervals[i - 1] + interval_length
+        self.intervals = FrequencyAccumulator.calculate_intervals(np.nanmin(self.ni_values), np.nanmax(self.ni_values),
+                                                                  self.intervals_amount)
 
     def get_ri_values_array(self):
         """
         Devuelve el arreglo de valores Ri utilizados en el método.
 
         Retorna:
-            list: Lista de valores Ri.
+            ValuesArray: Arreglo float64 de valores Ri.
         """
         return self.ri_values
 
@@ -96,7 +115,7 @@ class NormalInvDistributionMethod:
         Devuelve el arreglo de valores Ni generados por el método.
 
         Retorna:
-            list: Lista de valores Ni.
+            ValuesArray: Arreglo float64 de valores Ni.
         """
         return self.ni_values
 
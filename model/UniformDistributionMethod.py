@@ -1,4 +1,5 @@
 from model.Utils.MathUtils import MathUtils
+from model.Utils.ValuesArray import ValuesArray
 
 
 class UniformDistributionMethod:
@@ -6,34 +7,36 @@ class UniformDistributionMethod:
         Esta clase implementa el método de distribución uniforme para generar números pseudoaleatorios.
     """
 
-    def __init__(self, min_value, max_value, ri_values):
+    def __init__(self, min_value, max_value, ri_values, decimals=5):
         """
         Inicializa una instancia de la clase UniformDistributionMethod.
 
         Parámetros:
             min_value (float): Valor mínimo para el rango de los números generados.
             max_value (float): Valor máximo para el rango de los números generados.
-            ri_values (list): Lista de valores Ri utilizados para generar los números pseudoaleatorios.
+            ri_values (array_like): Valores Ri utilizados para generar los números pseudoaleatorios. Si ya es
+                un arreglo float64 se usa directamente, sin copiarlo.
+            decimals (int | None): Decimales a los que se truncan los Ni; None conserva la precisión completa.
         """
         self.min_value = min_value
         self.max_value = max_value
-        self.ri_values = ri_values  # Lista para almacenar los valores de Ri
-        self.ni_values = []  # Lista para almacenar los valores de Ni
+        self.ri_values = ValuesArray.real(ri_values)  # Arreglo con los valores de Ri
+        self.ni_values = ValuesArray.real()  # Arreglo para almacenar los valores de Ni
+        self.decimals = decimals
 
     def fill_ni_values(self):
         """
         Calcula y almacena los valores de Ni en función de los valores de Ri utilizando la distribución uniforme.
         """
-        for i in range(len(self.ri_values)):
-            value = self.min_value + (self.max_value - self.min_value) * self.ri_values[i]
-            self.ni_values.append(MathUtils.truncate(value))
+        values = self.min_value + (self.max_value - self.min_value) * self.ri_values
+        self.ni_values = ValuesArray.real(MathUtils.truncate_array(values, self.decimals))
 
     def get_ri_values_array(self):
         """
         Devuelve el arreglo de valores Ri utilizados en el método.
 
         Retorna:
-            list: Lista de valores Ri.
+            ValuesArray: Arreglo float64 de valores Ri.
         """
         return self.ri_values
 
@@ -42,6 +45,6 @@ class UniformDistributionMethod:
         Devuelve el arreglo de valores Ni generados por el método.
 
         Retorna:
-            list: Lista de valores Ni.
+            ValuesArray: Arreglo float64 de valores Ni.
         """
         return self.ni_values
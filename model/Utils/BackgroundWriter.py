@@ -0,0 +1,110 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+
+class BackgroundWriter:
+    """
+    Ejecuta escrituras de archivos en hilos dedicados para que no bloqueen la generación ni la interfaz.
+
+    Varias escrituras de archivos distintos pueden avanzar al mismo tiempo, pero las de un mismo nombre se
+    ejecutan en el orden en que se encolaron, una después de la otra, para que no se intercalen en el
+    archivo. flush espera a que terminen las pendientes y los errores se entregan a un manejador en lugar
+    de perderse dentro del hilo.
+    """
+
+    def __init__(self, max_workers=2, error_handler=None):
+        """
+        Inicializa el escritor.
+
+        Parámetros:
+            max_workers (int): Cantidad de escrituras que pueden ejecutarse a la vez.
+            error_handler (callable): Función que recibe ``(nombre, excepción)`` cuando una escritura falla.
+                Se llama desde el hilo de escritura.
+        """
+        self.max_workers = max_workers
+        self.error_handler = error_handler
+        self.executor = None
+        self.pending = set()
+        self.latest = {}  # Última escritura encolada de cada nombre
+        self.lock = threading.Lock()
+
+    def submit(self, name, function, *args, **kwargs):
+        """
+        Encola una escritura.
+
+        Parámetros:
+            name (str): Nombre de la escritura (el archivo), usado para ordenar las escrituras del mismo
+                archivo y al reportar errores.
+            function (callable): Función que realiza la escritura.
+            *args, **kwargs: Argumentos de la función.
+
+        Retorna:
+            concurrent.futures.Future: Resultado de la escritura.
+        """
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='writer')
+            future = self.executor.submit(self.run_after, self.latest.get(name), function, args, kwargs)
+            self.latest[name] = future
+            self.pending.add(future)
+        future.add_done_callback(lambda done: self.finish(name, done))
+        return future
+
+    @staticmethod
+    def run_after(previous, function, args, kwargs):
+        """
+        Espera a que termine la escritura anterior del mismo nombre y ejecuta la siguiente. La anterior
+        se encoló antes, así que ya tomó un hilo y esperarla no puede bloquear al pool.
+
+        Parámetros:
+            previous (concurrent.futures.Future): Escritura anterior, o None.
+            function (callable): Función que realiza la escritura.
+            args (tuple): Argumentos posicionales.
+            kwargs (dict): Argumentos por nombre.
+
+        Retorna:
+            object: Resultado de la función.
+        """
+        if previous is not None:
+            wait([previous])
+        return function(*args, **kwargs)
+
+    def finish(self, name, future):
+        """
+        Retira una escritura terminada de las pendientes y reporta su error, si lo hubo.
+
+        Parámetros:
+            name (str): Nombre de la escritura.
+            future (concurrent.futures.Future): Escritura terminada.
+        """
+        with self.lock:
+            self.pending.discard(future)
+            if self.latest.get(name) is future:
+                del self.latest[name]
+        error = None if future.cancelled() else future.exception()
+        if error is not None and self.error_handler is not None:
+            self.error_handler(name, error)
+
+    def flush(self, timeout=None):
+        """
+        Espera a que terminen todas las escrituras encoladas hasta el momento.
+
+        Parámetros:
+            timeout (float): Segundos máximos de espera; None espera indefinidamente.
+
+        Retorna:
+            bool: True si todas terminaron dentro del tiempo indicado.
+        """
+        with self.lock:
+            pending = set(self.pending)
+        _, not_done = wait(pending, timeout=timeout)
+        return not not_done
+
+    def close(self):
+        """
+        Espera las escrituras pendientes y libera los hilos.
+        """
+        with self.lock:
+            executor, self.executor = self.executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
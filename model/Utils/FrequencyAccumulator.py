@@ -0,0 +1,198 @@
+import os
+import tempfile
+
+import numpy as np
+
+
+class FrequencyAccumulator:
+    """
+    Calcula los intervalos y las frecuencias de una serie de valores, ya sea sobre un arreglo completo
+    o acumulando fragmentos que llegan uno a uno.
+
+    Los intervalos dependen del mínimo y el máximo de todos los valores, que no se conocen hasta el
+    final del recorrido. Por eso los fragmentos se resumen como pares (valor distinto, cantidad): con
+    Ni truncados a pocos decimales la cantidad de valores distintos es pequeña aunque se acumulen
+    10^8 muestras, y al final el resultado es idéntico al de procesar todos los valores juntos.
+
+    Sin truncar, casi todos los valores son distintos y la tabla crecería con la entrada. Cuando la tabla
+    y lo pendiente superan MAX_DISTINCT se vuelcan a archivos temporales y los fragmentos siguientes se
+    agregan ahí; al final se binan por bloques desde un memmap, con el mismo resultado y memoria acotada.
+    """
+
+    # Cantidad de valores que se binan por bloque para no crear arreglos intermedios del tamaño de la entrada.
+    BLOCK_SIZE = 1 << 20
+    # Cantidad máxima de valores distintos que se guardan en memoria antes de volcarlos a disco (32 MiB).
+    MAX_DISTINCT = 1 << 21
+
+    def __init__(self, intervals_amount):
+        """
+        Inicializa un acumulador vacío.
+
+        Parámetros:
+            intervals_amount (int): Cantidad de intervalos.
+        """
+        if intervals_amount <= 1:
+            raise ValueError("intervals_amount must be greater than 1")
+        self.intervals_amount = intervals_amount
+        self.count = 0
+        self.values = np.empty(0)
+        self.weights = np.empty(0, dtype=np.int64)
+        self.pending = []
+        self.pending_size = 0
+        self.minimum = np.inf
+        self.maximum = -np.inf
+        self.spill_directory = None  # Carpeta temporal con los valores volcados, o None si caben en memoria
+
+    def update(self, values):
+        """
+        Agrega un fragmento de valores; los NaN se ignoran.
+
+        Parámetros:
+            values (array_like): Valores del fragmento.
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if not values.size:
+            return
+        unique, counts = np.unique(values, return_counts=True)
+        self.pending.append((unique, counts))
+        self.pending_size += unique.size
+        self.count += values.size
+        self.minimum = min(self.minimum, unique[0])
+        self.maximum = max(self.maximum, unique[-1])
+        # Se compacta solo cuando lo pendiente supera la tabla actual, así el costo total es amortizado, y
+        # nunca se acumula más de MAX_DISTINCT pendientes.
+        if self.pending_size > min(max(self.values.size, self.BLOCK_SIZE), self.MAX_DISTINCT):
+            self.compact()
+
+    def compact(self):
+        """
+        Une los fragmentos pendientes con la tabla de valores distintos o, si juntos podrían superar
+        MAX_DISTINCT, los agrega a disco sin unirlos.
+        """
+        if not self.pending:
+            return
+        if self.spill_directory is None and self.values.size + self.pending_size > self.MAX_DISTINCT:
+            self.spill_directory = tempfile.TemporaryDirectory(prefix='frequencies-')
+            self.pending.insert(0, (self.values, self.weights))
+            self.values = np.empty(0)
+            self.weights = np.empty(0, dtype=np.int64)
+        if self.spill_directory is not None:
+            self.spill(self.pending)
+        else:
+            values = np.concatenate([self.values] + [unique for unique, _ in self.pending])
+            weights = np.concatenate([self.weights] + [counts for _, counts in self.pending])
+            self.values, inverse = np.unique(values, return_inverse=True)
+            self.weights = np.bincount(inverse.ravel(), weights=weights,
+                                       minlength=self.values.size).astype(np.int64)
+        self.pending = []
+        self.pending_size = 0
+
+    def spill_paths(self):
+        """
+        Retorna:
+            tuple: Archivos temporales de los valores ('<f8') y de sus cantidades ('<i8').
+        """
+        return (os.path.join(self.spill_directory.name, 'values.f64'),
+                os.path.join(self.spill_directory.name, 'weights.i64'))
+
+    def spill(self, tables):
+        """
+        Agrega pares (valores, cantidades) al final de los archivos temporales.
+
+        Parámetros:
+            tables (list): Pares de arreglos de valores y de cantidades.
+        """
+        values_path, weights_path = self.spill_paths()
+        with open(values_path, 'ab') as values_file, open(weights_path, 'ab') as weights_file:
+            for values, weights in tables:
+                values.astype('<f8').tofile(values_file)
+                weights.astype('<i8').tofile(weights_file)
+
+    def result(self):
+        """
+        Calcula los intervalos y frecuencias de todos los valores acumulados.
+
+        Retorna:
+            tuple: Lista de intervalos y arreglo int64 de frecuencias.
+        """
+        self.compact()
+        if self.spill_directory is None:
+            return FrequencyAccumulator.bin_values(self.values, self.intervals_amount, self.weights)
+        values_path, weights_path = self.spill_paths()
+        values = np.memmap(values_path, dtype='<f8', mode='r')
+        weights = np.memmap(weights_path, dtype='<i8', mode='r')
+        return FrequencyAccumulator.bin_range(values, self.minimum, self.maximum, self.intervals_amount, weights)
+
+    @staticmethod
+    def calculate_intervals(minimum, maximum, intervals_amount):
+        """
+        Calcula el inicio de cada intervalo sumando su longitud de forma acumulada.
+
+        Parámetros:
+            minimum (float): Valor mínimo.
+            maximum (float): Valor máximo.
+            intervals_amount (int): Cantidad de intervalos.
+
+        Retorna:
+            list: Inicio de cada intervalo.
+        """
+        steps = np.full(intervals_amount, (maximum - minimum) / intervals_amount)
+        steps[0] = minimum
+        return np.cumsum(steps).tolist()
+
+    @staticmethod
+    def bin_values(values, intervals_amount, weights=None):
+        """
+        Calcula en un solo recorrido los intervalos y las frecuencias de un arreglo de valores.
+
+        Cada valor cae en el intervalo ``(valor - mínimo) // longitud``; el último intervalo incluye
+        el máximo. Los NaN se ignoran.
+
+        Parámetros:
+            values (array_like): Valores a clasificar.
+            intervals_amount (int): Cantidad de intervalos.
+            weights (array_like): Cantidad de veces que aparece cada valor; por defecto una.
+
+        Retorna:
+            tuple: Lista de intervalos y arreglo int64 de frecuencias.
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        nan = np.isnan(values)
+        if nan.any():
+            values = values[~nan]
+            weights = None if weights is None else np.asarray(weights)[~nan]
+        if not values.size:
+            raise ValueError("All ni_values are NaN")
+        return FrequencyAccumulator.bin_range(values, values.min(), values.max(), intervals_amount, weights)
+
+    @staticmethod
+    def bin_range(values, minimum, maximum, intervals_amount, weights=None):
+        """
+        Calcula los intervalos y las frecuencias de valores sin NaN cuyo mínimo y máximo ya se conocen,
+        recorriéndolos por bloques (sirve también para un memmap más grande que la memoria).
+
+        Parámetros:
+            values (numpy.ndarray): Valores float64 a clasificar, sin NaN.
+            minimum (float): Mínimo de los valores.
+            maximum (float): Máximo de los valores.
+            intervals_amount (int): Cantidad de intervalos.
+            weights (numpy.ndarray): Cantidad de veces que aparece cada valor; por defecto una.
+
+        Retorna:
+            tuple: Lista de intervalos y arreglo int64 de frecuencias.
+        """
+        intervals = FrequencyAccumulator.calculate_intervals(minimum, maximum, intervals_amount)
+        interval_size = intervals[1] - intervals[0]
+        if not interval_size > 0 or not np.isfinite(interval_size):
+            raise ValueError("ni_values must span a finite, non-empty range")
+
+        frequencies = np.zeros(intervals_amount, dtype=np.int64)
+        for start in range(0, values.size, FrequencyAccumulator.BLOCK_SIZE):
+            block = values[start:start + FrequencyAccumulator.BLOCK_SIZE]
+            indexes = np.floor_divide(block - minimum, interval_size)
+            np.minimum(indexes, intervals_amount - 1, out=indexes)
+            block_weights = None if weights is None else weights[start:start + FrequencyAccumulator.BLOCK_SIZE]
+            frequencies += np.bincount(indexes.astype(np.intp), weights=block_weights,
+                                       minlength=intervals_amount).astype(np.int64)
+        return intervals, frequencies
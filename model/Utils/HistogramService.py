@@ -0,0 +1,218 @@
+import math
+import weakref
+
+import numpy as np
+
+
+class Histogram:
+    """
+    Histograma de bins de igual ancho que se puede ampliar con nuevos valores sin recalcular los anteriores.
+
+    Los bordes quedan sobre la rejilla ``origin + k * width``. Si llegan valores fuera del rango se
+    agregan bins del mismo ancho y, si se supera el máximo de bins, se unen bins vecinos de a pares
+    (duplicando el ancho), por lo que los conteos siempre son exactos.
+    """
+
+    def __init__(self, origin, width, bins, max_bins):
+        """
+        Inicializa un histograma vacío.
+
+        Parámetros:
+            origin (float): Borde izquierdo del primer bin.
+            width (float): Ancho de cada bin.
+            bins (int): Cantidad inicial de bins.
+            max_bins (int): Cantidad máxima de bins.
+        """
+        self.origin = origin
+        self.width = width
+        self.max_bins = max_bins
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.total = 0
+
+    @property
+    def edges(self):
+        """
+        Retorna:
+            numpy.ndarray: Bordes de los bins (uno más que la cantidad de bins).
+        """
+        return self.origin + self.width * np.arange(len(self.counts) + 1)
+
+    def density(self):
+        """
+        Retorna:
+            numpy.ndarray: Conteos normalizados para que el área total sea 1, como ``density=True`` de NumPy.
+        """
+        if not self.total:
+            return np.zeros(len(self.counts))
+        return self.counts / (self.total * self.width)
+
+    def add(self, values, grow=True):
+        """
+        Agrega valores al histograma; los NaN e infinitos se ignoran.
+
+        Parámetros:
+            values (array_like): Valores nuevos.
+            grow (bool): Si es False no se amplía la rejilla y los valores fuera de ella se cuentan en
+                el primer o el último bin (se usa al construir, cuando la rejilla ya cubre los datos).
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[np.isfinite(values)]
+        if not values.size:
+            return
+        if grow:
+            self.extend(values.min(), values.max())
+        indexes = np.floor((values - self.origin) / self.width).astype(np.intp)
+        # El máximo cae justo en el borde derecho; se cuenta en el último bin, igual que np.histogram.
+        np.clip(indexes, 0, len(self.counts) - 1, out=indexes)
+        self.counts += np.bincount(indexes, minlength=len(self.counts))
+        self.total += values.size
+
+    def extend(self, minimum, maximum):
+        """
+        Amplía la rejilla hasta cubrir ``[minimum, maximum]`` conservando los conteos.
+
+        Parámetros:
+            minimum (float): Valor mínimo a cubrir.
+            maximum (float): Valor máximo a cubrir.
+        """
+        left = max(0, math.ceil((self.origin - minimum) / self.width))
+        right = max(0, math.ceil((maximum - self.origin) / self.width) - len(self.counts))
+        if left or right:
+            self.counts = np.concatenate((np.zeros(left, dtype=np.int64), self.counts,
+                                          np.zeros(right, dtype=np.int64)))
+            self.origin -= left * self.width
+        while len(self.counts) > self.max_bins:
+            if len(self.counts) % 2:
+                self.counts = np.append(self.counts, 0)
+            self.counts = self.counts[0::2] + self.counts[1::2]
+            self.width *= 2
+
+
+class HistogramService:
+    """
+    Calcula histogramas para las gráficas eligiendo una cantidad razonable de bins y guardando los
+    resultados por conjunto de datos, para no recalcularlos en cada actualización.
+    """
+
+    def __init__(self, max_bins=512):
+        """
+        Inicializa el servicio.
+
+        Parámetros:
+            max_bins (int): Límite de bins cuando la cantidad se elige automáticamente.
+        """
+        self.max_bins = max_bins
+        self.cache = {}
+
+    @staticmethod
+    def freedman_diaconis_bins(values, max_bins):
+        """
+        Elige la cantidad de bins con la regla de Freedman–Diaconis: ancho ``2 * IQR / n^(1/3)``.
+
+        Si el rango intercuartílico es cero se usa la regla de Sturges.
+
+        Parámetros:
+            values (numpy.ndarray): Valores finitos.
+            max_bins (int): Cantidad máxima de bins.
+
+        Retorna:
+            int: Cantidad de bins entre 1 y max_bins.
+        """
+        size = values.size
+        if size < 2:
+            return 1
+        value_range = values.max() - values.min()
+        if value_range <= 0:
+            return 1
+        q1, q3 = np.percentile(values, [25, 75])
+        if q3 > q1:
+            bins = math.ceil(value_range / (2 * (q3 - q1) / size ** (1 / 3)))
+        else:
+            bins = math.ceil(math.log2(size)) + 1
+        return int(min(max(bins, 1), max_bins))
+
+    def histogram(self, values, bins=None, key=None):
+        """
+        Retorna el histograma de un conjunto de datos, reutilizando el cálculo anterior si no cambió.
+
+        Un arreglo de NumPy no crece en su lugar, así que datos nuevos siempre llegan en otro arreglo y se
+        recalculan; para sumar fragmentos sin recalcular lo anterior se usa update.
+
+        Parámetros:
+            values (array_like): Datos.
+            bins (int): Cantidad de bins; por defecto se elige con Freedman–Diaconis hasta max_bins.
+            key (hashable): Identificador del conjunto de datos; por defecto el propio arreglo.
+
+        Retorna:
+            Histogram: Histograma con conteos y bordes.
+        """
+        key = ('array', id(values)) if key is None else key
+        entry = self.cache.get(key)
+        if entry is not None:
+            source, histogram, size, requested = entry
+            if source() is values and requested == bins and len(values) == size:
+                return histogram
+
+        histogram = self.build(np.asarray(values, dtype=np.float64), bins)
+        try:
+            source = weakref.ref(values)
+        except TypeError:
+            source = (lambda: None)
+        # Se descartan los histogramas de arreglos que ya no existen.
+        for stale in [cached for cached, (ref, *_) in self.cache.items()
+                      if cached[0:1] == ('array',) and ref() is None]:
+            del self.cache[stale]
+        self.cache[key] = (source, histogram, len(values), bins)
+        return histogram
+
+    def update(self, key, chunk, bins=None):
+        """
+        Agrega un fragmento de datos al histograma de un flujo identificado por key.
+
+        Parámetros:
+            key (hashable): Identificador del flujo.
+            chunk (array_like): Valores nuevos.
+            bins (int): Cantidad de bins inicial si es el primer fragmento.
+
+        Retorna:
+            Histogram: Histograma acumulado del flujo.
+        """
+        entry = self.cache.get(key)
+        if entry is None:
+            histogram = self.build(np.asarray(chunk, dtype=np.float64), bins)
+            self.cache[key] = ((lambda: None), histogram, 0, bins)
+            return histogram
+        entry[1].add(chunk)
+        return entry[1]
+
+    def build(self, values, bins=None):
+        """
+        Crea un histograma nuevo a partir de un arreglo completo.
+
+        Parámetros:
+            values (numpy.ndarray): Datos.
+            bins (int): Cantidad de bins; por defecto se elige con Freedman–Diaconis.
+
+        Retorna:
+            Histogram: Histograma con los datos.
+        """
+        finite = values[np.isfinite(values)]
+        max_bins = max(bins or self.max_bins, 1)
+        count = bins if bins else self.freedman_diaconis_bins(finite, max_bins)
+        if finite.size:
+            minimum, maximum = finite.min(), finite.max()
+        else:
+            minimum, maximum = 0.0, 1.0
+        width = (maximum - minimum) / count if maximum > minimum else 1.0
+        histogram = Histogram(minimum, width, count, max_bins)
+        histogram.add(finite, grow=False)
+        return histogram
+
+    def forget(self, key):
+        """
+        Elimina del caché el histograma de un conjunto de datos.
+
+        Parámetros:
+            key (hashable): Identificador usado al calcularlo.
+        """
+        self.cache.pop(key, None)
@@ -0,0 +1,231 @@
+import json
+import logging
+import threading
+import time
+
+
+class Stage:
+    """
+    Etapa medida: cronometra el bloque ``with`` y acumula contadores (valores producidos, filtrados,
+    bytes escritos...). Al salir envía un registro a los destinos de su Instrumentation.
+    """
+
+    def __init__(self, instrumentation, name, fields):
+        """
+        Inicializa la etapa sin iniciarla.
+
+        Parámetros:
+            instrumentation (Instrumentation): Instrumentación que recibe el registro.
+            name (str): Nombre de la etapa.
+            fields (dict): Datos adicionales del registro, por ejemplo los parámetros.
+        """
+        self.instrumentation = instrumentation
+        self.name = name
+        self.fields = fields
+        self.counters = {}
+        self.parent = None
+        self.start = None
+
+    def count(self, counter, amount=1):
+        """
+        Suma una cantidad a un contador de la etapa.
+
+        Parámetros:
+            counter (str): Nombre del contador.
+            amount (int): Cantidad a sumar.
+        """
+        self.counters[counter] = self.counters.get(counter, 0) + int(amount)
+
+    def __enter__(self):
+        self.parent = self.instrumentation.push(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, error_type, error, traceback):
+        seconds = time.perf_counter() - self.start
+        self.instrumentation.pop(self)
+        record = {
+            'stage': self.name,
+            'parent': self.parent.name if self.parent is not None else None,
+            'seconds': seconds,
+            'counters': self.counters,
+            'error': error_type.__name__ if error_type is not None else None,
+        }
+        record.update(self.fields)
+        self.instrumentation.emit(record)
+        return False
+
+
+class DisabledStage:
+    """
+    Etapa que no mide nada; se usa cuando la instrumentación está desactivada para que el costo sea
+    solo el de entrar y salir de un ``with``.
+    """
+
+    def count(self, counter, amount=1):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, error_type, error, traceback):
+        return False
+
+
+DISABLED_STAGE = DisabledStage()
+
+
+class Instrumentation:
+    """
+    Mide el tiempo de las etapas de una generación (cálculo, filtrado, mapeo a Ni, escritura,
+    dibujo) y sus contadores, y envía un registro por etapa a los destinos configurados.
+
+    Un destino es cualquier función que recibe el registro (un dict); LogSink y JsonLinesSink
+    cubren los casos comunes. Sin destinos la instrumentación está desactivada y stage retorna
+    una etapa vacía.
+    """
+
+    def __init__(self, sinks=()):
+        """
+        Inicializa la instrumentación.
+
+        Parámetros:
+            sinks (iterable): Destinos de los registros.
+        """
+        self.sinks = list(sinks)
+        self.local = threading.local()
+
+    @property
+    def enabled(self):
+        """
+        Retorna:
+            bool: True si hay al menos un destino.
+        """
+        return bool(self.sinks)
+
+    def add_sink(self, sink):
+        """
+        Agrega un destino de registros.
+
+        Parámetros:
+            sink (callable): Función que recibe cada registro.
+        """
+        self.sinks = self.sinks + [sink]
+
+    def remove_sink(self, sink):
+        """
+        Quita un destino de registros.
+
+        Parámetros:
+            sink (callable): Destino agregado antes.
+        """
+        self.sinks = [current for current in self.sinks if current is not sink]
+
+    def stage(self, name, **fields):
+        """
+        Crea una etapa para usar con ``with``.
+
+        Parámetros:
+            name (str): Nombre de la etapa.
+            **fields: Datos adicionales del registro.
+
+        Retorna:
+            Stage | DisabledStage: Etapa que se mide al salir del bloque.
+        """
+        if not self.sinks:
+            return DISABLED_STAGE
+        return Stage(self, name, fields)
+
+    @staticmethod
+    def measure(instrumentation, name, **fields):
+        """
+        Llama a stage solo si hay una instrumentación, para que los métodos acepten ``instrumentation=None``.
+
+        Parámetros:
+            instrumentation (Instrumentation | None): Instrumentación del método.
+            name (str): Nombre de la etapa.
+            **fields: Datos adicionales del registro.
+
+        Retorna:
+            Stage | DisabledStage: Etapa para usar con ``with``.
+        """
+        if instrumentation is None:
+            return DISABLED_STAGE
+        return instrumentation.stage(name, **fields)
+
+    def push(self, stage):
+        """
+        Marca una etapa como la actual del hilo.
+
+        Parámetros:
+            stage (Stage): Etapa que empieza.
+
+        Retorna:
+            Stage | None: Etapa que la contiene.
+        """
+        stack = getattr(self.local, 'stack', None)
+        if stack is None:
+            stack = self.local.stack = []
+        parent = stack[-1] if stack else None
+        stack.append(stage)
+        return parent
+
+    def pop(self, stage):
+        """
+        Quita una etapa terminada de las etapas actuales del hilo.
+
+        Parámetros:
+            stage (Stage): Etapa que termina.
+        """
+        stack = self.local.stack
+        if stack and stack[-1] is stage:
+            stack.pop()
+
+    def emit(self, record):
+        """
+        Envía un registro a todos los destinos.
+
+        Parámetros:
+            record (dict): Registro de una etapa.
+        """
+        for sink in self.sinks:
+            sink(record)
+
+
+class LogSink:
+    """
+    Destino que escribe cada registro con el módulo logging.
+    """
+
+    def __init__(self, logger=None, level=logging.INFO):
+        """
+        Parámetros:
+            logger (logging.Logger): Logger a usar; por defecto el de este módulo.
+            level (int): Nivel de los mensajes.
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.level = level
+
+    def __call__(self, record):
+        counters = ' '.join(f'{name}={value}' for name, value in record['counters'].items())
+        self.logger.log(self.level, "%s %.6f s %s", record['stage'], record['seconds'], counters)
+
+
+class JsonLinesSink:
+    """
+    Destino que agrega cada registro como una línea JSON a un archivo.
+    """
+
+    def __init__(self, path):
+        """
+        Parámetros:
+            path (str): Archivo al que se agregan los registros.
+        """
+        self.path = path
+        self.lock = threading.Lock()
+
+    def __call__(self, record):
+        line = json.dumps(record, default=str) + '\n'
+        with self.lock:
+            with open(self.path, 'a') as file:
+                file.write(line)
@@ -1,7 +1,24 @@
+import numpy as np
+
+
 class MathUtils:
     """
     Clase de utilidades matemáticas que proporciona métodos estáticos para operaciones matemáticas comunes.
     """
+    # Constante de Dekker (2^27 + 1) para dividir un float64 en dos mitades de 26 bits.
+    _SPLITTER = 134217729.0
+
+    # Coeficientes de la aproximación racional de Acklam para la inversa de la normal estándar.
+    _ACKLAM_A = (-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02,
+                 1.383577518672690e+02, -3.066479806614716e+01, 2.506628277459239e+00)
+    _ACKLAM_B = (-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02,
+                 6.680131188771972e+01, -1.328068155288572e+01)
+    _ACKLAM_C = (-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00,
+                 -2.549732539343734e+00, 4.374664141464968e+00, 2.938163982698783e+00)
+    _ACKLAM_D = (7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00,
+                 3.754408661907416e+00)
+    _ACKLAM_LOW = 0.02425
+
     @staticmethod
     def truncate(number):
         """
@@ -14,3 +31,246 @@ class MathUtils:
             float: El número truncado a 5 decimales.
         """
         return float(f'{number:.5f}')
+
+    @staticmethod
+    def truncate_array(values, decimals=5):
+        """
+        Trunca un arreglo completo de números a la cantidad de decimales indicada.
+
+        El resultado es idéntico, bit a bit, a aplicar ``float(f'{x:.{decimals}f}')`` a cada elemento:
+        el producto ``x * 10^decimals`` se calcula de forma exacta (producto de Dekker) para decidir el
+        redondeo mitad-a-par sobre el valor binario real, y el cociente final ``N / 10^decimals`` es el
+        mismo que obtiene ``float`` al leer la cadena decimal.
+
+        Parámetros:
+            values (array_like): Números a truncar.
+            decimals (int | None): Cantidad de decimales a conservar. Con None no se trunca y se
+                conserva la precisión completa.
+
+        Retorna:
+            numpy.ndarray: Arreglo float64 con los números truncados.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if decimals is None:
+            return values
+        x = values.ravel()
+        scale = float(10 ** decimals)
+        with np.errstate(invalid='ignore', over='ignore'):
+            result, fallback = MathUtils._round_half_even(x, scale)
+
+        # Valores no finitos y magnitudes donde N ya no es un entero exacto se resuelven como el caso escalar.
+        if fallback.any():
+            result[fallback] = [float(f'{number:.{decimals}f}') for number in x[fallback].tolist()]
+        return result.reshape(values.shape)
+
+    @staticmethod
+    def _round_half_even(x, scale):
+        """
+        Redondea ``x * scale`` al entero más cercano (mitad a par) usando el valor exacto del producto.
+
+        Retorna:
+            tuple: Arreglo con ``N / scale`` y máscara de los elementos que deben resolverse de forma escalar.
+        """
+        # Los temporales se reutilizan en el lugar: con arreglos grandes el costo es el de recorrer la memoria.
+        p = x * scale
+        n = np.floor(p)
+        d = np.subtract(p, n)
+        d -= 0.5
+        n += d > 0
+
+        # Solo los productos cercanos a un empate necesitan el error exacto: x * scale == p + e.
+        near = np.flatnonzero(np.abs(d, out=d) < 2.0 ** -20)
+        if near.size:
+            xs = x[near]
+            ps = p[near]
+            x_split = MathUtils._SPLITTER * xs
+            x_hi = x_split - (x_split - xs)
+            x_lo = xs - x_hi
+            s_split = MathUtils._SPLITTER * scale
+            s_hi = s_split - (s_split - scale)
+            s_lo = scale - s_hi
+            e = (((x_hi * s_hi - ps) + x_hi * s_lo) + x_lo * s_hi) + x_lo * s_lo
+            base = np.floor(ps)
+            exact = ((ps - base) - 0.5) + e
+            tie_up = (exact == 0) & (np.fmod(base, 2) != 0)
+            n[near] = np.where((exact > 0) | tie_up, base + 1, base)
+        n /= scale
+        return np.copysign(n, x, out=n), ~(np.abs(p, out=p) < 2.0 ** 52)
+
+    @staticmethod
+    def inverse_normal_cdf(probabilities):
+        """
+        Aproxima la inversa de la distribución normal estándar para un arreglo completo de probabilidades.
+
+        Usa la aproximación racional de Acklam: un cociente de polinomios en la región central
+        ``0.02425 <= p <= 0.97575`` y otro en ``sqrt(-2 log p)`` en las colas. El error relativo
+        absoluto es menor que 1.15e-9 en todo ``(0, 1)``, por lo que con 5 decimales el resultado
+        solo puede diferir de ``norm.ppf`` en la última cifra cuando el valor cae justo en un límite
+        de redondeo.
+
+        Parámetros:
+            probabilities (array_like): Probabilidades a transformar.
+
+        Retorna:
+            numpy.ndarray: Cuantiles float64; -inf para 0, inf para 1 y NaN fuera de [0, 1].
+        """
+        shape = np.shape(probabilities)
+        p = np.asarray(probabilities, dtype=np.float64).ravel()
+        a, b, c, d = MathUtils._ACKLAM_A, MathUtils._ACKLAM_B, MathUtils._ACKLAM_C, MathUtils._ACKLAM_D
+        # La fórmula central se evalúa sobre todo el arreglo (no hace falta separar el ~95 % de valores que
+        # le corresponden) y la de las colas solo sobre sus elementos, que son los que pagan el logaritmo.
+        with np.errstate(invalid='ignore', over='ignore'):
+            result = MathUtils._acklam_central(p, a, b)
+        low_limit, high_limit = MathUtils._ACKLAM_LOW, 1 - MathUtils._ACKLAM_LOW
+        tails = np.flatnonzero(((p > 0) & (p < low_limit)) | ((p > high_limit) & (p < 1)))
+        if tails.size:
+            tail_p = p[tails]
+            low = tail_p < 0.5
+            s = np.sqrt(-2 * np.log(np.where(low, tail_p, 1 - tail_p)))
+            s = ((((((c[0] * s + c[1]) * s + c[2]) * s + c[3]) * s + c[4]) * s + c[5]) /
+                 ((((d[0] * s + d[1]) * s + d[2]) * s + d[3]) * s + 1))
+            result[tails] = np.where(low, s, -s)
+        result[~((p >= 0) & (p <= 1))] = np.nan
+        result[p == 0] = -np.inf
+        result[p == 1] = np.inf
+        return result.reshape(shape)
+
+    @staticmethod
+    def _acklam_central(p, a, b):
+        """
+        Evalúa la fórmula central de Acklam sobre todo el arreglo, en el lugar para no crear temporales.
+
+        Retorna:
+            numpy.ndarray: Cocientes de la región central (los de las colas se reemplazan después).
+        """
+        q = p - 0.5
+        r = q * q
+        result = a[0] * r
+        result += a[1]
+        for coefficient in a[2:]:
+            result *= r
+            result += coefficient
+        result *= q
+        denominator = b[0] * r
+        denominator += b[1]
+        for coefficient in b[2:]:
+            denominator *= r
+            denominator += coefficient
+        denominator *= r
+        denominator += 1
+        result /= denominator
+        return result
+
+    @staticmethod
+    def affine_coefficients(a, c, steps):
+        """
+        Calcula los coeficientes de las primeras potencias del mapa afín ``x -> a * x + c``.
+
+        Los coeficientes se obtienen duplicando la recurrencia (``F^(L + j) = F^j o F^L``) y se
+        guardan módulo 2^64, por lo que sirven para cualquier módulo ``m = 2^g`` con ``g <= 64``.
+
+        Parámetros:
+            a (int): Multiplicador.
+            c (int): Incremento.
+            steps (int): Cantidad de potencias a calcular.
+
+        Retorna:
+            tuple: Arreglos uint64 ``A`` y ``C`` tales que ``X_j = A[j - 1] * X_0 + C[j - 1]``.
+        """
+        mask = (1 << 64) - 1
+        multipliers = np.empty(steps, dtype=np.uint64)
+        increments = np.empty(steps, dtype=np.uint64)
+        multipliers[0] = a & mask
+        increments[0] = c & mask
+        length = 1
+        while length < steps:
+            size = min(length, steps - length)
+            a_length = multipliers[length - 1]
+            c_length = increments[length - 1]
+            multipliers[length:length + size] = multipliers[:size] * a_length
+            increments[length:length + size] = multipliers[:size] * c_length + increments[:size]
+            length += size
+        return multipliers, increments
+
+    @staticmethod
+    def affine_jump(a, c, m, steps):
+        """
+        Calcula los coeficientes del mapa afín ``x -> a * x + c (mod m)`` aplicado ``steps`` veces.
+
+        Usa exponenciación por cuadrados sobre la composición de mapas afines, por lo que el costo es
+        O(log steps) multiplicaciones modulares.
+
+        Parámetros:
+            a (int): Multiplicador.
+            c (int): Incremento.
+            m (int): Módulo.
+            steps (int): Cantidad de pasos a saltar.
+
+        Retorna:
+            tuple: Coeficientes ``(A, C)`` tales que ``X_steps = (A * X_0 + C) % m``.
+        """
+        if steps < 0:
+            raise ValueError("steps must be non-negative")
+        m = int(m)
+        jump_a, jump_c = 1 % m, 0
+        power_a, power_c = a % m, c % m
+        while steps:
+            if steps & 1:
+                jump_a, jump_c = (power_a * jump_a) % m, (power_a * jump_c + power_c) % m
+            power_a, power_c = (power_a * power_a) % m, (power_a * power_c + power_c) % m
+            steps >>= 1
+        return jump_a, jump_c
+
+    @staticmethod
+    def split_lengths(total, parts):
+        """
+        Reparte ``total`` elementos en ``parts`` tramos consecutivos de tamaño casi igual.
+
+        Parámetros:
+            total (int): Cantidad total de elementos.
+            parts (int): Cantidad de tramos.
+
+        Retorna:
+            list: Lista de tuplas ``(inicio, longitud)`` de cada tramo.
+        """
+        if parts < 1:
+            raise ValueError("parts must be at least 1")
+        base, remainder = divmod(total, parts)
+        ranges = []
+        start = 0
+        for i in range(parts):
+            length = base + (1 if i < remainder else 0)
+            ranges.append((start, length))
+            start += length
+        return ranges
+
+    @staticmethod
+    def rechunk(batches, chunk_size):
+        """
+        Reagrupa una secuencia de lotes de arreglos paralelos en fragmentos de tamaño fijo.
+
+        Parámetros:
+            batches (iterable): Tuplas de arreglos de igual longitud, de tamaño variable.
+            chunk_size (int): Cantidad de filas por fragmento (el último puede ser menor).
+
+        Retorna:
+            generator: Tuplas de arreglos con exactamente chunk_size filas.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        pending = []
+        pending_size = 0
+        for batch in batches:
+            offset = 0
+            size = len(batch[0])
+            while offset < size:
+                take = min(chunk_size - pending_size, size - offset)
+                pending.append(tuple(array[offset:offset + take] for array in batch))
+                pending_size += take
+                offset += take
+                if pending_size == chunk_size:
+                    yield tuple(np.concatenate(columns) for columns in zip(*pending))
+                    pending = []
+                    pending_size = 0
+        if pending:
+            yield tuple(np.concatenate(columns) for columns in zip(*pending))
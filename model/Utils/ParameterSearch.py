@@ -0,0 +1,337 @@
+import json
+import math
+import os
+import random
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from model.Utils.Instrumentation import Instrumentation
+from model.Utils.PeriodAnalyzer import PeriodAnalyzer
+from model.Utils.ProgressReporter import ProgressReporter
+from model.Utils.SpectralTest import SpectralTest
+
+
+def _evaluate_batch(method, g, c, dimensions, batch, values, threshold):
+    """
+    Evalúa un lote de candidatos dentro de un proceso del pool.
+
+    Parámetros:
+        method (str): "lc" (variable k) o "mc" (variable t).
+        g (int): Exponente del módulo.
+        c (int): Incremento del método lineal congruencial.
+        dimensions (int): Dimensión máxima de la prueba espectral.
+        batch (int): Número de lote.
+        values (list): Candidatos del lote.
+        threshold (float): Puntaje por debajo del cual un candidato se descarta.
+
+    Retorna:
+        tuple: Número de lote, candidatos que superaron el umbral y cantidad de descartados.
+    """
+    results = []
+    pruned = 0
+    for value in values:
+        result = ParameterSearch.evaluate(method, value, g, c, dimensions, threshold)
+        if result is None:
+            pruned += 1
+        else:
+            results.append(result)
+    return batch, results, pruned
+
+
+class ParameterSearch:
+    """
+    Busca los mejores valores de k (lineal congruencial, ``a = 1 + 2k``) o t (multiplicativo congruencial,
+    ``a = 8t + 3``) para un g dado, ordenados por el peor puntaje de la prueba espectral entre las
+    dimensiones 2 a 8.
+
+    Solo se conservan candidatos con periodo completo: en el lineal congruencial eso exige k par (a ≡ 1
+    mod 4) y c impar; el multiplicativo siempre alcanza m/4 con semilla impar. Un candidato se descarta en
+    cuanto una dimensión queda por debajo del peor puntaje del top actual, sin calcular las siguientes.
+
+    Los candidatos no se recorren en orden: los k o t chicos dan multiplicadores chicos, que son los peores
+    en la prueba espectral, y una búsqueda interrumpida no habría visto ningún candidato bueno. El j-ésimo
+    candidato es ``start + (step * j + offset) mod n``, con n la cantidad de candidatos, step coprimo con n
+    cerca de n/φ y offset elegido con la semilla; así cada prefijo de la búsqueda es una muestra repartida
+    por todo el rango y la búsqueda completa igual evalúa cada candidato una sola vez.
+
+    Los candidatos se reparten en lotes entre procesos y, si se indica un archivo de punto de control,
+    cada lote terminado se guarda en él; al repetir la búsqueda con el mismo archivo se retoma donde quedó.
+    """
+
+    VARIABLES = {'lc': 'k', 'mc': 't'}
+
+    def __init__(self, method, g, c=1, top=10, start=0, stop=None, dimensions=SpectralTest.MAX_DIMENSIONS,
+                 min_score=0.0, batch_size=1024, seed=0):
+        """
+        Inicializa la búsqueda.
+
+        Parámetros:
+            method (str): "lc" o "mc".
+            g (int): Exponente del módulo.
+            c (int): Incremento del método lineal congruencial (debe ser impar); se ignora con "mc".
+            top (int): Cantidad de parámetros a conservar.
+            start (int): Primer valor de k o t a evaluar.
+            stop (int): Valor siguiente al último; por defecto todos los multiplicadores menores que m.
+            dimensions (int): Dimensión máxima de la prueba espectral, entre 2 y 8.
+            min_score (float): Puntaje mínimo para entrar al top.
+            batch_size (int): Candidatos por lote; también es la frecuencia del punto de control.
+            seed (int): Semilla del orden en que se recorren los candidatos.
+        """
+        if method not in self.VARIABLES:
+            raise ValueError("method must be 'lc' or 'mc'")
+        if method == 'lc' and c % 2 == 0:
+            raise ValueError("c must be odd for a full period")
+        if method == 'mc' and g < 3:
+            raise ValueError("g must be at least 3")
+        if not 2 <= dimensions <= SpectralTest.MAX_DIMENSIONS:
+            raise ValueError("dimensions must be between 2 and 8")
+        if top < 1 or batch_size < 1:
+            raise ValueError("top and batch_size must be positive")
+        # a < m: k < 2^(g-1) en el lineal y t < 2^(g-3) en el multiplicativo.
+        limit = 2 ** (g - 1) if method == 'lc' else 2 ** (g - 3)
+        self.method = method
+        self.g = g
+        self.c = c if method == 'lc' else 0
+        self.top = top
+        self.start = max(start, 0)
+        self.stop = limit if stop is None else min(stop, limit)
+        self.dimensions = dimensions
+        self.min_score = min_score
+        self.batch_size = batch_size
+        self.seed = seed
+        self.size = max(self.stop - self.start, 0)
+        self.step = self.scatter_step(self.size)
+        self.offset = random.Random(seed).randrange(self.size) if self.size else 0
+        self.best = []
+        self.completed_batches = 0  # Todos los lotes anteriores a este ya terminaron
+        self.completed_ahead = set()  # Lotes terminados después de completed_batches (a lo sumo los que corren)
+        self.evaluated = 0
+        self.pruned = 0
+
+    @staticmethod
+    def evaluate(method, value, g, c=1, dimensions=SpectralTest.MAX_DIMENSIONS, threshold=0.0):
+        """
+        Evalúa un candidato.
+
+        Parámetros:
+            method (str): "lc" o "mc".
+            value (int): k o t.
+            g (int): Exponente del módulo.
+            c (int): Incremento del método lineal congruencial.
+            dimensions (int): Dimensión máxima de la prueba espectral.
+            threshold (float): Puntaje por debajo del cual el candidato se descarta.
+
+        Retorna:
+            dict | None: Parámetros, periodo y puntajes, o None si se descartó.
+        """
+        if method == 'lc':
+            a, m = 1 + 2 * value, 2 ** g
+            if not all(PeriodAnalyzer.hull_dobell(a, c, m).values()):
+                return None
+            period, lattice_modulus = m, m
+        else:
+            # La órbita de una semilla impar tiene m/4 puntos sobre la red de módulo m/2 (ver
+            # SpectralTest.analyze_multiplicative_congruential).
+            a, m = 8 * value + 3, 2 ** g
+            period, lattice_modulus = m // 4, m // 2
+        scores = []
+        for t, square in SpectralTest.iter_shortest_vectors(a, lattice_modulus, dimensions):
+            score = SpectralTest.score(t, square, lattice_modulus)
+            if score < threshold:
+                return None
+            scores.append(score)
+        return {ParameterSearch.VARIABLES[method]: value, 'multiplier': a, 'increment': c if method == 'lc' else 0,
+                'modulus': m, 'period': period, 'full_period': True, 'worst_score': min(scores),
+                'scores': scores}
+
+    @property
+    def threshold(self):
+        """
+        Retorna:
+            float: Puntaje que debe superar un candidato para entrar al top.
+        """
+        if len(self.best) < self.top:
+            return self.min_score
+        return max(self.min_score, self.best[-1]['worst_score'])
+
+    @staticmethod
+    def scatter_step(size):
+        """
+        Retorna:
+            int: Paso coprimo con size más cercano (desde arriba) a size/φ, para que los candidatos
+            consecutivos queden lejos entre sí y se recorran todos.
+        """
+        if size <= 1:
+            return 1
+        step = round(size * (math.sqrt(5) - 1) / 2)
+        while math.gcd(step, size) != 1:
+            step += 1
+        return step
+
+    @property
+    def total_batches(self):
+        """
+        Retorna:
+            int: Cantidad de lotes de la búsqueda.
+        """
+        return -(-self.size // self.batch_size)
+
+    def pending_batches(self):
+        """
+        Recorre los lotes que faltan por evaluar sin armar una lista, porque con g grande puede haber
+        miles de millones.
+
+        Retorna:
+            generator: Números de lote pendientes, en orden.
+        """
+        for batch in range(self.completed_batches, self.total_batches):
+            if batch not in self.completed_ahead:
+                yield batch
+
+    def batch_values(self, batch):
+        """
+        Parámetros:
+            batch (int): Número de lote.
+
+        Retorna:
+            list: Valores de k o t del lote, en el orden disperso de la búsqueda.
+        """
+        first = batch * self.batch_size
+        last = min(first + self.batch_size, self.size)
+        return [self.start + (self.step * j + self.offset) % self.size for j in range(first, last)]
+
+    def mark_completed(self, batch):
+        """
+        Registra un lote terminado y avanza completed_batches mientras los lotes siguientes también lo estén.
+
+        Parámetros:
+            batch (int): Número de lote.
+        """
+        self.completed_ahead.add(batch)
+        while self.completed_batches in self.completed_ahead:
+            self.completed_ahead.remove(self.completed_batches)
+            self.completed_batches += 1
+
+    def add_results(self, results):
+        """
+        Agrega candidatos al top, ordenado por peor puntaje y después por puntaje promedio.
+
+        Parámetros:
+            results (list): Candidatos evaluados.
+        """
+        self.best = sorted(self.best + results, key=lambda result: (-result['worst_score'],
+                                                                    -sum(result['scores']) / len(result['scores']),
+                                                                    result['multiplier']))[:self.top]
+
+    def parameters(self):
+        """
+        Retorna:
+            dict: Parámetros que identifican la búsqueda en un punto de control.
+        """
+        return {'method': self.method, 'g': self.g, 'c': self.c, 'top': self.top, 'start': self.start,
+                'stop': self.stop, 'dimensions': self.dimensions, 'min_score': self.min_score,
+                'batch_size': self.batch_size, 'seed': self.seed}
+
+    def result(self):
+        """
+        Retorna:
+            dict: Parámetros, avance y mejores candidatos encontrados hasta ahora.
+        """
+        state = self.parameters()
+        state.update({'evaluated': self.evaluated, 'pruned': self.pruned, 'total_batches': self.total_batches,
+                      'completed_batches': self.completed_batches, 'completed_ahead': sorted(self.completed_ahead),
+                      'complete': self.completed_batches >= self.total_batches, 'best': self.best})
+        return state
+
+    def load_checkpoint(self, path):
+        """
+        Retoma una búsqueda desde un punto de control, si el archivo existe.
+
+        Parámetros:
+            path (str): Archivo JSON del punto de control.
+        """
+        if not os.path.exists(path):
+            return
+        with open(path) as file:
+            state = json.load(file)
+        saved = {name: state.get(name) for name in self.parameters()}
+        if saved != self.parameters():
+            raise ValueError(f"checkpoint {path} belongs to a different search: {saved}")
+        self.best = state['best']
+        self.completed_batches = state['completed_batches']
+        self.completed_ahead = set(state['completed_ahead'])
+        self.evaluated = state['evaluated']
+        self.pruned = state['pruned']
+
+    def save_checkpoint(self, path):
+        """
+        Guarda el estado de la búsqueda en un archivo temporal y lo reemplaza, para que una interrupción
+        nunca deje un punto de control incompleto.
+
+        Parámetros:
+            path (str): Archivo JSON del punto de control.
+        """
+        temporary = path + '.tmp'
+        with open(temporary, 'w') as file:
+            json.dump(self.result(), file, indent=2)
+        os.replace(temporary, path)
+
+    def run(self, workers=None, checkpoint=None, progress=None, instrumentation=None):
+        """
+        Evalúa los lotes pendientes.
+
+        Parámetros:
+            workers (int): Cantidad de procesos; por defecto la cantidad de núcleos. Con 1 no se crea un pool.
+            checkpoint (str): Archivo JSON del punto de control; None para no guardarlo.
+            progress (ProgressReporter): Recibe la cantidad de candidatos evaluados y permite cancelar; al
+                cancelar, los lotes terminados ya quedaron en el punto de control.
+            instrumentation (Instrumentation): Recibe el tiempo y los contadores de la búsqueda.
+
+        Retorna:
+            dict: Resultado de result.
+        """
+        if checkpoint is not None:
+            self.load_checkpoint(checkpoint)
+        workers = workers or os.cpu_count() or 1
+        with Instrumentation.measure(instrumentation, 'parameter_search', method=self.method, g=self.g) as stage:
+            ProgressReporter.notify(progress, self.evaluated, self.size)
+
+            def finish(outcome):
+                batch, results, pruned = outcome
+                length = min(self.batch_size, self.size - batch * self.batch_size)
+                self.add_results(results)
+                self.mark_completed(batch)
+                self.evaluated += length
+                self.pruned += pruned
+                stage.count('candidates_evaluated', length)
+                stage.count('candidates_pruned', pruned)
+                if checkpoint is not None:
+                    self.save_checkpoint(checkpoint)
+                ProgressReporter.notify(progress, self.evaluated, self.size)
+
+            if workers == 1:
+                for batch in self.pending_batches():
+                    finish(_evaluate_batch(self.method, self.g, self.c, self.dimensions, batch,
+                                           self.batch_values(batch), self.threshold))
+            else:
+                # Solo se envían unos pocos lotes por proceso a la vez, para que los siguientes usen el
+                # umbral del top actualizado y se descarten antes.
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    queue = self.pending_batches()
+                    running = set()
+                    try:
+                        while True:
+                            for batch in queue:
+                                running.add(executor.submit(_evaluate_batch, self.method, self.g, self.c,
+                                                            self.dimensions, batch, self.batch_values(batch),
+                                                            self.threshold))
+                                if len(running) >= 2 * workers:
+                                    break
+                            if not running:
+                                break
+                            finished, running = wait(running, return_when=FIRST_COMPLETED)
+                            for future in finished:
+                                finish(future.result())
+                    finally:
+                        for future in running:
+                            future.cancel()
+        return self.result()
@@ -0,0 +1,127 @@
+import math
+
+
+class PeriodAnalyzer:
+    """
+    Calcula el periodo exacto de los generadores congruenciales sin recorrer la secuencia.
+
+    Con módulo ``m = 2^g`` y multiplicador impar el mapa ``x -> a * x + c (mod m)`` es una biyección
+    cuyo grupo tiene orden potencia de 2, así que el ciclo de cualquier semilla mide ``2^j`` para algún
+    ``j <= g``. Basta con componer el mapa consigo mismo (``F^(2^(j+1)) = F^(2^j) ∘ F^(2^j)``) hasta
+    que la semilla vuelva a sí misma: g composiciones en lugar de hasta 2^g pasos.
+    """
+
+    @staticmethod
+    def cycle_length(a, c, m, x0):
+        """
+        Calcula la longitud del ciclo de ``x0`` en la recurrencia ``X(n+1) = (a * X(n) + c) mod m``.
+
+        Parámetros:
+            a (int): Multiplicador impar.
+            c (int): Incremento.
+            m (int): Módulo potencia de 2.
+            x0 (int): Estado inicial, entre 0 y m - 1.
+
+        Retorna:
+            int: Periodo del ciclo que contiene a x0.
+        """
+        m = int(m)
+        if m < 1 or m & (m - 1):
+            raise ValueError("m must be a power of 2")
+        if a % 2 == 0:
+            raise ValueError("a must be odd")
+        jump_a, jump_c = a % m, c % m
+        length = 1
+        while (jump_a * x0 + jump_c) % m != x0:
+            jump_a, jump_c = (jump_a * jump_a) % m, (jump_a * jump_c + jump_c) % m
+            length *= 2
+        return length
+
+    @staticmethod
+    def prime_factors(number):
+        """
+        Retorna:
+            list: Factores primos distintos de number, por división de prueba.
+        """
+        factors = []
+        divisor = 2
+        while divisor * divisor <= number:
+            if number % divisor == 0:
+                factors.append(divisor)
+                while number % divisor == 0:
+                    number //= divisor
+            divisor += 1 if divisor == 2 else 2
+        if number > 1:
+            factors.append(number)
+        return factors
+
+    @staticmethod
+    def hull_dobell(a, c, m):
+        """
+        Revisa las condiciones de Hull–Dobell, que garantizan periodo completo m con incremento distinto de 0.
+
+        Parámetros:
+            a (int): Multiplicador.
+            c (int): Incremento.
+            m (int): Módulo.
+
+        Retorna:
+            dict: Cumplimiento de cada condición.
+        """
+        return {
+            'increment_coprime': math.gcd(c, m) == 1,
+            'multiplier_divisible_by_primes': all((a - 1) % p == 0 for p in PeriodAnalyzer.prime_factors(m)),
+            'multiplier_divisible_by_4': m % 4 != 0 or (a - 1) % 4 == 0,
+        }
+
+    @staticmethod
+    def analyze_linear_congruential(xo, k, c, g):
+        """
+        Analiza el periodo del método lineal congruencial con ``a = 1 + 2k`` y ``m = 2^g``.
+
+        Como en detect_cycle, una semilla mayor o igual que m queda fuera del ciclo (cola de 1).
+
+        Parámetros:
+            xo (int): Semilla.
+            k (int): Variable del multiplicador.
+            c (int): Incremento.
+            g (int): Exponente del módulo.
+
+        Retorna:
+            dict: Multiplicador, incremento, módulo, periodo, cola, periodo máximo, si se alcanza y las
+            condiciones de Hull–Dobell.
+        """
+        a = 1 + 2 * k
+        m = 2 ** g
+        tail_length = 0 if 0 <= xo < m else 1
+        start = xo if tail_length == 0 else (a * xo + c) % m
+        conditions = PeriodAnalyzer.hull_dobell(a, c, m)
+        period = PeriodAnalyzer.cycle_length(a, c, m, start)
+        return {'multiplier': a, 'increment': c, 'modulus': m, 'seed': xo, 'period': period,
+                'tail_length': tail_length, 'maximum_period': m, 'full_period': period == m,
+                'conditions': conditions}
+
+    @staticmethod
+    def analyze_multiplicative_congruential(xo, t, g):
+        """
+        Analiza el periodo del método multiplicativo congruencial con ``a = 8t + 3`` y ``m = 2^g``.
+
+        El periodo es el orden de a módulo ``2^(g - v)``, donde ``2^v`` es la mayor potencia de 2 que divide
+        a la semilla; el máximo, ``m / 4`` desde g = 3, se alcanza con semillas impares.
+
+        Parámetros:
+            xo (int): Semilla.
+            t (int): Variable del multiplicador.
+            g (int): Exponente del módulo.
+
+        Retorna:
+            dict: Multiplicador, módulo, periodo, periodo máximo, si se alcanza y si la semilla es impar.
+        """
+        a = 8 * t + 3
+        m = 2 ** g
+        # El primer Xi es a * xo mod m; como el mapa es una biyección, su ciclo es el de xo.
+        period = PeriodAnalyzer.cycle_length(a, 0, m, (a * xo) % m)
+        maximum_period = PeriodAnalyzer.cycle_length(a, 0, m, 1)
+        return {'multiplier': a, 'increment': 0, 'modulus': m, 'seed': xo, 'period': period, 'tail_length': 0,
+                'maximum_period': maximum_period, 'full_period': period == maximum_period,
+                'conditions': {'odd_seed': xo % 2 == 1}}
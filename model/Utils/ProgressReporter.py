@@ -0,0 +1,68 @@
+import threading
+
+
+class GenerationCancelled(Exception):
+    """
+    Se lanza dentro de un método de generación cuando se solicitó cancelarlo.
+    """
+
+
+class ProgressReporter:
+    """
+    Canal entre un método de generación y quien lo ejecuta: el método informa su avance y el
+    ejecutor puede pedir la cancelación desde otro hilo.
+
+    La cancelación es cooperativa: se hace efectiva la siguiente vez que el método llama a report.
+    """
+
+    def __init__(self, callback=None):
+        """
+        Inicializa el reportero.
+
+        Parámetros:
+            callback (callable): Función que recibe ``(hechos, total)`` cada vez que el método avanza.
+        """
+        self.callback = callback
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        """
+        Solicita la cancelación de la generación.
+        """
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self):
+        """
+        Indica si se solicitó la cancelación.
+
+        Retorna:
+            bool: True si se llamó a cancel.
+        """
+        return self.cancel_event.is_set()
+
+    def report(self, done, total):
+        """
+        Informa el avance y detiene la generación si se solicitó cancelarla.
+
+        Parámetros:
+            done (int): Unidades terminadas.
+            total (int): Unidades totales.
+        """
+        if self.cancel_event.is_set():
+            raise GenerationCancelled()
+        if self.callback is not None:
+            self.callback(done, total)
+
+    @staticmethod
+    def notify(progress, done, total):
+        """
+        Llama a report solo si hay un reportero, para que los métodos acepten ``progress=None``.
+
+        Parámetros:
+            progress (ProgressReporter | None): Reportero del método.
+            done (int): Unidades terminadas.
+            total (int): Unidades totales.
+        """
+        if progress is not None:
+            progress.report(done, total)
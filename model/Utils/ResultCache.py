@@ -0,0 +1,220 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+class ResultCache:
+    """
+    Caché de resultados de los métodos indexada por nombre del método y parámetros.
+
+    Guarda en memoria los arreglos de los resultados más recientes hasta un límite de bytes y
+    descarta los menos usados (LRU). Con un directorio, además los escribe como archivos .npy que
+    se vuelven a abrir como memmap de solo lectura, así sobreviven entre ejecuciones sin ocupar
+    memoria hasta que se leen.
+
+    Cada entrada se identifica por una clave base (método y parámetros, sin la cantidad de
+    iteraciones) y la cantidad de iteraciones, para poder buscar la corrida más larga con los
+    mismos parámetros y reutilizarla como prefijo.
+    """
+
+    def __init__(self, max_bytes=256 * 1024 * 1024, directory=None):
+        """
+        Inicializa la caché.
+
+        Parámetros:
+            max_bytes (int): Bytes máximos de arreglos en memoria.
+            directory (str): Carpeta del nivel en disco; None lo desactiva.
+        """
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.entries = OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+
+    def get(self, base_key, iterations):
+        """
+        Busca el resultado de una corrida exacta.
+
+        Parámetros:
+            base_key (tuple): Método y parámetros, sin las iteraciones.
+            iterations (int): Cantidad de iteraciones.
+
+        Retorna:
+            tuple | None: ``(arreglos, atributos)`` o None si no está guardado.
+        """
+        key = (base_key, iterations)
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                return self.entries[key]
+        entry = self.load(key)
+        if entry is not None:
+            self.remember(key, entry)
+        return entry
+
+    def longest(self, base_key):
+        """
+        Busca la corrida más larga guardada con los mismos parámetros.
+
+        Parámetros:
+            base_key (tuple): Método y parámetros, sin las iteraciones.
+
+        Retorna:
+            tuple | None: ``(iteraciones, arreglos, atributos)`` o None si no hay ninguna.
+        """
+        with self.lock:
+            lengths = [iterations for key_base, iterations in self.entries if key_base == base_key]
+        lengths.extend(self.disk_lengths(base_key))
+        if not lengths:
+            return None
+        iterations = max(lengths)
+        entry = self.get(base_key, iterations)
+        return None if entry is None else (iterations,) + entry
+
+    def put(self, base_key, iterations, arrays, attributes=None):
+        """
+        Guarda el resultado de una corrida.
+
+        Los arreglos no se copian: se guardan los mismos y se marcan como de solo lectura, así que quien
+        los guarda no debe conservar otra referencia modificable a sus datos. Una corrida nueva y una
+        leída de la caché se comportan igual.
+
+        Parámetros:
+            base_key (tuple): Método y parámetros, sin las iteraciones.
+            iterations (int): Cantidad de iteraciones.
+            arrays (dict): Arreglos del resultado por nombre.
+            attributes (dict): Valores escalares del resultado (por ejemplo el periodo), serializables a JSON.
+
+        Retorna:
+            dict: Arreglos guardados, de solo lectura.
+        """
+        key = (base_key, iterations)
+        arrays = {name: self.read_only(values) for name, values in arrays.items()}
+        entry = (arrays, dict(attributes or {}))
+        self.remember(key, entry)
+        if self.directory is not None:
+            self.store(key, entry)
+        return arrays
+
+    def clear(self):
+        """
+        Vacía el nivel en memoria (los archivos del nivel en disco se conservan).
+        """
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+    def remember(self, key, entry):
+        """
+        Agrega una entrada al nivel en memoria y descarta las menos usadas si se supera el límite.
+
+        Parámetros:
+            key (tuple): Clave completa.
+            entry (tuple): Arreglos y atributos.
+        """
+        nbytes = self.entry_bytes(entry)
+        with self.lock:
+            if key in self.entries:
+                self.size -= self.entry_bytes(self.entries.pop(key))
+            if nbytes > self.max_bytes:
+                return
+            self.entries[key] = entry
+            self.size += nbytes
+            while self.size > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= self.entry_bytes(evicted)
+
+    @staticmethod
+    def entry_bytes(entry):
+        """
+        Retorna:
+            int: Bytes en memoria de los arreglos de una entrada (los memmap no ocupan memoria propia).
+        """
+        return sum(values.nbytes for values in entry[0].values() if not isinstance(values, np.memmap))
+
+    @staticmethod
+    def read_only(values):
+        """
+        Marca un arreglo como de solo lectura, sin copiarlo.
+
+        Parámetros:
+            values (numpy.ndarray): Arreglo a guardar.
+
+        Retorna:
+            numpy.ndarray: El mismo arreglo, ya de solo lectura.
+        """
+        values = np.asanyarray(values)
+        values.flags.writeable = False
+        return values
+
+    def entry_path(self, key):
+        """
+        Retorna:
+            str: Carpeta del nivel en disco de una clave.
+        """
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()
+        return os.path.join(self.directory, digest)
+
+    def index_path(self, base_key):
+        """
+        Retorna:
+            str: Archivo que lista las iteraciones guardadas en disco para una clave base.
+        """
+        digest = hashlib.sha1(repr(base_key).encode()).hexdigest()
+        return os.path.join(self.directory, digest + '.json')
+
+    def disk_lengths(self, base_key):
+        """
+        Retorna:
+            list: Cantidades de iteraciones guardadas en disco para una clave base.
+        """
+        if self.directory is None or not os.path.exists(self.index_path(base_key)):
+            return []
+        with open(self.index_path(base_key)) as file:
+            return json.load(file)
+
+    def store(self, key, entry):
+        """
+        Escribe una entrada en el nivel en disco.
+
+        Parámetros:
+            key (tuple): Clave completa.
+            entry (tuple): Arreglos y atributos.
+        """
+        arrays, attributes = entry
+        path = self.entry_path(key)
+        os.makedirs(path, exist_ok=True)
+        for name, values in arrays.items():
+            np.save(os.path.join(path, name + '.npy'), values)
+        with open(os.path.join(path, 'attributes.json'), 'w') as file:
+            json.dump({'key': repr(key), 'arrays': sorted(arrays), 'attributes': attributes}, file)
+        lengths = sorted(set(self.disk_lengths(key[0])) | {key[1]})
+        with open(self.index_path(key[0]), 'w') as file:
+            json.dump(lengths, file)
+
+    def load(self, key):
+        """
+        Abre una entrada del nivel en disco como memmap.
+
+        Parámetros:
+            key (tuple): Clave completa.
+
+        Retorna:
+            tuple | None: Arreglos y atributos, o None si no existe.
+        """
+        if self.directory is None:
+            return None
+        path = self.entry_path(key)
+        meta_path = os.path.join(path, 'attributes.json')
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path) as file:
+            meta = json.load(file)
+        if meta['key'] != repr(key):
+            return None
+        arrays = {name: np.load(os.path.join(path, name + '.npy'), mmap_mode='r') for name in meta['arrays']}
+        return arrays, meta['attributes']
@@ -0,0 +1,227 @@
+import math
+
+
+class SpectralTest:
+    """
+    Prueba espectral de los generadores congruenciales (algoritmo S de Knuth, TAOCP vol. 2, 3.3.4).
+
+    Para cada dimensión t calcula ν_t, la longitud del vector no nulo más corto ``(s1, ..., st)`` con
+    ``s1 + a s2 + ... + a^(t-1) st ≡ 0 (mod m)``: 1 / ν_t es la distancia máxima entre los hiperplanos
+    que cubren los puntos ``(X(n), ..., X(n+t-1))``, así que un ν_t grande indica una red fina.
+
+    Todo se calcula con enteros exactos: una reducción por pares de la base y su dual, y después una
+    búsqueda exhaustiva acotada por la base dual. Con dimensiones hasta 8 y módulos hasta 2^64 el costo
+    es del orden de milisegundos.
+    """
+
+    # Constantes de Hermite γ_t (t = 2..8): ν_t <= sqrt(γ_t) * m^(1/t) para cualquier multiplicador.
+    HERMITE_CONSTANTS = {2: (4 / 3) ** 0.5, 3: 2 ** (1 / 3), 4: 2 ** 0.5, 5: 8 ** (1 / 5), 6: (64 / 3) ** (1 / 6),
+                         7: 64 ** (1 / 7), 8: 2.0}
+    MAX_DIMENSIONS = 8
+
+    @staticmethod
+    def round_division(numerator, denominator):
+        """
+        Retorna:
+            int: Entero más cercano a numerator / denominator (denominator > 0), sin pasar por float.
+        """
+        return (2 * numerator + denominator) // (2 * denominator)
+
+    @staticmethod
+    def dot(first, second):
+        """
+        Retorna:
+            int: Producto punto de dos vectores de enteros.
+        """
+        return sum(x * y for x, y in zip(first, second))
+
+    @staticmethod
+    def shortest_vectors(a, m, dimensions=MAX_DIMENSIONS):
+        """
+        Calcula ν_t² para t = 2..dimensions.
+
+        Parámetros:
+            a (int): Multiplicador, primo relativo con m.
+            m (int): Módulo.
+            dimensions (int): Dimensión máxima, entre 2 y 8.
+
+        Retorna:
+            dict: ν_t² exacto (entero) por dimensión.
+        """
+        return dict(SpectralTest.iter_shortest_vectors(a, m, dimensions))
+
+    @staticmethod
+    def iter_shortest_vectors(a, m, dimensions=MAX_DIMENSIONS):
+        """
+        Calcula ν_t² dimensión por dimensión, para poder descartar un multiplicador sin calcular las
+        dimensiones altas, que son las más costosas.
+
+        Parámetros:
+            a (int): Multiplicador, primo relativo con m.
+            m (int): Módulo.
+            dimensions (int): Dimensión máxima, entre 2 y 8.
+
+        Retorna:
+            generator: Pares ``(t, ν_t²)`` desde t = 2.
+        """
+        if not 2 <= dimensions <= SpectralTest.MAX_DIMENSIONS:
+            raise ValueError("dimensions must be between 2 and 8")
+        a %= m
+        if m < 2 or math.gcd(a, m) != 1:
+            raise ValueError("a must be coprime with m")
+        dot = SpectralTest.dot
+        nearest = SpectralTest.round_division
+
+        # S1-S3: dimensión 2 con pasos del algoritmo de Euclides.
+        h, h_prev, p, p_prev = a, m, 1, 0
+        s = 1 + a * a
+        while True:
+            q = h_prev // h
+            u, v = h_prev - q * h, p_prev - q * p
+            if u * u + v * v >= s:
+                break
+            s = u * u + v * v
+            h_prev, h, p_prev, p = h, u, p, v
+        u, v = u - h, v - p
+        if u * u + v * v < s:
+            s = u * u + v * v
+            h_prev, p_prev = u, v
+        yield 2, s
+        basis = [[-h, p], [-h_prev, p_prev]]
+        dual = [[p_prev, h_prev], [-p, -h]]
+        if dot(basis[0], dual[0]) < 0:
+            dual = [[-value for value in row] for row in dual]
+        r = a
+
+        for t in range(3, dimensions + 1):
+            # S4: se agrega la dimensión t a la base y a su dual.
+            r = (a * r) % m
+            for row in basis:
+                row.append(0)
+            new_row = [-r] + [0] * (t - 2) + [1]
+            for i, row in enumerate(dual):
+                q = nearest(row[0] * r, m)
+                row.append(row[0] * r - q * m)
+                new_row = [x + q * y for x, y in zip(new_row, basis[i])]
+            basis.append(new_row)
+            dual.append([0] * (t - 1) + [m])
+            s = min(s, dot(new_row, new_row))
+
+            # S5-S6: reducción por pares hasta recorrer todas las filas sin cambios.
+            k, j = t - 1, 0
+            while True:
+                norm_j = dot(dual[j], dual[j])
+                for i in range(t):
+                    if i == j:
+                        continue
+                    product = dot(dual[i], dual[j])
+                    if 2 * abs(product) > norm_j:
+                        q = nearest(product, norm_j)
+                        dual[i] = [x - q * y for x, y in zip(dual[i], dual[j])]
+                        basis[j] = [x + q * y for x, y in zip(basis[j], basis[i])]
+                        s = min(s, dot(basis[j], basis[j]))
+                        k = j
+                j = 0 if j == t - 1 else j + 1
+                if j == k:
+                    break
+
+            # S7-S10: búsqueda exhaustiva con |x_j| <= |V_j| sqrt(s) / m, recorriendo solo la mitad
+            # de los vectores (el primer x no nulo positivo).
+            bounds = [math.isqrt(dot(row, row) * s // (m * m)) for row in dual]
+            x = [0] * t
+            y = [0] * t
+            k = t - 1
+            while k >= 0:
+                if x[k] == bounds[k]:
+                    k -= 1
+                    continue
+                x[k] += 1
+                y = [value + step for value, step in zip(y, basis[k])]
+                k += 1
+                while k < t:
+                    x[k] = -bounds[k]
+                    y = [value - 2 * bounds[k] * step for value, step in zip(y, basis[k])]
+                    k += 1
+                if any(y):
+                    s = min(s, dot(y, y))
+                k -= 1
+            yield t, s
+
+    @staticmethod
+    def score(t, square, m):
+        """
+        Normaliza ν_t con la mejor red posible en la dimensión t.
+
+        Parámetros:
+            t (int): Dimensión.
+            square (int): ν_t².
+            m (int): Módulo.
+
+        Retorna:
+            float: ``ν_t / (sqrt(γ_t) m^(1/t))``, entre 0 y 1.
+        """
+        return math.exp(0.5 * math.log(square) - 0.5 * math.log(SpectralTest.HERMITE_CONSTANTS[t]) - math.log(m) / t)
+
+    @staticmethod
+    def analyze(a, m, dimensions=MAX_DIMENSIONS):
+        """
+        Aplica la prueba espectral y normaliza cada ν_t.
+
+        Parámetros:
+            a (int): Multiplicador.
+            m (int): Módulo.
+            dimensions (int): Dimensión máxima, entre 2 y 8.
+
+        Retorna:
+            dict: Por dimensión, ν_t, la figura de mérito μ_t de Knuth (``π^(t/2) ν_t^t / ((t/2)! m)``,
+            buena desde 1) y el puntaje ``ν_t / (sqrt(γ_t) m^(1/t))`` entre 0 y 1 (1 es la mejor red
+            posible); además el peor puntaje de todas las dimensiones.
+        """
+        dimensions_result = {}
+        for t, square in SpectralTest.iter_shortest_vectors(a, m, dimensions):
+            # Se usan logaritmos porque ν_t^t y m pueden superar el rango de float con m = 2^64.
+            log_mu = (t / 2) * math.log(math.pi) + (t / 2) * math.log(square) - math.lgamma(t / 2 + 1) - math.log(m)
+            dimensions_result[t] = {'nu': math.sqrt(square), 'nu_squared': square, 'mu': math.exp(log_mu),
+                                    'score': SpectralTest.score(t, square, m)}
+        return {'multiplier': a % m, 'modulus': m, 'dimensions': dimensions_result,
+                'worst_score': min(result['score'] for result in dimensions_result.values())}
+
+    @staticmethod
+    def analyze_linear_congruential(k, g, dimensions=MAX_DIMENSIONS):
+        """
+        Prueba espectral del método lineal congruencial (``a = 1 + 2k``, ``m = 2^g``); el incremento no
+        cambia la red.
+
+        Parámetros:
+            k (int): Variable del multiplicador.
+            g (int): Exponente del módulo.
+            dimensions (int): Dimensión máxima, entre 2 y 8.
+
+        Retorna:
+            dict: Resultado de analyze.
+        """
+        return SpectralTest.analyze(1 + 2 * k, 2 ** g, dimensions)
+
+    @staticmethod
+    def analyze_multiplicative_congruential(t, g, dimensions=MAX_DIMENSIONS):
+        """
+        Prueba espectral del método multiplicativo congruencial (``a = 8t + 3``, ``m = 2^g``).
+
+        Con c = 0 las diferencias entre los puntos de una semilla impar son múltiplos de
+        ``X(0) * (a^n - 1)``, y como ``a - 1 ≡ 2 (mod 8)`` generan los múltiplos de 2: los puntos quedan
+        en la red de ``a`` con módulo m/2 (escalada por 2), así que la prueba se aplica con m/2. El
+        módulo m/4 que usa Knuth corresponde a ``a ≡ 5 (mod 8)``, donde ``a - 1`` es múltiplo de 4.
+
+        Parámetros:
+            t (int): Variable del multiplicador.
+            g (int): Exponente del módulo (al menos 3).
+            dimensions (int): Dimensión máxima, entre 2 y 8.
+
+        Retorna:
+            dict: Resultado de analyze, con el multiplicador completo y 'modulus' igual al de la red (m/2).
+        """
+        if g < 3:
+            raise ValueError("g must be at least 3")
+        result = SpectralTest.analyze(8 * t + 3, 2 ** (g - 1), dimensions)
+        result['multiplier'] = 8 * t + 3
+        return result
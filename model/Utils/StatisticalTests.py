@@ -0,0 +1,433 @@
+import math
+
+import numpy as np
+
+from model.Utils.MathUtils import MathUtils
+
+
+def normal_quantile(probability):
+    """
+    Retorna el cuantil de la normal estándar con la aproximación de MathUtils (error relativo < 1.15e-9).
+
+    Parámetros:
+        probability (float): Probabilidad acumulada.
+
+    Retorna:
+        float: Cuantil.
+    """
+    return float(MathUtils.inverse_normal_cdf(probability))
+
+
+def chi2_quantile(probability, degrees):
+    """
+    Retorna el cuantil de la distribución chi-cuadrado.
+
+    Usa scipy si está instalado; si no, la aproximación de Wilson–Hilferty, cuyo error relativo en la
+    cola superior es menor que 0.2 % desde 6 grados de libertad (los de la prueba de póker) y se vuelve
+    despreciable con muchos grados.
+
+    Parámetros:
+        probability (float): Probabilidad acumulada.
+        degrees (int): Grados de libertad.
+
+    Retorna:
+        float: Cuantil.
+    """
+    try:
+        from scipy.stats import chi2
+    except ImportError:
+        z = normal_quantile(probability)
+        h = 2 / (9 * degrees)
+        return degrees * max(0.0, 1 - h + z * math.sqrt(h)) ** 3
+    return float(chi2.ppf(probability, degrees))
+
+
+class MeanTest:
+    """
+    Prueba de medias: el promedio de n valores U(0, 1) debe caer en ``0.5 ± z(1 - α/2) / sqrt(12 n)``.
+    """
+    name = 'mean'
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+
+    def update(self, values):
+        """
+        Agrega un fragmento de valores.
+
+        Parámetros:
+            values (numpy.ndarray): Valores float64.
+        """
+        self.count += values.size
+        self.total += float(values.sum())
+
+    def result(self, alpha):
+        """
+        Parámetros:
+            alpha (float): Nivel de significancia.
+
+        Retorna:
+            dict: Promedio, límites de aceptación y si la prueba se aprueba.
+        """
+        mean = self.total / self.count
+        margin = normal_quantile(1 - alpha / 2) / math.sqrt(12 * self.count)
+        return {'name': self.name, 'count': self.count, 'statistic': mean, 'lower': 0.5 - margin,
+                'upper': 0.5 + margin, 'passed': 0.5 - margin <= mean <= 0.5 + margin}
+
+
+class VarianceTest:
+    """
+    Prueba de varianza: la varianza muestral debe caer entre ``χ²(α/2, n-1) / (12 (n-1))`` y
+    ``χ²(1 - α/2, n-1) / (12 (n-1))``.
+
+    La media y la suma de cuadrados de las desviaciones de cada fragmento se combinan con la fórmula
+    de Chan, que no pierde precisión al acumular 10^8 valores como sí pasaría con la suma de cuadrados.
+    """
+    name = 'variance'
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.squares = 0.0
+
+    def update(self, values):
+        """
+        Agrega un fragmento de valores.
+
+        Parámetros:
+            values (numpy.ndarray): Valores float64.
+        """
+        if not values.size:
+            return
+        mean = float(values.mean())
+        squares = float(np.square(values - mean).sum())
+        count = self.count + values.size
+        delta = mean - self.mean
+        self.mean += delta * values.size / count
+        self.squares += squares + delta * delta * self.count * values.size / count
+        self.count = count
+
+    def result(self, alpha):
+        """
+        Parámetros:
+            alpha (float): Nivel de significancia.
+
+        Retorna:
+            dict: Varianza muestral, límites de aceptación y si la prueba se aprueba.
+        """
+        degrees = self.count - 1
+        if degrees < 1:
+            raise ValueError("the variance test needs at least 2 values")
+        variance = self.squares / degrees
+        lower = chi2_quantile(alpha / 2, degrees) / (12 * degrees)
+        upper = chi2_quantile(1 - alpha / 2, degrees) / (12 * degrees)
+        return {'name': self.name, 'count': self.count, 'statistic': variance, 'lower': lower, 'upper': upper,
+                'passed': lower <= variance <= upper}
+
+
+class ChiSquareTest:
+    """
+    Prueba de uniformidad chi-cuadrado con intervalos de igual longitud en [0, 1].
+    """
+    name = 'chi_square'
+
+    def __init__(self, intervals=10):
+        """
+        Parámetros:
+            intervals (int): Cantidad de intervalos; se fija al inicio para poder acumular fragmentos.
+        """
+        if intervals < 2:
+            raise ValueError("intervals must be at least 2")
+        self.intervals = intervals
+        self.edges = np.arange(intervals + 1) / intervals
+        self.observed = np.zeros(intervals, dtype=np.int64)
+
+    def update(self, values):
+        """
+        Agrega un fragmento de valores.
+
+        Parámetros:
+            values (numpy.ndarray): Valores float64.
+        """
+        indexes = (values * self.intervals).astype(np.intp)
+        np.clip(indexes, 0, self.intervals - 1, out=indexes)
+        # El producto puede quedar justo debajo de un borde (0.3 * 10 = 2.9999999999999996); se corrige
+        # comparando con los bordes para contar igual que np.histogram.
+        indexes += values >= self.edges[indexes + 1]
+        indexes -= values < self.edges[indexes]
+        np.clip(indexes, 0, self.intervals - 1, out=indexes)
+        self.observed += np.bincount(indexes, minlength=self.intervals)
+
+    def result(self, alpha):
+        """
+        Parámetros:
+            alpha (float): Nivel de significancia.
+
+        Retorna:
+            dict: Estadístico, valor crítico, frecuencias observadas y si la prueba se aprueba.
+        """
+        count = int(self.observed.sum())
+        expected = count / self.intervals
+        statistic = float(np.square(self.observed - expected).sum() / expected)
+        critical = chi2_quantile(1 - alpha, self.intervals - 1)
+        return {'name': self.name, 'count': count, 'statistic': statistic, 'upper': critical,
+                'observed': self.observed.tolist(), 'passed': statistic <= critical}
+
+
+class KolmogorovSmirnovTest:
+    """
+    Prueba de Kolmogórov–Smirnov contra U(0, 1).
+
+    Ordenar 10^8 valores no es posible por fragmentos, así que se cuentan en ``bins`` intervalos finos
+    y D se acota en cada intervalo ``[a, b]`` con ``F(b) - a`` y ``b - F(a)``. La cota nunca es menor
+    que el D exacto y lo supera a lo sumo en ``1 / bins`` (con el valor por defecto, 1e-6), mucho
+    menos que el valor crítico incluso con 10^8 valores.
+    """
+    name = 'kolmogorov_smirnov'
+
+    def __init__(self, bins=1 << 20):
+        """
+        Parámetros:
+            bins (int): Cantidad de intervalos del conteo.
+        """
+        self.bins = bins
+        self.counts = np.zeros(bins, dtype=np.int64)
+
+    def update(self, values):
+        """
+        Agrega un fragmento de valores.
+
+        Parámetros:
+            values (numpy.ndarray): Valores float64.
+        """
+        indexes = (values * self.bins).astype(np.intp)
+        np.clip(indexes, 0, self.bins - 1, out=indexes)
+        self.counts += np.bincount(indexes, minlength=self.bins)
+
+    def result(self, alpha):
+        """
+        Parámetros:
+            alpha (float): Nivel de significancia.
+
+        Retorna:
+            dict: D, valor crítico asintótico (con la corrección de Stephens para n pequeño) y si la
+            prueba se aprueba.
+        """
+        count = int(self.counts.sum())
+        cumulative = np.cumsum(self.counts) / count
+        edges = np.arange(self.bins + 1) / self.bins
+        above = float(np.max(cumulative - edges[:-1]))
+        below = float(np.max(edges[1:] - np.concatenate(([0.0], cumulative[:-1]))))
+        statistic = max(above, below)
+        root = math.sqrt(count)
+        critical = math.sqrt(-math.log(alpha / 2) / 2) / (root + 0.12 + 0.11 / root)
+        return {'name': self.name, 'count': count, 'statistic': statistic, 'upper': critical,
+                'passed': statistic <= critical}
+
+
+class RunsTest:
+    """
+    Prueba de corridas arriba y abajo: cuenta las rachas de subidas (``r(i) > r(i-1)``) y bajadas.
+
+    Con n valores la cantidad de corridas tiene media ``(2n - 1) / 3`` y varianza ``(16n - 29) / 90``.
+    Entre fragmentos solo se conserva el último valor y su dirección.
+    """
+    name = 'runs'
+
+    def __init__(self):
+        self.count = 0
+        self.changes = 0
+        self.last_value = None
+        self.last_direction = None
+
+    def update(self, values):
+        """
+        Agrega un fragmento de valores.
+
+        Parámetros:
+            values (numpy.ndarray): Valores float64.
+        """
+        if not values.size:
+            return
+        self.count += values.size
+        if self.last_value is not None:
+            values = np.concatenate(([self.last_value], values))
+        self.last_value = values[-1]
+        directions = values[1:] > values[:-1]
+        if not directions.size:
+            return
+        self.changes += int(np.count_nonzero(directions[1:] != directions[:-1]))
+        if self.last_direction is not None and directions[0] != self.last_direction:
+            self.changes += 1
+        self.last_direction = directions[-1]
+
+    def result(self, alpha):
+        """
+        Parámetros:
+            alpha (float): Nivel de significancia.
+
+        Retorna:
+            dict: Estadístico Z, valor crítico, cantidad de corridas y si la prueba se aprueba.
+        """
+        if self.count < 3:
+            raise ValueError("the runs test needs at least 3 values")
+        runs = self.changes + 1
+        mean = (2 * self.count - 1) / 3
+        deviation = math.sqrt((16 * self.count - 29) / 90)
+        statistic = abs(runs - mean) / deviation
+        critical = normal_quantile(1 - alpha / 2)
+        return {'name': self.name, 'count': self.count, 'runs': runs, 'statistic': statistic, 'upper': critical,
+                'passed': statistic <= critical}
+
+
+class PokerTest:
+    """
+    Prueba de póker con los 5 primeros decimales de cada valor, sin redondear: 0.999995 es 99999 y no
+    00000, que sería el resultado de redondear a 1.00000.
+
+    La mano se reconoce por la cantidad de pares de posiciones con el mismo dígito (10 comparaciones):
+    0 todos diferentes, 1 un par, 2 dos pares, 3 tercia, 4 full, 6 póker y 10 quintilla. Como solo hay
+    10^5 combinaciones de dígitos, la mano de cada una se calcula una vez y los valores se clasifican
+    con una búsqueda en esa tabla.
+    """
+    name = 'poker'
+    HANDS = ('all_different', 'one_pair', 'two_pairs', 'three_of_a_kind', 'full_house', 'four_of_a_kind',
+             'five_of_a_kind')
+    PROBABILITIES = np.array([0.3024, 0.504, 0.108, 0.072, 0.009, 0.0045, 0.0001])
+    # Mano según la cantidad de pares iguales; las cantidades imposibles (5, 7, 8, 9) no aparecen.
+    HAND_BY_PAIRS = np.array([0, 1, 2, 3, 4, 0, 5, 0, 0, 0, 6], dtype=np.intp)
+    hand_table = None
+
+    def __init__(self):
+        self.observed = np.zeros(len(self.HANDS), dtype=np.int64)
+        if PokerTest.hand_table is None:
+            PokerTest.hand_table = self.classify(np.arange(100000))
+
+    @staticmethod
+    def classify(numbers):
+        """
+        Clasifica números de 5 dígitos (0 a 99999) en manos de póker.
+
+        Parámetros:
+            numbers (numpy.ndarray): Números enteros.
+
+        Retorna:
+            numpy.ndarray: Índice de la mano de cada número en HANDS.
+        """
+        digits = [numbers // 10 ** position % 10 for position in range(5)]
+        pairs = np.zeros(numbers.size, dtype=np.intp)
+        for first in range(5):
+            for second in range(first + 1, 5):
+                pairs += digits[first] == digits[second]
+        return PokerTest.HAND_BY_PAIRS[pairs].astype(np.int8)
+
+    def update(self, values):
+        """
+        Agrega un fragmento de valores.
+
+        Parámetros:
+            values (numpy.ndarray): Valores float64.
+        """
+        # El margen compensa el error de ``x * 1e5`` en los Ri ya truncados a 5 decimales (0.00007 * 1e5 es
+        # 6.999999999999999); solo cambia los dígitos de valores a menos de 1e-11 del siguiente borde.
+        numbers = np.floor(values * 1e5 + 1e-6).astype(np.intp)
+        np.clip(numbers, 0, 99999, out=numbers)
+        self.observed += np.bincount(self.hand_table[numbers], minlength=len(self.HANDS))
+
+    def result(self, alpha):
+        """
+        Parámetros:
+            alpha (float): Nivel de significancia.
+
+        Retorna:
+            dict: Estadístico, valor crítico, manos observadas y si la prueba se aprueba.
+        """
+        count = int(self.observed.sum())
+        expected = count * self.PROBABILITIES
+        statistic = float((np.square(self.observed - expected) / expected).sum())
+        critical = chi2_quantile(1 - alpha, len(self.HANDS) - 1)
+        return {'name': self.name, 'count': count, 'statistic': statistic, 'upper': critical,
+                'observed': dict(zip(self.HANDS, self.observed.tolist())), 'passed': statistic <= critical}
+
+
+class StatisticalTests:
+    """
+    Batería de pruebas de los Ri: medias, varianza, chi-cuadrado, Kolmogórov–Smirnov, corridas y póker.
+
+    Los valores se pueden entregar completos o por fragmentos; cada prueba guarda solo un resumen
+    (sumas, conteos o el último valor), así que la memoria no depende de la cantidad de valores y el
+    resultado es el mismo con cualquier partición.
+    """
+
+    # Cantidad de valores que se procesan a la vez, para no crear arreglos intermedios del tamaño de la entrada.
+    BLOCK_SIZE = 1 << 20
+
+    def __init__(self, alpha=0.05, intervals=10, ks_bins=1 << 20):
+        """
+        Inicializa las pruebas sin valores.
+
+        Parámetros:
+            alpha (float): Nivel de significancia.
+            intervals (int): Intervalos de la prueba chi-cuadrado.
+            ks_bins (int): Intervalos del conteo de la prueba de Kolmogórov–Smirnov.
+        """
+        if not 0 < alpha < 1:
+            raise ValueError("alpha must be between 0 and 1")
+        self.alpha = alpha
+        self.tests = [MeanTest(), VarianceTest(), ChiSquareTest(intervals), KolmogorovSmirnovTest(ks_bins),
+                      RunsTest(), PokerTest()]
+        self.count = 0
+
+    @staticmethod
+    def ri_values_of(source):
+        """
+        Obtiene los Ri de un método (get_ri_values_array o ri_values_array) o de un arreglo.
+
+        Parámetros:
+            source: Instancia de un método o valores Ri.
+
+        Retorna:
+            numpy.ndarray: Valores Ri float64.
+        """
+        if hasattr(source, 'get_ri_values_array'):
+            source = source.get_ri_values_array()
+        elif hasattr(source, 'ri_values_array'):
+            source = source.ri_values_array
+        return np.asarray(source, dtype=np.float64).ravel()
+
+    def update(self, values):
+        """
+        Agrega un fragmento de Ri a todas las pruebas; los NaN se ignoran.
+
+        Parámetros:
+            values (array_like): Valores Ri, o un método con sus Ri.
+        """
+        values = self.ri_values_of(values)
+        for start in range(0, values.size, self.BLOCK_SIZE):
+            block = values[start:start + self.BLOCK_SIZE]
+            nan = np.isnan(block)
+            if nan.any():
+                block = block[~nan]
+            for test in self.tests:
+                test.update(block)
+            self.count += block.size
+
+    def results(self):
+        """
+        Calcula el resultado de cada prueba con los valores acumulados.
+
+        Retorna:
+            dict: Resultado de cada prueba por nombre.
+        """
+        if not self.count:
+            raise ValueError("no ri values to test")
+        return {test.name: test.result(self.alpha) for test in self.tests}
+
+    @property
+    def passed(self):
+        """
+        Retorna:
+            bool: True si todas las pruebas se aprueban.
+        """
+        return all(result['passed'] for result in self.results().values())
@@ -0,0 +1,63 @@
+import numpy as np
+
+
+class ValuesArray(np.ndarray):
+    """
+    Arreglo contiguo de NumPy usado para almacenar los valores Xi, Ri y Ni de los métodos.
+
+    Se comporta como la lista que se usaba antes (índices, cortes, ``len``, iteración, ``str`` de
+    cada elemento y ``not valores`` para saber si está vacío), pero guarda los números sin objetos
+    intermedios: uint64 para Xi y float64 para Ri y Ni.
+    """
+
+    def __new__(cls, values=(), dtype=np.float64):
+        """
+        Crea el arreglo a partir de cualquier secuencia, sin copiar si ya tiene el tipo indicado.
+
+        Parámetros:
+            values (array_like): Valores a almacenar.
+            dtype (numpy.dtype): Tipo de los elementos.
+        """
+        return np.ascontiguousarray(values, dtype=dtype).view(cls)
+
+    @classmethod
+    def xi(cls, values=()):
+        """
+        Crea un arreglo de valores Xi (enteros sin signo de 64 bits).
+
+        Parámetros:
+            values (array_like): Valores Xi.
+
+        Retorna:
+            ValuesArray: Arreglo uint64.
+        """
+        return cls(values, dtype=np.uint64)
+
+    @classmethod
+    def real(cls, values=()):
+        """
+        Crea un arreglo de valores Ri o Ni (float64).
+
+        Parámetros:
+            values (array_like): Valores Ri o Ni.
+
+        Retorna:
+            ValuesArray: Arreglo float64.
+        """
+        return cls(values, dtype=np.float64)
+
+    def __bool__(self):
+        """
+        Igual que una lista: es verdadero solo si contiene elementos.
+        """
+        return self.size > 0
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """
+        Las operaciones aritméticas devuelven arreglos comunes de NumPy, no listas de valores.
+        """
+        inputs = tuple(value.view(np.ndarray) if isinstance(value, ValuesArray) else value for value in inputs)
+        if 'out' in kwargs:
+            kwargs['out'] = tuple(value.view(np.ndarray) if isinstance(value, ValuesArray) else value
+                                  for value in kwargs['out'])
+        return getattr(ufunc, method)(*inputs, **kwargs)
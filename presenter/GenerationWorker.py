@@ -0,0 +1,65 @@
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from model.Utils.ProgressReporter import GenerationCancelled, ProgressReporter
+
+
+class GenerationWorker(QThread):
+    """
+    Ejecuta un método de generación del modelo en un hilo aparte para que la interfaz siga respondiendo.
+
+    El avance, el resultado, los errores y la cancelación se entregan con señales, que Qt procesa en el
+    hilo de la interfaz.
+    """
+    progress_changed = pyqtSignal(int)
+    result_ready = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+    def __init__(self, function, *args, **kwargs):
+        """
+        Inicializa el hilo sin iniciarlo.
+
+        Parámetros:
+            function (callable): Método del modelo que acepta el argumento ``progress``.
+            *args, **kwargs: Argumentos del método.
+        """
+        super().__init__()
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.reporter = ProgressReporter(self.on_progress)
+        self.last_percent = -1
+
+    def run(self):
+        """
+        Ejecuta el método y emite la señal que corresponda a su resultado.
+        """
+        try:
+            result = self.function(*self.args, progress=self.reporter, **self.kwargs)
+        except GenerationCancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            # Cualquier error debe llegar a la interfaz: si escapara de run, el hilo terminaría sin emitir
+            # ninguna señal y la pestaña quedaría esperando un resultado.
+            self.failed.emit(str(e) or type(e).__name__)
+        else:
+            self.result_ready.emit(result)
+
+    def on_progress(self, done, total):
+        """
+        Convierte el avance del método en porcentaje y lo emite solo cuando cambia.
+
+        Parámetros:
+            done (int): Unidades terminadas.
+            total (int): Unidades totales.
+        """
+        percent = min(100, done * 100 // total) if total else 100
+        if percent != self.last_percent:
+            self.last_percent = percent
+            self.progress_changed.emit(percent)
+
+    def cancel(self):
+        """
+        Solicita la cancelación; se hace efectiva en el siguiente punto de avance del método.
+        """
+        self.reporter.cancel()
@@ -1,15 +1,42 @@
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from model.LinearCongruentialMethod import LinearCongruentialMethod
+from model.MultiplicativeCongruentialMethod import MultiplicativeCongruentialMethod
+from presenter.GenerationWorker import GenerationWorker
+
+
+class WriteErrorBridge(QObject):
+    """
+    Lleva los errores de las escrituras en segundo plano al hilo de la interfaz mediante una señal.
+
+    Su método report se pasa como ``write_error_handler`` al crear el modelo.
+    """
+    error = pyqtSignal(str)
+
+    def report(self, file_name, error):
+        """
+        Recibe el error de una escritura en segundo plano y lo envía al hilo de la interfaz.
+
+        Parámetros:
+            file_name (str): Nombre del archivo que no se pudo escribir.
+            error (Exception): Error producido.
+        """
+        self.error.emit(f"No se pudo guardar {file_name}: {error}")
+
+
 class Presenter:
     """
     Esta clase se encarga de conectar la vista (interfaz de usuario) con el modelo (lógica de negocio)
     para la generación de números pseudoaleatorios mediante diferentes métodos.
     """
-    def __init__(self, view, model) -> None:
+    def __init__(self, view, model, write_errors) -> None:
         """
         Inicializa una instancia de la clase Presenter.
 
         Parámetros:
             view: La vista (interfaz de usuario) asociada a este presentador.
             model: El modelo (lógica de negocio) asociado a este presentador.
+            write_errors (WriteErrorBridge): Puente cuyo report recibe el modelo como ``write_error_handler``.
         """
         self.ms_method = None
         self.mcm_method = None
@@ -17,138 +44,292 @@ class Presenter:
         self.nd_method = None
         self.ud_method = None
         self.selected_ri_values = []
+        self.workers = {}  # Generación en curso de cada pestaña
         self.model = model
         self.view = view
+        self.write_errors = write_errors
         self.connect_signals()
 
     def presenter_middleSquare_method(self):
         """
         Ejecuta y presenta los resultados del método del cuadrado medio.
         """
-        try:
-            seed = self.view.ms_tab.get_seed_spin_box_value()
-            min_value = self.view.ms_tab.get_min_spin_box_value()
-            max_value = self.view.ms_tab.get_max_spin_box_value()
-            iterations = self.view.ms_tab.get_iterations_spin_box_value()
+        with self.model.instrumentation.stage('start_middle_square'):
+            try:
+                seed = self.view.ms_tab.get_seed_spin_box_value()
+                min_value = self.view.ms_tab.get_min_spin_box_value()
+                max_value = self.view.ms_tab.get_max_spin_box_value()
+                iterations = self.view.ms_tab.get_iterations_spin_box_value()
 
-            if len(str(seed)) < 3:
-                raise ValueError("La longitud de la semilla debe tener más 3 digitos o más")
+                if len(str(seed)) < 3:
+                    raise ValueError("La longitud de la semilla debe tener más 3 digitos o más")
 
-            if min_value > max_value:
-                raise ValueError("El valor de min debe ser menor que max.")
+                if min_value > max_value:
+                    raise ValueError("El valor de min debe ser menor que max.")
 
-            self.ms_method = self.model.execute_middle_square(seed, min_value, max_value, iterations)
+                self.start_generation(self.view.ms_tab, self.show_middle_square, self.model.execute_middle_square,
+                                      seed, min_value, max_value, iterations)
+
+            except ValueError as e:
+                self.view.show_warning(str(e))
+
+    def show_middle_square(self, ms_method):
+        """
+        Muestra y guarda los números generados por el método del cuadrado medio.
+
+        Parámetros:
+            ms_method (MiddleSquareMethod): Instancia con los números generados.
+        """
+        with self.model.instrumentation.stage('render_middle_square') as stage:
+            self.ms_method = ms_method
             self.view.ms_tab.set_data(self.ms_method.xi_values_array, self.ms_method.ri_values_array,
                                       self.ms_method.ni_values_array)
-            self.view.ms_tab.generate_table(iterations)
+            self.view.ms_tab.generate_table(self.ms_method.num_amount)
+            stage.count('values_rendered', len(self.ms_method.ni_values_array))
 
-            self.model.write_pseudo_numbers(self.ms_method.ri_values_array, "middleSquareNumbers.json")
-
-        except ValueError as e:
-            self.view.show_warning(str(e))
+        self.model.write_pseudo_numbers_async(self.ms_method.ri_values_array, "middleSquareNumbers.json")
 
     def presenter_linear_congruential_method(self):
         """
         Ejecuta y presenta los resultados del método lineal congruencial.
         """
-        try:
-            xo = self.view.lc_tab.get_xo_spin_box_value()
-            k = self.view.lc_tab.get_k_spin_box_value()
-            c = self.view.lc_tab.get_c_spin_box_value()
-            g = self.view.lc_tab.get_g_spin_box_value()
-            min_value = self.view.lc_tab.get_min_spin_box_value()
-            max_value = self.view.lc_tab.get_max_spin_box_value()
-            iterations = self.view.lc_tab.get_iterations_spin_box_value()
+        with self.model.instrumentation.stage('start_linear_congruential'):
+            try:
+                xo = self.view.lc_tab.get_xo_spin_box_value()
+                k = self.view.lc_tab.get_k_spin_box_value()
+                c = self.view.lc_tab.get_c_spin_box_value()
+                g = self.view.lc_tab.get_g_spin_box_value()
+                min_value = self.view.lc_tab.get_min_spin_box_value()
+                max_value = self.view.lc_tab.get_max_spin_box_value()
+                iterations = self.view.lc_tab.get_iterations_spin_box_value()
+
+                # Validar que los valores sean menores que g
+                if xo >= g or k >= g or c >= g:
+                    raise ValueError("Los valores de xo, k, c, deben ser menores que g.")
 
-            # Validar que los valores sean menores que g
-            if xo >= g or k >= g or c >= g:
-                raise ValueError("Los valores de xo, k, c, deben ser menores que g.")
+                if min_value > max_value:
+                    raise ValueError("El valor de min debe ser menor que max.")
 
-            if min_value > max_value:
-                raise ValueError("El valor de min debe ser menor que max.")
+                # Se valida antes del análisis de periodo, que con un g enorme bloquearía la interfaz.
+                if g > LinearCongruentialMethod.MAX_G:
+                    raise ValueError(f"El valor de g debe ser a lo sumo {LinearCongruentialMethod.MAX_G}.")
 
-            self.lc_method = self.model.execute_linear_congruential(xo, k, c, g, min_value, max_value, iterations)
+                self.warn_short_blocks(self.model.analyze_linear_congruential_period(xo, k, c, g))
+                self.start_generation(self.view.lc_tab, self.show_linear_congruential,
+                                      self.model.execute_linear_congruential, xo, k, c, g, min_value, max_value,
+                                      iterations)
+
+            except ValueError as e:
+                self.view.show_warning(str(e))
+
+    def show_linear_congruential(self, lc_method):
+        """
+        Muestra y guarda los números generados por el método lineal congruencial.
 
+        Parámetros:
+            lc_method (LinearCongruentialMethod): Instancia con los números generados.
+        """
+        with self.model.instrumentation.stage('render_linear_congruential') as stage:
+            self.lc_method = lc_method
             self.view.lc_tab.set_data(self.lc_method.get_xi_values_array(), self.lc_method.get_ri_values_array(),
                                       self.lc_method.get_ni_values_array())
-            self.view.lc_tab.generate_table(iterations)
-
-            self.model.write_pseudo_numbers(self.lc_method.get_ri_values_array(), "linearCongruentialNumbers.json")
+            self.view.lc_tab.generate_table(self.lc_method.total_iterations)
+            stage.count('values_rendered', len(self.lc_method.get_ni_values_array()))
 
-        except ValueError as e:
-            self.view.show_warning(str(e))
+        self.model.write_pseudo_numbers_async(self.lc_method.get_ri_values_array(), "linearCongruentialNumbers.json")
 
     def presenter_multiplicative_congruential_method(self):
         """
         Ejecuta y presenta los resultados del método multiplicativo congruencial.
         """
-        try:
-            # Recupera los valores de entrada de los cuadros de giro en la pestaña 1
-            xo = self.view.mc_tab.get_xo_spin_box_value()
-            t = self.view.mc_tab.get_t_spin_box_value()
-            g = self.view.mc_tab.get_g_spin_box_value()
-            min_value = self.view.mc_tab.get_min_spin_box_value()
-            max_value = self.view.mc_tab.get_max_spin_box_value()
-            iterations = self.view.mc_tab.get_iterations_spin_box_value()
-
-            # Validar que los valores sean menores que g
-            if xo >= g or t >= g:
-                raise ValueError("Los valores de xo y t deben ser menores que g.")
-
-            if min_value > max_value:
-                raise ValueError("El valor de min debe ser menor que max.")
-            # Ejecuta el método multiplicativo congruencial
-            self.mcm_method = self.model.execute_multiplicative_congruential(xo, t, g, min_value, max_value, iterations)
+        with self.model.instrumentation.stage('start_multiplicative_congruential'):
+            try:
+                # Recupera los valores de entrada de los cuadros de giro en la pestaña 1
+                xo = self.view.mc_tab.get_xo_spin_box_value()
+                t = self.view.mc_tab.get_t_spin_box_value()
+                g = self.view.mc_tab.get_g_spin_box_value()
+                min_value = self.view.mc_tab.get_min_spin_box_value()
+                max_value = self.view.mc_tab.get_max_spin_box_value()
+                iterations = self.view.mc_tab.get_iterations_spin_box_value()
+
+                # Validar que los valores sean menores que g
+                if xo >= g or t >= g:
+                    raise ValueError("Los valores de xo y t deben ser menores que g.")
+
+                if min_value > max_value:
+                    raise ValueError("El valor de min debe ser menor que max.")
 
+                if g > MultiplicativeCongruentialMethod.MAX_G:
+                    raise ValueError(f"El valor de g debe ser a lo sumo {MultiplicativeCongruentialMethod.MAX_G}.")
+                self.warn_short_period(self.model.analyze_multiplicative_congruential_period(xo, t, g), iterations)
+                # Ejecuta el método multiplicativo congruencial en segundo plano
+                self.start_generation(self.view.mc_tab, self.show_multiplicative_congruential,
+                                      self.model.execute_multiplicative_congruential, xo, t, g, min_value, max_value,
+                                      iterations)
+
+            except ValueError as e:
+                self.view.show_warning(str(e))
+
+    def show_multiplicative_congruential(self, mcm_method):
+        """
+        Muestra y guarda los números generados por el método multiplicativo congruencial.
+
+        Parámetros:
+            mcm_method (MultiplicativeCongruentialMethod): Instancia con los números generados.
+        """
+        with self.model.instrumentation.stage('render_multiplicative_congruential') as stage:
+            self.mcm_method = mcm_method
             # Establece los datos generados en la pestaña 1
             self.view.mc_tab.set_data(self.mcm_method.get_xi_values_array(), self.mcm_method.get_ri_values_array(),
                                       self.mcm_method.get_ni_values_array())
             # Genera la tabla con los datos generados
-            self.view.mc_tab.generate_table(iterations)
+            self.view.mc_tab.generate_table(self.mcm_method.iterations)
+            stage.count('values_rendered', len(self.mcm_method.get_ni_values_array()))
 
-            self.model.write_pseudo_numbers(self.ms_method.get_ri_values_array(),
-                                            "multiplicativeCongruentialNumbers.json")
-
-        except ValueError as e:
-            self.view.show_warning(str(e))
+        self.model.write_pseudo_numbers_async(self.mcm_method.get_ri_values_array(),
+                                              "multiplicativeCongruentialNumbers.json")
 
     def presenter_normal_distribution_method(self):
         """
         Ejecuta y presenta los resultados del método de distribución normal inversa.
         """
-        intervals = self.view.nd_tab.get_intervals_spin_box_value()
-        mean = self.view.nd_tab.get_mean_spin_box_value()
-        standard_deviation = self.view.nd_tab.get_standard_deviation_spin_box_value()
-        if self.selected_ri_values is not None:
-            self.nd_method = self.model.execute_normal_inv_distribution_method(intervals, mean, standard_deviation,
-                                                                               self.selected_ri_values)
+        with self.model.instrumentation.stage('start_normal_distribution'):
+            try:
+                intervals = self.view.nd_tab.get_intervals_spin_box_value()
+                mean = self.view.nd_tab.get_mean_spin_box_value()
+                standard_deviation = self.view.nd_tab.get_standard_deviation_spin_box_value()
+                if self.selected_ri_values is not None:
+                    self.start_generation(self.view.nd_tab, self.show_normal_distribution,
+                                          self.model.execute_normal_inv_distribution_method, intervals, mean,
+                                          standard_deviation, self.selected_ri_values)
+            except ValueError as e:
+                self.view.show_warning(str(e))
+
+    def show_normal_distribution(self, nd_method):
+        """
+        Muestra y guarda los números generados por el método de distribución normal inversa.
+
+        Parámetros:
+            nd_method (NormalInvDistributionMethod): Instancia con los números generados.
+        """
+        with self.model.instrumentation.stage('render_normal_distribution') as stage:
+            self.nd_method = nd_method
             self.view.nd_tab.set_data(self.nd_method.get_ri_values_array(), self.nd_method.get_ni_values_array())
             self.view.nd_tab.update_table()
+            stage.count('values_rendered', len(self.nd_method.get_ni_values_array()))
 
-        self.model.write_pseudo_numbers(self.nd_method.get_ni_values_array(),
-                                        "pseudoRandomNumbersNormalDistribution.json")
+        self.model.write_pseudo_numbers_async(self.nd_method.get_ni_values_array(),
+                                              "pseudoRandomNumbersNormalDistribution.json")
 
     def presenter_uniform_distribution_method(self):
         """
         Ejecuta y presenta los resultados del método de distribución uniforme.
         """
-        try:
-            min_value = self.view.ud_tab.get_min_spin_box_value()
-            max_value = self.view.ud_tab.get_max_spin_box_value()
+        with self.model.instrumentation.stage('start_uniform_distribution'):
+            try:
+                min_value = self.view.ud_tab.get_min_spin_box_value()
+                max_value = self.view.ud_tab.get_max_spin_box_value()
 
-            if min_value > max_value:
-                raise ValueError("El valor de min debe ser menor que max.")
+                if min_value > max_value:
+                    raise ValueError("El valor de min debe ser menor que max.")
 
-            if self.selected_ri_values is not None:
-                self.ud_method = self.model.execute_uniform_distribution_method(min_value, max_value,
-                                                                                self.selected_ri_values)
-                self.view.ud_tab.set_data(self.ud_method.get_ri_values_array(), self.ud_method.get_ni_values_array())
-                self.view.ud_tab.update_table()
+                if self.selected_ri_values is not None:
+                    self.start_generation(self.view.ud_tab, self.show_uniform_distribution,
+                                          self.model.execute_uniform_distribution_method, min_value, max_value,
+                                          self.selected_ri_values)
+            except ValueError as e:
+                self.view.show_warning(str(e))
 
-            self.model.write_pseudo_numbers(self.ud_method.get_ni_values_array(),
-                                            "uniformDistributionNumbers.json")
-        except ValueError as e:
-            self.view.show_warning(str(e))
+    def show_uniform_distribution(self, ud_method):
+        """
+        Muestra y guarda los números generados por el método de distribución uniforme.
+
+        Parámetros:
+            ud_method (UniformDistributionMethod): Instancia con los números generados.
+        """
+        with self.model.instrumentation.stage('render_uniform_distribution') as stage:
+            self.ud_method = ud_method
+            self.view.ud_tab.set_data(self.ud_method.get_ri_values_array(), self.ud_method.get_ni_values_array())
+            self.view.ud_tab.update_table()
+            stage.count('values_rendered', len(self.ud_method.get_ni_values_array()))
+
+        self.model.write_pseudo_numbers_async(self.ud_method.get_ni_values_array(), "uniformDistributionNumbers.json")
+
+    def warn_short_period(self, analysis, iterations):
+        """
+        Advierte, antes de generar, si la secuencia se repetirá dentro de la cantidad de números pedida.
+
+        Parámetros:
+            analysis (dict): Resultado del análisis de periodo del modelo.
+            iterations (int): Cantidad de números a generar.
+        """
+        if analysis['period'] < iterations:
+            self.view.show_warning(f"Con estos parámetros el periodo es {analysis['period']} "
+                                   f"(máximo posible: {analysis['maximum_period']}), así que la secuencia se "
+                                   f"repetirá antes de generar {iterations} números.")
+
+    def warn_short_blocks(self, analysis):
+        """
+        Advierte, antes de generar, si el primer bloque del método lineal congruencial se cortará.
+
+        El método no genera una sola secuencia: cada bloque de BLOCK_SIZE números parte de la semilla
+        ``xo + BLOCK_SIZE * b`` (con g aumentando cuando la semilla alcanza m) y se corta al cerrar su ciclo,
+        así que el periodo desde xo solo describe al primer bloque.
+
+        Parámetros:
+            analysis (dict): Resultado de analyze_linear_congruential_period para xo.
+        """
+        block_size = LinearCongruentialMethod.BLOCK_SIZE
+        if analysis['period'] < block_size:
+            self.view.show_warning(f"Con estos parámetros el ciclo que parte de xo tiene {analysis['period']} "
+                                   f"valores (máximo posible: {analysis['maximum_period']}), así que el primer "
+                                   f"bloque de {block_size} números se cortará al cerrar su ciclo. Los bloques "
+                                   f"siguientes parten de xo + {block_size}·b y pueden repetir los mismos valores.")
+
+    def start_generation(self, tab, on_result, function, *args):
+        """
+        Ejecuta un método del modelo en un hilo aparte y conecta su avance y resultado con la pestaña.
+
+        Parámetros:
+            tab: Pestaña que muestra el avance y el resultado.
+            on_result (callable): Función que recibe la instancia generada, en el hilo de la interfaz.
+            function (callable): Método del modelo a ejecutar.
+            *args: Argumentos del método.
+        """
+        if tab in self.workers:
+            raise ValueError("Ya hay una generación en curso en esta pestaña.")
+        worker = GenerationWorker(function, *args)
+        self.workers[tab] = worker
+        worker.progress_changed.connect(tab.set_progress)
+        worker.result_ready.connect(on_result)
+        worker.failed.connect(self.view.show_warning)
+        worker.finished.connect(lambda: self.finish_generation(tab, worker))
+        tab.set_running(True)
+        worker.start()
+
+    def finish_generation(self, tab, worker):
+        """
+        Libera el hilo de una generación terminada, cancelada o fallida y restablece la pestaña.
+
+        Parámetros:
+            tab: Pestaña de la generación.
+            worker (GenerationWorker): Hilo que terminó.
+        """
+        if self.workers.get(tab) is worker:
+            del self.workers[tab]
+        tab.set_running(False)
+        worker.deleteLater()
+
+    def cancel_generation(self, tab):
+        """
+        Solicita cancelar la generación en curso de una pestaña.
+
+        Parámetros:
+            tab: Pestaña cuya generación se cancela.
+        """
+        worker = self.workers.get(tab)
+        if worker is not None:
+            worker.cancel()
 
     def on_tab_changed(self, tab_id):
         """
@@ -181,6 +362,17 @@ class Presenter:
         self.view.ud_tab.tab_selected.connect(self.on_tab_changed)
         self.view.nd_tab.generate_button.clicked.connect(self.presenter_normal_distribution_method)
         self.view.ud_tab.generate_button.clicked.connect(self.presenter_uniform_distribution_method)
+        self.write_errors.error.connect(self.view.show_warning)
+        for tab in (self.view.ms_tab, self.view.lc_tab, self.view.mc_tab, self.view.nd_tab, self.view.ud_tab):
+            tab.cancel_button.clicked.connect(lambda checked=False, tab=tab: self.cancel_generation(tab))
+
+    def stop_generations(self):
+        """
+        Cancela las generaciones en curso y espera a que sus hilos terminen, antes de cerrar la aplicación.
+        """
+        for worker in list(self.workers.values()):
+            worker.cancel()
+            worker.wait()
 
     def run(self):
         """
@@ -0,0 +1,49 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Tiempo máximo de todas las importaciones de cli.py (numpy incluido), en microsegundos como los da
+# -X importtime; con scipy o PyQt6 se supera con holgura.
+MAX_IMPORT_MICROSECONDS = 1500000
+
+
+def import_times(*arguments):
+    """
+    Ejecuta cli.py con -X importtime en un proceso aparte.
+
+    Parámetros:
+        arguments (str): Argumentos de cli.py.
+
+    Retorna:
+        tuple: Módulos importados y tiempo total de importación, en microsegundos.
+    """
+    completed = subprocess.run([sys.executable, '-X', 'importtime', 'cli.py', *arguments], cwd=ROOT,
+                               capture_output=True, text=True, timeout=60)
+    assert completed.returncode == 0, completed.stderr
+    modules = set()
+    total = 0
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        modules.add(name.strip())
+        # Los módulos importados directamente tienen un solo espacio de sangría; su tiempo acumulado
+        # ya incluye el de los que importan.
+        if not name.startswith('  '):
+            total += int(cumulative)
+    return modules, total
+
+
+@pytest.mark.parametrize('arguments', [
+    ('--help',),
+    ('lc', '--help'),
+    ('lc', '--xo', '7', '--k', '3', '--c', '7', '--g', '10', '--min', '1', '--max', '10', '-n', '5'),
+])
+def test_cli_does_not_import_scipy_or_qt(arguments):
+    modules, total = import_times(*arguments)
+    assert sorted(name for name in modules if name.split('.')[0] in ('scipy', 'PyQt6')) == []
+    assert total < MAX_IMPORT_MICROSECONDS
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from model.LinearCongruentialMethod import LinearCongruentialMethod
+from model.Methods import Methods
+
+# (xo, k, c, g, min, max, iteraciones, decimales)
+CASES = [
+    (7, 3, 7, 10, 1, 10, 2500, 5),
+    (0, 0, 1, 3, 0, 1, 300, 5),  # m = 8: los ciclos se cierran dentro de cada bloque
+    (5, 2, 0, 4, 0, 1, 200, 5),  # c = 0: los ciclos son cortos y hay bloques casi vacíos
+    (1500, 6, 1, 10, 2, 9, 3000, None),  # xo >= m: g aumenta después del primer bloque
+    (2 ** 10 - 50, 2, 3, 10, 0, 1, 3000, 2),  # la semilla alcanza m y g aumenta a mitad de la corrida
+    (17, 123, 45, 30, 1, 10, 20000, 5),
+]
+
+
+def generate(case, engine, **options):
+    lc = LinearCongruentialMethod(*case)
+    getattr(lc, engine)(**options)
+    return lc
+
+
+def assert_same_sequence(vectorized, tested):
+    assert np.array_equal(vectorized.xi_values, tested.xi_values)
+    assert np.array_equal(vectorized.ri_values, tested.ri_values)
+    assert np.array_equal(vectorized.ni_values, tested.ni_values)
+    assert (vectorized.xo, vectorized.g) == (tested.xo, tested.g)
+    assert int(vectorized.m) == int(tested.m)
+
+
+@pytest.mark.parametrize('case', CASES)
+def test_vectorized_matches_tested(case):
+    tested = generate(case, 'generate_numbers_tested')
+    assert len(tested.ri_values) == case[6]
+    assert_same_sequence(generate(case, 'generate_numbers_vectorized'), tested)
+
+
+def test_vectorized_matches_tested_across_g_bump():
+    case = (2 ** 10 - 50, 2, 3, 10, 0, 1, 3000, 2)
+    vectorized = generate(case, 'generate_numbers_vectorized')
+    assert vectorized.g > case[3]
+    assert_same_sequence(vectorized, generate(case, 'generate_numbers_tested'))
+
+
+@pytest.mark.parametrize('case', [CASES[0], CASES[1], CASES[4]])
+def test_parallel_matches_tested(case):
+    model = Methods(cache=False)
+    try:
+        parallel = model.execute_linear_congruential_parallel(*case, workers=2)
+    finally:
+        model.close()
+    assert_same_sequence(parallel, generate(case, 'generate_numbers_tested'))
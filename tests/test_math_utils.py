@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from model.Utils.MathUtils import MathUtils
+
+
+def sample_values():
+    rng = np.random.default_rng(7)
+    return np.concatenate([
+        rng.random(20000),
+        rng.uniform(-1000, 1000, 20000),
+        # Valores decimales a la mitad entre dos resultados: el producto queda justo al lado del empate.
+        (rng.integers(-10 ** 7, 10 ** 7, 20000) + 0.5) / 10 ** 5,
+        # Empates exactos en binario para 0, 1 y 2 decimales.
+        [0.5, 1.5, 2.5, -2.5, 0.25, 0.75, 0.125, 0.375, -0.625, 0.05, 1.005],
+        [np.nan, np.inf, -np.inf, 0.0, -0.0, 5e-324, -1e-300, 1e15, 4.5e15, 1e300, -1e300],
+    ])
+
+
+def same_bits(result, expected):
+    return np.array_equal(np.asarray(result).view(np.uint64), np.asarray(expected).view(np.uint64))
+
+
+@pytest.mark.parametrize('decimals', [0, 1, 2, 5, 8])
+def test_truncate_array_matches_format_bit_for_bit(decimals):
+    values = sample_values()
+    expected = np.array([float(f'{value:.{decimals}f}') for value in values.tolist()])
+    result = MathUtils.truncate_array(values, decimals)
+    nan = np.isnan(expected)
+    assert np.array_equal(np.isnan(result), nan)
+    assert same_bits(result[~nan], expected[~nan])
+
+
+def test_truncate_array_keeps_shape_and_matches_truncate():
+    values = sample_values()[:600].reshape(20, 30)
+    result = MathUtils.truncate_array(values)
+    assert result.shape == (20, 30)
+    assert same_bits(result[np.isfinite(result)],
+                     [MathUtils.truncate(value) for value in values[np.isfinite(result)].tolist()])
+
+
+def test_truncate_array_without_decimals_keeps_full_precision():
+    values = sample_values()
+    result = MathUtils.truncate_array(values, None)
+    assert result.dtype == np.float64
+    assert same_bits(result, values)
+    assert same_bits(MathUtils.truncate_array(values.tolist(), None), values)
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from cli import main
+from model.Methods import Methods
+from model.MiddleSquareMethod import MiddleSquareMethod
+
+
+def test_seed_with_max_digits_is_generated():
+    seed = 1234567890123456789
+    generator = MiddleSquareMethod(seed, 1, 10, 5)
+    generator.generate_randoms()
+    assert int(generator.xi_values[0]) == seed
+    assert int(generator.centers[0]) == generator.center_digits(seed, MiddleSquareMethod.MAX_DIGITS)
+
+
+def test_wider_seed_is_rejected():
+    with pytest.raises(ValueError, match='at most 19 digits'):
+        MiddleSquareMethod(12345678901234567890, 1, 10, 5)
+    with pytest.raises(ValueError, match='at most 19 digits'):
+        Methods().execute_middle_square(12345678901234567890, 1, 10, 5)
+
+
+def test_cli_reports_wider_seed_as_usage_error(capsys):
+    with pytest.raises(SystemExit) as raised:
+        main(['ms', '--seed', '12345678901234567890', '--min', '1', '--max', '10', '-n', '5'])
+    assert raised.value.code == 2
+    assert 'at most 19 digits' in capsys.readouterr().err
+
+
+@pytest.mark.parametrize('seed', [7, 1234, 5735, 540100, 1234567890, 9876543210123])
+def test_single_seed_sequence_matches_batched_kernel(seed):
+    digits = len(str(seed))
+    states, period, stop = MiddleSquareMethod.generate_sequence(seed, 5000, digits)
+    batch, periods, stops = MiddleSquareMethod.generate_many([seed], 5000, digits)
+    assert states.dtype == 'uint64'
+    assert states.tolist() == [int(value) for value in batch[0]]
+    assert (period, stop) == (int(periods[0]), int(stops[0]))
+
+
+def test_chunks_match_generated_sequence():
+    generator = MiddleSquareMethod(1234567890, 1, 10, 2500, decimals=5)
+    generator.generate_randoms()
+    chunks = list(generator.iter_chunks(700))
+    for position, values in enumerate((generator.xi_values, generator.ri_values, generator.ni_values)):
+        assert np.array_equal(np.concatenate([chunk[position] for chunk in chunks]), values)
+
+
+def test_values_are_truncated_to_five_decimals_by_default():
+    generated = Methods(cache=False).execute_middle_square(5735, 1, 10, 50)
+    streamed = next(Methods().stream_middle_square(5735, 1, 10, 50))
+    for values in (generated.ri_values, generated.ni_values, streamed[1], streamed[2]):
+        assert all(value == float(f'{value:.5f}') for value in values.tolist())
+    full = Methods(cache=False).execute_middle_square(5735, 1, 10, 50, decimals=None)
+    assert not np.array_equal(full.ni_values, generated.ni_values)
@@ -0,0 +1,57 @@
+import pytest
+
+from model.Utils.ParameterSearch import ParameterSearch
+from model.Utils.ProgressReporter import GenerationCancelled, ProgressReporter
+
+SEARCHES = [('lc', 12), ('mc', 14)]
+
+
+def cancel_after(limit):
+    """
+    Crea un reportero que pide cancelar la búsqueda en cuanto se informan ``limit`` candidatos evaluados.
+    """
+    def callback(done, total):
+        if done >= limit:
+            progress.cancel()
+
+    progress = ProgressReporter(callback)
+    return progress
+
+
+def ranking(result):
+    return -result['worst_score'], -sum(result['scores']) / len(result['scores']), result['multiplier']
+
+
+@pytest.mark.parametrize('method, g', SEARCHES)
+def test_pruning_keeps_the_exhaustive_top(method, g):
+    search = ParameterSearch(method, g, top=5, dimensions=6, batch_size=50)
+    candidates = [ParameterSearch.evaluate(method, value, g, search.c, 6, threshold=0.0)
+                  for value in range(search.start, search.stop)]
+    exhaustive = sorted((result for result in candidates if result is not None), key=ranking)[:5]
+    result = search.run(workers=1)
+    assert result['complete'] and result['evaluated'] == search.size
+    assert result['pruned'] > 0
+    assert result['best'] == exhaustive
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+@pytest.mark.parametrize('method, g', SEARCHES)
+def test_cancelled_search_resumes_to_the_same_top(method, g, workers, tmp_path):
+    uninterrupted = ParameterSearch(method, g, top=5, dimensions=6, batch_size=50, seed=4).run(workers=1)
+    checkpoint = str(tmp_path / 'search.json')
+    with pytest.raises(GenerationCancelled):
+        ParameterSearch(method, g, top=5, dimensions=6, batch_size=50, seed=4).run(
+            workers=workers, checkpoint=checkpoint, progress=cancel_after(300))
+    resumed_search = ParameterSearch(method, g, top=5, dimensions=6, batch_size=50, seed=4)
+    resumed_search.load_checkpoint(checkpoint)
+    assert 0 < resumed_search.evaluated < resumed_search.size
+    resumed = resumed_search.run(workers=workers, checkpoint=checkpoint)
+    assert resumed['complete'] and resumed['evaluated'] == uninterrupted['evaluated']
+    assert resumed['best'] == uninterrupted['best']
+
+
+def test_checkpoint_of_a_different_search_is_rejected(tmp_path):
+    checkpoint = str(tmp_path / 'search.json')
+    ParameterSearch('lc', 8, top=3, dimensions=4).run(workers=1, checkpoint=checkpoint)
+    with pytest.raises(ValueError, match='different search'):
+        ParameterSearch('lc', 8, top=4, dimensions=4).run(workers=1, checkpoint=checkpoint)
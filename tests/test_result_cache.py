@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from model.Methods import Methods
+from model.Utils.ResultCache import ResultCache
+
+
+def test_put_freezes_arrays_without_copying():
+    cache = ResultCache()
+    values = np.arange(10, dtype=np.float64)
+    stored = cache.put(('key',), 10, {'ri': values})
+    assert stored['ri'] is values
+    assert not values.flags.writeable
+    assert cache.get(('key',), 10)[0]['ri'] is values
+
+
+def test_entry_larger_than_limit_is_not_remembered():
+    cache = ResultCache(max_bytes=64)
+    cache.put(('key',), 10, {'ri': np.zeros(10)})
+    assert cache.get(('key',), 10) is None
+    assert cache.size == 0
+
+
+def test_execute_results_are_read_only_and_shared_with_cache():
+    model = Methods()
+    first = model.execute_linear_congruential(7, 3, 7, 10, 1, 10, 500)
+    with pytest.raises(ValueError):
+        first.ri_values[0] = 0
+    second = model.execute_linear_congruential(7, 3, 7, 10, 1, 10, 500)
+    assert np.shares_memory(first.ri_values, second.ri_values)
@@ -0,0 +1,65 @@
+import itertools
+import math
+import random
+
+import numpy as np
+
+from model.Utils.SpectralTest import SpectralTest
+
+
+def shortest_vector_brute_force(differences, m, dimensions, bound):
+    """
+    Busca por fuerza bruta el vector no nulo más corto s con ``s · d ≡ 0 (mod m)`` para todas las
+    diferencias d entre puntos; su largo es ν_t de la red que forman los puntos.
+    """
+    best = None
+    for s in itertools.product(range(-bound, bound + 1), repeat=dimensions):
+        if any(s) and not np.any(differences @ np.array(s, dtype=object) % m):
+            square = sum(value * value for value in s)
+            best = square if best is None else min(best, square)
+    return best
+
+
+def lattice_points(a, m, x0, dimensions, count):
+    """
+    Retorna las diferencias ``P(n) - P(0)`` de los puntos ``P(n) = (X(n), ..., X(n+t-1))`` de
+    ``X(n+1) = a * X(n) mod m``.
+    """
+    states = [x0]
+    for _ in range(count + dimensions):
+        states.append(a * states[-1] % m)
+    points = np.array([states[n:n + dimensions] for n in range(count)], dtype=object)
+    return points - points[0]
+
+
+def test_shortest_vectors_match_brute_force():
+    random.seed(1)
+    for _ in range(20):
+        m = random.choice([64, 128, 256])
+        a = random.randrange(1, m, 2)
+        squares = SpectralTest.shortest_vectors(a, m, 4)
+        for t in range(2, 5):
+            bound = math.isqrt(int(squares[t])) + 1
+            # La red completa de a módulo m la genera el vector (1, a, ..., a^(t-1)).
+            differences = np.array([[pow(a, i, m) for i in range(t)]], dtype=object)
+            assert squares[t] == shortest_vector_brute_force(differences, m, t, bound)
+
+
+def test_multiplicative_congruential_uses_the_orbit_lattice():
+    g = 10
+    m = 2 ** g
+    for t in (1, 2, 5, 17):
+        a = 8 * t + 3
+        # Los puntos reales de una semilla impar, no la red completa de a módulo m.
+        differences = lattice_points(a, m, 7, 3, m // 4)
+        result = SpectralTest.analyze_multiplicative_congruential(t, g, 3)
+        for dimension in (2, 3):
+            square = result['dimensions'][dimension]['nu_squared']
+            bound = math.isqrt(square) + 1
+            assert square == shortest_vector_brute_force(differences[:, :dimension], m, dimension, bound)
+
+
+def test_known_multiplier_is_scored_quickly():
+    result = SpectralTest.analyze(6364136223846793005, 2 ** 64)
+    assert 0.6 < result['worst_score'] <= 1.0
+    assert all(0.0 < value['score'] <= 1.0 for value in result['dimensions'].values())
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from model.Methods import Methods
+from model.Utils.MathUtils import MathUtils
+from model.Utils.StatisticalTests import KolmogorovSmirnovTest, PokerTest, StatisticalTests
+
+
+def uniform_values(count=200000):
+    return MathUtils.truncate_array(np.random.default_rng(11).random(count))
+
+
+def assert_same_results(first, second):
+    assert first.keys() == second.keys()
+    for name, result in first.items():
+        for field, value in result.items():
+            if isinstance(value, float):
+                assert second[name][field] == pytest.approx(value, rel=1e-12, abs=1e-15), (name, field)
+            else:
+                assert second[name][field] == value, (name, field)
+
+
+def test_chunked_input_gives_the_same_results_as_whole_input():
+    values = uniform_values()
+    whole = StatisticalTests()
+    whole.update(values)
+    chunked = StatisticalTests()
+    edges = [0, 1, 2, 3, 1000, 1001, 77777, 150000, values.size]
+    for start, stop in zip(edges, edges[1:]):
+        chunked.update(values[start:stop])
+    assert_same_results(whole.results(), chunked.results())
+    streamed = Methods().stream_statistical_tests(np.array_split(values, 7))
+    assert_same_results(whole.results(), streamed.results())
+
+
+@pytest.mark.parametrize('count', [50, 5000, 200000])
+def test_kolmogorov_smirnov_bound_is_within_one_bin_of_scipy(count):
+    scipy_stats = pytest.importorskip('scipy.stats')
+    values = np.random.default_rng(count).random(count)
+    test = KolmogorovSmirnovTest()
+    test.update(values)
+    exact = scipy_stats.kstest(values, 'uniform').statistic
+    statistic = test.result(0.05)['statistic']
+    assert exact - 1e-12 <= statistic <= exact + 1 / test.bins
+
+
+def test_uniform_values_pass():
+    tests = StatisticalTests()
+    tests.update(uniform_values())
+    assert tests.passed
+
+
+@pytest.mark.parametrize('transform', [np.square, np.sort, lambda values: values * 0.9,
+                                       lambda values: np.round(values, 1)])
+def test_non_uniform_values_fail(transform):
+    tests = StatisticalTests()
+    tests.update(transform(uniform_values()))
+    assert not tests.passed
+
+
+def hands(values):
+    test = PokerTest()
+    test.update(np.asarray(values, dtype=np.float64))
+    return [hand for hand, count in zip(PokerTest.HANDS, test.observed.tolist()) for _ in range(count)]
+
+
+def test_poker_uses_the_first_five_decimals_without_rounding():
+    # Al redondear, 0.999995 sería 1.00000 (dígitos 00000) y 0.123449 sería 0.12345 (todos diferentes).
+    assert hands([0.999995]) == ['five_of_a_kind']
+    assert hands([0.123449]) == ['one_pair']
+    assert hands([0.9999999999]) == ['five_of_a_kind']
+
+
+def test_poker_keeps_the_digits_of_values_truncated_to_five_decimals():
+    numbers = np.arange(100000)
+    values = MathUtils.truncate_array(numbers / 1e5)
+    test = PokerTest()
+    test.update(values)
+    expected = np.bincount(PokerTest.classify(numbers), minlength=len(PokerTest.HANDS))
+    assert test.observed.tolist() == expected.tolist()
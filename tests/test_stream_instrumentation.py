@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+from cli import main
+from model.Methods import Methods
+from model.Utils.Instrumentation import Instrumentation
+
+GENERATORS = {
+    'ms': ('stream_middle_square', (5735, 1, 10, 2500)),
+    'lc': ('stream_linear_congruential', (7, 3, 7, 10, 1, 10, 2500)),
+    'mc': ('stream_multiplicative_congruential', (7, 3, 10, 1, 10, 2500)),
+}
+
+
+@pytest.mark.parametrize('method', sorted(GENERATORS))
+def test_stream_records_generation_stages(method, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    records = []
+    model = Methods(instrumentation=Instrumentation([records.append]))
+    name, arguments = GENERATORS[method]
+    chunks = getattr(model, name)(*arguments, chunk_size=1000)
+    model.write_pseudo_numbers_stream((chunk[1] for chunk in chunks), 'values.json')
+
+    stages = {record['stage'] for record in records}
+    assert {'generation', 'ni_mapping', 'write_pseudo_numbers'} <= stages
+    if method == 'lc':
+        assert 'filter_ri_numbers' in stages
+    # Las etapas del cálculo ocurren mientras se escribe, así que quedan dentro de la escritura.
+    assert all(record['parent'] == 'write_pseudo_numbers' for record in records
+               if record['stage'] != 'write_pseudo_numbers')
+    written = next(record for record in records if record['stage'] == 'write_pseudo_numbers')
+    assert written['counters']['values_written'] == 2500
+
+
+def test_cli_trace_records_streamed_stages(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    main(['lc', '--xo', '7', '--k', '3', '--c', '7', '--g', '10', '--min', '1', '--max', '10', '-n', '500',
+          '--trace', 'trace.jsonl'])
+    assert len(capsys.readouterr().out.split()) == 500
+    with open('trace.jsonl') as file:
+        stages = [json.loads(line)['stage'] for line in file]
+    assert {'generation', 'filter_ri_numbers', 'ni_mapping', 'write_pseudo_numbers'} <= set(stages)
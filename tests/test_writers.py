@@ -0,0 +1,100 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from model.Methods import Methods
+
+REALS = np.array([0.0, 0.12345, 0.99999, 1 / 3, 2.5e-300, 123456.789])
+XI = np.array([0, 1, 2 ** 32 - 1, 2 ** 53 + 1, 2 ** 63 + 5, 2 ** 64 - 1], dtype=np.uint64)
+
+
+@pytest.fixture
+def model(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    model = Methods(cache=False)
+    yield model
+    model.close()
+
+
+@pytest.mark.parametrize('file_name', ['values.json', 'values.ndjson', 'values.npy', 'values.f64', 'values'])
+def test_reals_round_trip(model, file_name):
+    path = model.write_pseudo_numbers(REALS, file_name)
+    assert path == os.path.join('NumbersGenerated', file_name)
+    result = model.read_pseudo_numbers(file_name)
+    assert result.dtype == np.float64
+    assert np.array_equal(result, REALS)
+
+
+@pytest.mark.parametrize('file_name', ['xi.json', 'xi.ndjson', 'xi.npy'])
+def test_xi_round_trip_exactly(model, file_name):
+    model.write_pseudo_numbers(XI, file_name)
+    result = model.read_pseudo_numbers(file_name)
+    assert result.dtype == np.uint64
+    assert result.tolist() == XI.tolist()
+
+
+def test_u32_round_trip(model):
+    values = np.array([0, 7, 2 ** 31, 2 ** 32 - 1], dtype=np.uint64)
+    model.write_pseudo_numbers(values, 'xi.u32')
+    assert os.path.getsize(os.path.join('NumbersGenerated', 'xi.u32')) == 4 * values.size
+    assert model.read_pseudo_numbers('xi.u32').tolist() == values.tolist()
+    with pytest.raises(ValueError, match='u32'):
+        model.write_pseudo_numbers(np.array([2 ** 32], dtype=np.uint64), 'wide.u32')
+
+
+def test_json_matches_json_dump(model):
+    model.write_pseudo_numbers_stream([REALS[:2], REALS[2:2], REALS[2:]], 'values.json')
+    with open(os.path.join('NumbersGenerated', 'values.json')) as file:
+        assert file.read() == json.dumps({'numbers': REALS.tolist()})
+
+
+@pytest.mark.parametrize('file_name', ['values.ndjson', 'values.npy', 'values.f64'])
+def test_chunks_are_written_like_one_array(model, file_name):
+    model.write_pseudo_numbers_stream(np.array_split(REALS, 4), file_name)
+    assert np.array_equal(model.read_pseudo_numbers(file_name), REALS)
+
+
+def test_npy_opens_as_memmap(model):
+    model.write_pseudo_numbers_stream(np.array_split(XI, 3), 'xi.npy')
+    result = model.read_pseudo_numbers('xi.npy', mmap=True)
+    assert isinstance(result, np.memmap)
+    assert result.tolist() == XI.tolist()
+
+
+def test_f64_refuses_integers_above_2_53(model):
+    model.write_pseudo_numbers(np.array([2 ** 53, 0], dtype=np.uint64), 'exact.f64')
+    assert model.read_pseudo_numbers('exact.f64').tolist() == [2.0 ** 53, 0.0]
+    with pytest.raises(ValueError, match='2\\^53'):
+        model.write_pseudo_numbers(np.array([2 ** 53 + 1], dtype=np.uint64), 'lossy.f64')
+    with pytest.raises(ValueError, match='2\\^53'):
+        model.write_pseudo_numbers([-(2 ** 53) - 1], 'lossy.f64')
+
+
+def test_npy_chunks_must_keep_the_first_type(model):
+    with pytest.raises(ValueError, match='npy'):
+        model.write_pseudo_numbers_stream([XI, REALS], 'mixed.npy')
+
+
+@pytest.mark.parametrize('file_name', ['empty.f64', 'empty.u32', 'empty.npy', 'empty.json', 'empty.ndjson'])
+def test_empty_files_round_trip(model, file_name):
+    model.write_pseudo_numbers([], file_name)
+    assert model.read_pseudo_numbers(file_name).size == 0
+    assert model.read_pseudo_numbers(file_name, mmap=True).size == 0
+
+
+def test_unknown_extension_is_rejected(model):
+    with pytest.raises(ValueError, match='unknown extension'):
+        model.write_pseudo_numbers(REALS, 'values.csv')
+    assert model.write_pseudo_numbers(REALS, 'values.csv', file_format='ndjson').endswith('values.csv')
+
+
+def test_async_writes_reach_the_disk(model):
+    futures = [model.write_pseudo_numbers_async(REALS, 'values.npy'),
+               model.write_pseudo_numbers_async(iter(np.array_split(XI, 2)), 'xi.npy')]
+    assert model.flush_writes(timeout=30)
+    assert [future.result() for future in futures] == [os.path.join('NumbersGenerated', 'values.npy'),
+                                                        os.path.join('NumbersGenerated', 'xi.npy')]
+    assert np.array_equal(model.read_pseudo_numbers('values.npy'), REALS)
+    assert model.read_pseudo_numbers('xi.npy').tolist() == XI.tolist()
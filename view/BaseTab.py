@@ -1,10 +1,11 @@
 import numpy as np
 import pyqtgraph as pg
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtWidgets import (QWidget, QLabel, QSpinBox, QPushButton, QFrame,
-                             QTableWidget, QTableWidgetItem, QHeaderView, QVBoxLayout,
-                             QHBoxLayout)
-from PyQt6.QtGui import QFont
+                             QTableView, QHeaderView, QVBoxLayout,
+                             QHBoxLayout, QProgressBar)
+
+from view.ValuesTableModel import ValuesTableModel
 
 
 class BaseTab(QWidget):
@@ -27,12 +28,24 @@ class BaseTab(QWidget):
         self.generate_button.clicked.connect(self.generate_button_clicked)
         self.main_layout.addWidget(self.generate_button)
 
+        # Barra de progreso y botón para cancelar la generación en curso.
+        self.progress_layout = QHBoxLayout()
+        self.progress_bar = QProgressBar(self)
+        self.progress_bar.setRange(0, 100)
+        self.cancel_button = QPushButton("Cancel", self)
+        self.cancel_button.setEnabled(False)
+        self.progress_layout.addWidget(self.progress_bar)
+        self.progress_layout.addWidget(self.cancel_button)
+        self.main_layout.addLayout(self.progress_layout)
+
         self.line = QFrame(self)
         self.line.setFrameShape(QFrame.Shape.HLine)
         self.line.setFrameShadow(QFrame.Shadow.Sunken)
         self.main_layout.addWidget(self.line)
 
-        self.table = QTableWidget(self)
+        self.table = QTableView(self)
+        self.table_model = ValuesTableModel(parent=self)
+        self.table.setModel(self.table_model)
         self.configure_table()
         self.main_layout.addWidget(self.table)
 
@@ -44,13 +57,34 @@ class BaseTab(QWidget):
         self.data2 = None
         self.data3 = None
 
+    def set_running(self, running):
+        """
+        Habilita los controles según haya una generación en curso.
+
+        Parámetros:
+            running (bool): True mientras se generan los números.
+        """
+        self.generate_button.setEnabled(not running)
+        self.cancel_button.setEnabled(running)
+        if running:
+            self.progress_bar.setValue(0)
+
+    def set_progress(self, value):
+        """
+        Actualiza la barra de progreso.
+
+        Parámetros:
+            value (int): Porcentaje completado (0 a 100).
+        """
+        self.progress_bar.setValue(value)
+
     def configure_table(self):
         """
         Configura las propiedades de la tabla de datos.
         """
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 gridline-color: black;
                 color: black;
             }
@@ -79,8 +113,10 @@ class BaseTab(QWidget):
                 background: none;
             }
         """)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         self.table.verticalHeader().setVisible(False)
+        # Todas las filas miden lo mismo, así la vista no mide el contenido de cada una.
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
 
     def configure_graph(self):
         """
@@ -117,8 +153,7 @@ class BaseTab(QWidget):
         Parámetros:
             headers (list): Lista de encabezados de la tabla.
         """
-        self.table.setColumnCount(len(headers))
-        self.table.setHorizontalHeaderLabels(headers)
+        self.table_model.set_headers(headers)
 
     def set_graph_labels(self, x_label, y_label, title):
         """
@@ -155,39 +190,19 @@ class BaseTab(QWidget):
         """
         Limpia el contenido de la tabla de datos.
         """
-        self.table.clearContents()
+        self.table_model.clear()
 
     def set_table_data(self, iterations):
         """
         Establece los datos de la tabla de datos.
 
+        La tabla lee los arreglos directamente y solo formatea las filas visibles, por lo que
+        se muestran todas las iteraciones sin costo inicial.
+
         Parámetros:
             iterations (int): Número de iteraciones para mostrar en la tabla.
         """
-        max_rows = min(iterations, 1000)  # Limitar a 1000 filas como máximo
-        self.table.setRowCount(max_rows)
-        self.table.setColumnCount(4)
-
-        # Llenar la tabla con datos.
-        for i in range(iterations):
-            item_i = QTableWidgetItem(str(i + 1))
-            item_i.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(i, 0, item_i)
-
-            item1 = QTableWidgetItem(str(self.data1[i]))
-            item1.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(i, 1, item1)
-
-            item2 = QTableWidgetItem(str(self.data2[i]))
-            item2.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(i, 2, item2)
-
-            item3 = QTableWidgetItem(str(self.data3[i]))
-            item3.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(i, 3, item3)
-        font = QFont()
-        font.setBold(True)
-        self.table.horizontalHeader().setFont(font)
+        self.table_model.set_columns([self.data1, self.data2, self.data3], iterations)
 
     def set_graph_type(self, graph_type):
         """
@@ -207,21 +222,25 @@ class BaseTab(QWidget):
         """
         self.clear_graph()
         if self.graph_type == 'scatter':
-            self.create_scatter_graph(min(iterations, 500))
+            self.create_scatter_graph(min(iterations, len(self.data2)))
         self.graphWidget.getViewBox().autoRange()
 
     def create_scatter_graph(self, iterations):
         """
         Crea un gráfico de dispersión con los datos.
 
+        Todos los puntos se cargan de una vez como arreglos. Al alejarse, pyqtgraph dibuja solo una
+        muestra proporcional al ancho en píxeles y omite los puntos fuera de la vista, así que se puede
+        recorrer la secuencia completa aunque tenga millones de valores.
+
         Parámetros:
             iterations (int): Número de iteraciones para mostrar en el gráfico.
         """
-        scatter = pg.ScatterPlotItem(size=10)
-        scatter.setBrush(pg.mkBrush('r'))
-
-        for i in range(1, iterations + 1):
-            scatter.addPoints([i], [self.data2[i - 1]])
+        x_data = np.arange(1, iterations + 1)
+        y_data = np.asarray(self.data2[:iterations], dtype=np.float64)
+        scatter = pg.PlotDataItem(x_data, y_data, pen=None, symbol='o', symbolSize=10, symbolBrush=pg.mkBrush('r'))
+        scatter.setDownsampling(auto=True, method='subsample')
+        scatter.setClipToView(True)
 
         # Agregue el diagrama de dispersión al widget de gráfico.
         self.graphWidget.addItem(scatter)
@@ -255,7 +274,5 @@ class BaseTab(QWidget):
         self.clear_table()
         self.clear_graph()
         self.set_table_data(iterations)
-        counts, bins = np.histogram(self.data2[:500], bins=121)
-        self.add_bar_graph(np.arange(len(counts)), counts)
         self.set_graph_type('scatter')
         self.add_graph(iterations)
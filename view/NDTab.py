@@ -1,10 +1,12 @@
 import numpy as np
 from scipy.stats import norm
 import pyqtgraph as pg
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtWidgets import (QWidget, QLabel, QSpinBox, QPushButton, QFrame,
-                             QTableWidget, QTableWidgetItem, QHeaderView, QComboBox, QVBoxLayout, QHBoxLayout)
+                             QTableView, QHeaderView, QComboBox, QVBoxLayout, QHBoxLayout, QProgressBar)
+
+from model.Utils.HistogramService import HistogramService
+from view.ValuesTableModel import ValuesTableModel
 
 
 class NormalDistributionTab(QWidget):
@@ -32,6 +34,7 @@ class NormalDistributionTab(QWidget):
         self.graph_data = None
         self.ri_table_data = None
         self.ni_table_data = None
+        self.histograms = HistogramService()
         self.main_layout = QVBoxLayout(self)
         self.input_layout = QHBoxLayout()
         self.init_ui()
@@ -82,23 +85,55 @@ class NormalDistributionTab(QWidget):
         self.input_layout.addWidget(self.generate_button)
         self.generate_button.clicked.connect(self.generate_button_clicked)
 
+        # Inicializa y agrega la barra de progreso y el botón para cancelar la generación en curso.
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.input_layout.addWidget(self.progress_bar)
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.setEnabled(False)
+        self.input_layout.addWidget(self.cancel_button)
+
         # Inicializa y agrega una línea horizontal como separador.
         self.line = QFrame()
         self.line.setFrameShape(QFrame.Shape.HLine)
         self.line.setFrameShadow(QFrame.Shadow.Sunken)
         self.main_layout.addWidget(self.line)
 
+    def set_running(self, running):
+        """
+            Este método habilita los controles según haya una generación en curso.
+
+        Parámetros:
+            running (bool): True mientras se generan los números.
+        """
+        self.generate_button.setEnabled(not running)
+        self.cancel_button.setEnabled(running)
+        if running:
+            self.progress_bar.setValue(0)
+
+    def set_progress(self, value):
+        """
+            Este método actualiza la barra de progreso.
+
+        Parámetros:
+            value (int): Porcentaje completado (0 a 100).
+        """
+        self.progress_bar.setValue(value)
+
     def init_table(self):
         """
-            Este método inicializa el QTableWidget para mostrar los datos.
+            Este método inicializa la QTableView que muestra los datos a través de un ValuesTableModel.
         """
-        self.table = QTableWidget()
+        self.table = QTableView()
+        self.table_model = ValuesTableModel(['Iteration', 'Ri', 'Ni'], self)
+        self.table.setModel(self.table_model)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         self.table.verticalHeader().setVisible(False)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         # Establece el estilo de la tabla.
         self.table.setStyleSheet("""
-                                             QTableWidget {
+                                             QTableView {
                                                  gridline-color: black;
                                                  color: black;
                                              }
@@ -167,33 +202,8 @@ class NormalDistributionTab(QWidget):
         if not self.ri_table_data or not self.ni_table_data:
             return
 
-        iterations = len(self.ri_table_data)
-        self.table.setRowCount(iterations)
-        self.table.setColumnCount(3)
-
-        # Establece las etiquetas del encabezado de la tabla.
-        header_labels = ['Iteration', 'Ri', 'Ni']
-        self.table.setHorizontalHeaderLabels(header_labels)
-
-        # Llenar la tabla con datos.
-        for i in range(iterations):
-            item_i = QTableWidgetItem(str(i + 1))
-            item_i.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(i, 0, item_i)
-
-            item_ri = QTableWidgetItem(str(self.ri_table_data[i]))
-            item_ri.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(i, 1, item_ri)
-
-            # Añadir los valores Ni a la tabla.
-            item_ni = QTableWidgetItem(str(self.ni_table_data[i]))
-            item_ni.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(i, 2, item_ni)
-
-        # Establece los encabezados de las columnas en negrita.
-        font = QFont()
-        font.setBold(True)
-        self.table.horizontalHeader().setFont(font)
+        # La tabla lee los arreglos directamente y solo formatea las filas visibles.
+        self.table_model.set_columns([self.ri_table_data, self.ni_table_data])
         self.create_graph()
 
     def create_graph(self):
@@ -203,11 +213,14 @@ class NormalDistributionTab(QWidget):
         if not self.graph_data:
             return
 
-        # Calcular el histograma a partir de los datos de Ni
-        counts, bins = np.histogram(self.graph_data, bins=self.get_intervals_spin_box_value(), density=True)
+        # Calcular el histograma a partir de los datos de Ni con la cantidad de intervalos indicada (o, si es 0,
+        # la de Freedman–Diaconis); el resultado queda guardado mientras los datos no cambien.
+        histogram = self.histograms.histogram(self.graph_data, bins=self.get_intervals_spin_box_value() or None,
+                                              key='ni')
+        counts, bins = histogram.density(), histogram.edges
 
         # Crear puntos para la línea de la campana de Gauss
-        curve_bins = np.linspace(min(bins), max(bins), 300)
+        curve_bins = np.linspace(bins[0], bins[-1], 300)
         curve = norm.pdf(curve_bins, self.get_mean_spin_box_value(), self.get_standard_deviation_spin_box_value())
 
         # Crear el objeto BarGraphItem para el histograma
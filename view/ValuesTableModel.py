@@ -0,0 +1,110 @@
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt6.QtGui import QFont
+
+
+class ValuesTableModel(QAbstractTableModel):
+    """
+    Modelo de tabla que muestra directamente los arreglos de resultados (Xi, Ri, Ni).
+
+    La primera columna es el número de iteración y las demás leen los arreglos sin copiarlos; el texto
+    de cada celda se genera solo cuando la vista la pinta, así que la tabla puede recorrer millones de
+    filas sin costo inicial.
+    """
+
+    def __init__(self, headers=(), parent=None):
+        """
+        Inicializa el modelo sin datos.
+
+        Parámetros:
+            headers (list): Encabezados de las columnas, empezando por la de iteración.
+            parent (QObject): Objeto padre.
+        """
+        super().__init__(parent)
+        self.headers = list(headers)
+        self.columns = []
+        self.rows = 0
+        self.header_font = QFont()
+        self.header_font.setBold(True)
+
+    def set_headers(self, headers):
+        """
+        Cambia los encabezados de las columnas.
+
+        Parámetros:
+            headers (list): Encabezados, empezando por la columna de iteración.
+        """
+        self.beginResetModel()
+        self.headers = list(headers)
+        self.endResetModel()
+
+    def set_columns(self, columns, rows=None):
+        """
+        Reemplaza los arreglos que se muestran.
+
+        Parámetros:
+            columns (list): Arreglos de cada columna de datos, sin incluir la de iteración.
+            rows (int): Cantidad máxima de filas; por defecto la longitud del arreglo más largo.
+        """
+        self.beginResetModel()
+        self.columns = [column for column in columns if column is not None]
+        longest = max((len(column) for column in self.columns), default=0)
+        self.rows = longest if rows is None else max(0, min(rows, longest))
+        self.endResetModel()
+
+    def clear(self):
+        """
+        Quita todos los datos de la tabla.
+        """
+        self.set_columns([])
+
+    def rowCount(self, parent=QModelIndex()):
+        """
+        Retorna:
+            int: Cantidad de filas (0 para índices hijos, ya que la tabla es plana).
+        """
+        return 0 if parent.isValid() else self.rows
+
+    def columnCount(self, parent=QModelIndex()):
+        """
+        Retorna:
+            int: Cantidad de columnas según los encabezados.
+        """
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """
+        Formatea una celda en el momento en que la vista la necesita.
+
+        Parámetros:
+            index (QModelIndex): Celda solicitada.
+            role (Qt.ItemDataRole): Tipo de dato solicitado.
+
+        Retorna:
+            str | Qt.AlignmentFlag | None: Texto o alineación de la celda.
+        """
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        row = index.row()
+        column = index.column()
+        if column == 0:
+            return str(row + 1)
+        if column > len(self.columns) or row >= len(self.columns[column - 1]):
+            return None
+        value = self.columns[column - 1][row]
+        return str(value.item() if hasattr(value, 'item') else value)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """
+        Retorna el texto y la fuente en negrita de los encabezados horizontales.
+        """
+        if orientation != Qt.Orientation.Horizontal or section >= len(self.headers):
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.headers[section]
+        if role == Qt.ItemDataRole.FontRole:
+            return self.header_font
+        return None